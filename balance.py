@@ -0,0 +1,60 @@
+"""여러 프로세스에서 헤드리스 게임을 대량으로 실행하여 난이도 균형을 측정한다.
+
+난이도(패턴 폴더), 입력 방식, 규칙 상수의 모든 조합에 대해 시드마다 한 판씩 실행하고,
+점수 분포와 패턴별 피격, 자연사 통계를 JSON 파일로 저장한다.
+
+사용법: python balance.py [난이도 ...] [--games N] [--input idle random]
+                          [--set PENALTY=60,80 --set LIMITTIME=70] [--processes N] [--out PATH]
+"""
+import argparse
+import time
+
+from src.batch import make_jobs, patterndirs, run_batch, save, summarize, sweep_rules
+from src.inputs import inputsources
+from src.simulation import Rules
+
+
+def parse_override(text: str):
+    """'NAME=v1,v2' 형태의 문자열을 (Rules의 필드 이름, 값 list)로 변환한다."""
+    name, _, values = text.partition('=')
+    field = name.strip().lower()
+    if not field in Rules._fields or not values:
+        raise argparse.ArgumentTypeError(f"expected NAME=v1,v2 with NAME in "
+                                         f"{', '.join(f.upper() for f in Rules._fields)}")
+
+    cast = type(getattr(Rules(), field))
+    return field, [cast(v) for v in values.split(',')]
+
+
+argparser = argparse.ArgumentParser(description=__doc__,
+                                    formatter_class=argparse.RawDescriptionHelpFormatter)
+argparser.add_argument('diffs', nargs='*', help='난이도 (기본값: 모든 패턴 폴더)')
+argparser.add_argument('--games', type=int, default=100, help='조합마다 실행할 게임 수')
+argparser.add_argument('--seed', type=int, default=0, help='첫 게임의 시드')
+argparser.add_argument('--input', nargs='+', default=['random'], choices=sorted(inputsources))
+argparser.add_argument('--set', dest='overrides', action='append', default=[],
+                       type=parse_override, metavar='NAME=v1,v2')
+argparser.add_argument('--processes', type=int, default=None, help='프로세스 수 (기본값: CPU 수)')
+argparser.add_argument('--out', default='balance.json')
+args = argparser.parse_args()
+
+diffs = args.diffs or patterndirs()
+rulesets = sweep_rules(dict(args.overrides))
+jobs = make_jobs(diffs, range(args.seed, args.seed + args.games), args.input, rulesets)
+
+start = time.perf_counter()
+results = []
+for i, result in enumerate(run_batch(jobs, args.processes), 1):
+    results.append(result)
+    print(f"\r{i}/{len(jobs)} games", end='', flush=True)
+elapsed = time.perf_counter() - start
+print(f"\r{len(jobs)} games in {elapsed:.1f}s ({len(jobs) / elapsed:.1f} games/s)")
+
+for row in summarize(results):
+    changed = {k: v for k, v in row['rules'].items() if v != getattr(Rules(), k)}
+    score = row['score']
+    print(f"{row['diff']:>8} {row['input']:>6} {changed or ''} "
+          f"score mean {score['mean']:.0f} p10 {score['p10']:.0f} p50 {score['p50']:.0f} "
+          f"p90 {score['p90']:.0f}")
+
+save(args.out, results, {'elapsed': elapsed, 'processes': args.processes})
@@ -0,0 +1,136 @@
+"""충돌 판정 벤치마크.
+
+총알 수를 늘려가며 기존의 pg.sprite.groupcollide와 공간 해시의 1프레임 판정 시간을 비교하고,
+두 방식이 같은 충돌 결과를 내는지 확인한다.
+BulletPool 총알은 전체 검사, 정렬한 격자(PoolGrid), 점유 격자(OccupancyGrid)를 비교한다.
+플레이어 rect 하나를 판정하는 표에는 게임의 기본 방식인 HashCollider.collideany도 포함한다.
+
+사용법: python -m benchmarks.collision
+"""
+from __future__ import annotations
+from typing import Callable, Any, List
+import os
+import random
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pygame as pg
+
+from src import constant as ct
+from src.bulletpool import DanmakuGroup
+from src.collision import BruteCollider, HashCollider, PoolGrid
+from src.element import Element
+from src.image import BlockImage
+from src.mover import VelocityMover
+from src.occupancy import OccupancyGrid
+
+SIZES: List[int] = [100, 1000, 5000, 10000, 20000, 50000]
+PROBES: int = 200  # 플레이어 rect 대신 사용할 질의 rect의 개수
+
+
+def timeit(fun: Callable[[], Any], repeat: int = 5) -> float:
+    """fun의 최소 실행 시간(ms)을 반환한다."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fun()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    pg.init()
+    rng = random.Random(0)
+    nprng = np.random.default_rng(0)
+    image = BlockImage(3, 8, ct.RED)
+
+    probes = pg.sprite.Group()
+    for _ in range(PROBES):
+        probe = pg.sprite.Sprite()
+        probe.rect = pg.Rect(rng.randrange(ct.WIDTH), rng.randrange(ct.HEIGHT), 12, 12)
+        probes.add(probe)
+
+    print(f"{'bullets':>8}{'sprite brute':>14}{'sprite hash':>13}"
+          f"{'pool brute':>12}{'pool grid':>11}{'pool occ':>10}  same")
+    for n in SIZES:
+        pos = np.column_stack((nprng.uniform(0, ct.WIDTH, n),
+                               nprng.uniform(0, ct.HEIGHT, n)))
+        vel = np.zeros((n, 2))
+
+        sprites = pg.sprite.Group(*(Element(VelocityMover((x, y), (0, 0)), image)
+                                    for x, y in pos.tolist()))
+        danmaku = DanmakuGroup()
+        danmaku.pool.spawn(pos, vel, image)
+
+        brute, hashed = BruteCollider(), HashCollider()
+        t_sb = timeit(lambda: brute.groupcollide(probes, sprites, False, False))
+        t_sh = timeit(lambda: hashed.groupcollide(probes, sprites, False, False))
+
+        def pool_brute() -> List[int]:
+            return [int(danmaku.pool.collide_rect(p.rect).sum()) for p in probes]
+
+        def pool_grid() -> List[int]:
+            grid = PoolGrid(danmaku.pool)
+            return [len(grid.collide_rect(p.rect)) for p in probes]
+
+        def pool_occupancy() -> List[int]:
+            grid = OccupancyGrid()
+            grid.rebuild(danmaku.pool)
+            return [int(grid.collide_rect(p.rect).sum()) for p in probes]
+
+        t_pb = timeit(pool_brute)
+        t_pg = timeit(pool_grid)
+        t_po = timeit(pool_occupancy)
+
+        same = (brute.groupcollide(probes, sprites, False, False)
+                == hashed.groupcollide(probes, sprites, False, False)
+                and pool_brute() == pool_grid() == pool_occupancy())
+        print(f"{n:>8}{t_sb:>12.2f}ms{t_sh:>11.2f}ms{t_pb:>10.2f}ms{t_pg:>9.2f}ms"
+              f"{t_po:>8.2f}ms  {same}")
+
+    # 게임에서는 프레임마다 색인을 다시 만들고 플레이어 rect 하나만 질의함
+    players = [pg.Rect(rng.randrange(ct.WIDTH), rng.randrange(ct.HEIGHT), 4, 4)
+               for _ in range(PROBES)]
+    print(f"\n{'bullets':>8}{'frame brute':>13}{'frame grid':>12}{'frame occ':>11}"
+          f"{'frame hash':>12}  hit  (player rect per frame)")
+    for n in SIZES:
+        danmaku = DanmakuGroup()
+        pool = danmaku.pool
+        pool.spawn(np.column_stack((nprng.uniform(0, ct.WIDTH, n),
+                                    nprng.uniform(0, ct.HEIGHT, n))), np.zeros((n, 2)), image)
+
+        def frame_brute() -> List[bool]:
+            return [bool(pool.collide_rect(rect).any()) for rect in players]
+
+        def frame_grid() -> List[bool]:
+            return [bool(len(PoolGrid(pool).collide_rect(rect))) for rect in players]
+
+        def frame_occupancy() -> List[bool]:
+            grid = OccupancyGrid()
+            ret = []
+            for rect in players:
+                grid.rebuild(pool)
+                ret.append(grid.collideany(rect))
+            return ret
+
+        def frame_hash() -> List[bool]:  # 게임의 기본 충돌 판정
+            ret = []
+            for rect in players:
+                player = pg.sprite.Sprite()
+                player.rect = rect
+                ret.append(hashed.collideany(pg.sprite.Group(player), danmaku))
+            return ret
+
+        hashed = HashCollider()
+        hits = frame_brute()
+        assert hits == frame_grid() == frame_occupancy() == frame_hash()
+        print(f"{n:>8}{timeit(frame_brute) / PROBES:>11.3f}ms"
+              f"{timeit(frame_grid) / PROBES:>10.3f}ms{timeit(frame_occupancy) / PROBES:>9.3f}ms"
+              f"{timeit(frame_hash) / PROBES:>10.3f}ms"
+              f"  {sum(hits) / PROBES:.0%}")
+
+
+if __name__ == '__main__':
+    main()
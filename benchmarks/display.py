@@ -0,0 +1,87 @@
+"""화면 갱신 방식 벤치마크.
+
+같은 시드로 게임을 진행하며 매 프레임 화면 전체를 지우고 갱신하는 'full' 방식과
+바뀐 영역만 지우고 갱신하는 'dirty' 방식의 프레임당 CPU 시간을 비교한다.
+시뮬레이션 시간은 제외하고 그리기와 화면 갱신에 걸린 시간만 측정한다.
+
+SDL_VIDEODRIVER가 dummy일 경우 화면 갱신 비용이 측정되지 않으므로,
+실제 창에서 측정하려면 SDL_VIDEODRIVER를 지정하지 않고 실행한다.
+
+사용법: python -m benchmarks.display [난이도] [프레임 수]
+"""
+from __future__ import annotations
+from typing import Dict, List, Optional
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pygame as pg
+
+from src import constant as ct, write_text, write_text_rt
+from src.inputs import RandomInput
+from src.render import DirtyRects
+from src.simulation import Simulation
+
+
+def run(display: str, diff: str, frames: int) -> Dict[str, float]:
+    """display 방식으로 frames 프레임을 그리고, 프레임당 CPU 시간(ms)의 통계를 반환한다."""
+    displaysurf = pg.display.get_surface()
+    simulation = Simulation(diff, displaysurf.get_rect(), seed=0)
+    inputsource = RandomInput(seed=0)
+    dirty: Optional[DirtyRects] = DirtyRects(displaysurf.get_size()) if display == 'dirty' else None
+
+    times: List[float] = []
+    rectcounts: List[int] = []
+    for _ in range(frames):
+        if not simulation.step(inputsource(simulation)):
+            break
+
+        start = time.process_time()
+        if dirty is None:
+            displaysurf.fill(ct.BLACK)
+        else:
+            dirty.clear(displaysurf)
+        simulation.draw(displaysurf)
+        rects = [write_text(displaysurf, 60, (20, 20), f"{simulation.score}", ct.WHITE),
+                 write_text_rt(displaysurf, 60, (ct.WIDTH-20, 20), diff, ct.RED)]
+
+        if dirty is None:
+            pg.display.update()
+        else:
+            for group in simulation.groupdict.values():
+                dirty.add_group(group)
+            for rect in rects:
+                dirty.add(rect)
+            updated = dirty.flush()
+            rectcounts.append(len(updated))
+            pg.display.update(updated)
+        times.append(time.process_time() - start)
+
+    ret = {'mean': float(np.mean(times)) * 1000,
+           'p50': float(np.percentile(times, 50)) * 1000,
+           'p99': float(np.percentile(times, 99)) * 1000}
+    if rectcounts:
+        ret['rects'] = float(np.mean(rectcounts))
+    return ret
+
+
+def main() -> None:
+    diff = sys.argv[1] if len(sys.argv) > 1 else 'extra'
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 3000
+
+    pg.init()
+    pg.display.set_mode((ct.WIDTH, ct.HEIGHT), 0, 32)
+
+    print(f"{'mode':>6}{'mean':>10}{'p50':>10}{'p99':>10}{'rects':>8}")
+    for display in ('full', 'dirty'):
+        stats = run(display, diff, frames)
+        rects = f"{stats['rects']:>8.1f}" if 'rects' in stats else f"{'-':>8}"
+        print(f"{display:>6}{stats['mean']:>8.3f}ms{stats['p50']:>8.3f}ms"
+              f"{stats['p99']:>8.3f}ms{rects}")
+
+
+if __name__ == '__main__':
+    main()
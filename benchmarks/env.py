@@ -0,0 +1,70 @@
+"""gym 형태 환경과 기준 자동 플레이어 벤치마크.
+
+VectorEnv로 게임 수를 늘려가며 초당 진행한 (게임 수 × 프레임)을 무작위 행동과 DodgeBot 행동으로 측정하고,
+DodgeBot의 결정 시간이 BOTBUDGET 안에 드는지 확인한다.
+
+사용법: python -m benchmarks.env [--envs N ...] [--frames N] [--difficulty DIFF]
+"""
+from __future__ import annotations
+from typing import List
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+
+from src import constant as ct
+from src.bot import DodgeBot
+from src.env import ACTIONS, VectorEnv
+from src.headless import init_headless
+
+
+def run(n: int, frames: int, difficulty: str, bot: bool) -> float:
+    """n개의 게임을 frames 프레임 진행하고 초당 (게임 수 × 프레임)을 반환한다."""
+    env = VectorEnv(n)
+    observation = env.reset(list(range(n)), difficulty)
+    rng = random.Random(0)
+    bots = [DodgeBot() for _ in range(n)]
+    times: List[float] = []
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        if bot:
+            actions = []
+            for b, o in zip(bots, observation.split()):
+                t = time.perf_counter()
+                actions.append(b(o))
+                times.append(time.perf_counter() - t)
+        else:
+            actions = [rng.randrange(ACTIONS) for _ in range(n)]
+        observation, _, _, _ = env.step(actions)
+    elapsed = time.perf_counter() - start
+
+    if bot:
+        ms = np.array(times) * 1000
+        overruns = sum(b.overruns for b in bots)
+        print(f"    decision mean {ms.mean():.3f}ms p99 {np.percentile(ms, 99):.3f}ms "
+              f"max {ms.max():.3f}ms budget {ct.BOTBUDGET * 1000:.1f}ms overruns {overruns}")
+    return n * frames / elapsed
+
+
+def main() -> None:
+    argparser = argparse.ArgumentParser(description=__doc__,
+                                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('--envs', type=int, nargs='+', default=[1, 8, 32])
+    argparser.add_argument('--frames', type=int, default=1500)
+    argparser.add_argument('--difficulty', default='hard')
+    args = argparser.parse_args()
+
+    init_headless()
+    for n in args.envs:
+        print(f"{n} envs")
+        print(f"    random {run(n, args.frames, args.difficulty, False):8.0f} env-steps/s")
+        print(f"    dodge  {run(n, args.frames, args.difficulty, True):8.0f} env-steps/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""탄막 렌더링 벤치마크.
+
+총알 수를 늘려가며 스프라이트마다 blit하는 pg.sprite.Group.draw와
+BatchRenderer의 'blits', 'pixels' 모드의 1프레임 그리기 시간을 비교하고,
+세 방식이 같은 화면을 그리는지 확인한다.
+
+사용법: python -m benchmarks.render
+"""
+from __future__ import annotations
+from typing import Callable, Any, List
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pygame as pg
+
+from src import constant as ct
+from src.bulletpool import BulletPool
+from src.element import Element
+from src.image import BlockImage
+from src.mover import VelocityMover
+from src.render import BatchRenderer
+
+SIZES: List[int] = [100, 1000, 5000, 10000, 20000]
+
+
+def timeit(fun: Callable[[], Any], repeat: int = 5) -> float:
+    """fun의 최소 실행 시간(ms)을 반환한다."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fun()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    pg.init()
+    surface = pg.display.set_mode((ct.WIDTH, ct.HEIGHT), 0, 32)
+    image = BlockImage.shared(3, 8, ct.RED)
+    rng = np.random.default_rng(0)
+
+    print(f"{'bullets':>8}{'group draw':>12}{'blits':>10}{'pixels':>10}  same")
+    for n in SIZES:
+        pos = np.column_stack((rng.uniform(0, ct.WIDTH, n), rng.uniform(0, ct.HEIGHT, n)))
+
+        sprites = pg.sprite.Group(*(Element(VelocityMover((x, y), (0, 0)), image)
+                                    for x, y in pos.tolist()))
+        pool = BulletPool()
+        pool.spawn(pos, np.zeros((n, 2)), image)
+
+        frames: List[bytes] = []
+
+        def run(draw: Callable[[], Any]) -> float:
+            def frame() -> None:
+                surface.fill(ct.BLACK)
+                draw()
+
+            ret = timeit(frame)
+            frames.append(pg.image.tostring(surface, 'RGB'))
+            return ret
+
+        t_group = run(lambda: sprites.draw(surface))
+        t_blits = run(lambda: BatchRenderer('blits').draw(surface, pool))
+        t_pixels = run(lambda: BatchRenderer('pixels').draw(surface, pool))
+
+        same = frames[0] == frames[1] == frames[2]
+        print(f"{n:>8}{t_group:>10.2f}ms{t_blits:>8.2f}ms{t_pixels:>8.2f}ms  {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""게임 서버 처리량 벤치마크.
+
+초당 진행한 (게임 수 × tick)을 세 가지 방식으로 측정한다.
+소켓 없이 한 프로세스에서 Server.tick만 호출하는 경우, 한 서버 프로세스에 소켓으로 접속하는 경우,
+여러 서버 프로세스에 게임을 나누어 접속하는 경우이다. 소켓 측정은 서버가 쉬지 않고(rate 0) tick을 진행하며,
+클라이언트가 모든 게임의 STATE를 TICKS개씩 받을 때까지의 시간을 잰다.
+
+사용법: python -m benchmarks.server [--sessions N ...] [--ticks N] [--processes N]
+"""
+from __future__ import annotations
+from typing import List
+import argparse
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from src.headless import init_headless
+from src.server import Client, Server, run_shard, shard_paths
+
+DIFF: str = 'normal'
+
+
+def inprocess(sessions: int, ticks: int) -> float:
+    """소켓 없이 측정한 초당 (게임 수 × tick)을 반환한다."""
+    server = Server(rate=0)
+    for seed in range(sessions):
+        server.open_session(DIFF, seed, nearest=8)
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        server.tick()
+    return server.steps / (time.perf_counter() - start)
+
+
+async def _drive(paths: List[str], sessions: int, ticks: int) -> float:
+    clients = [await Client.connect(path) for path in paths[:sessions]]
+    for i in range(sessions):
+        await clients[i % len(clients)].open(DIFF, i, nearest=8)
+
+    async def consume(client: Client) -> None:
+        counts = {id: 0 for id in client.states}  # 서버마다 id가 겹칠 수 있으므로 client별로 셈
+        while min(counts.values()) < ticks:
+            _, id = await client.recv()
+            if id in counts:
+                counts[id] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(consume(client) for client in clients))
+    elapsed = time.perf_counter() - start
+
+    for client in clients:
+        await client.close()
+    return sessions * ticks / elapsed
+
+
+def overwire(sessions: int, ticks: int, processes: int) -> float:
+    """processes개의 서버 프로세스에 소켓으로 접속하여 측정한 초당 (게임 수 × tick)을 반환한다."""
+    directory = tempfile.mkdtemp()
+    paths = shard_paths(os.path.join(directory, 'bench.sock'), processes)
+    workers = [multiprocessing.Process(target=run_shard, args=(path, 0), daemon=True)
+               for path in paths]
+    for worker in workers:
+        worker.start()
+    try:
+        while not all(os.path.exists(path) for path in paths):
+            time.sleep(0.01)
+        return asyncio.run(_drive(paths, sessions, ticks))
+    finally:
+        for worker in workers:
+            worker.terminate()
+            worker.join()
+        for path in paths:
+            if os.path.exists(path):
+                os.unlink(path)
+        os.rmdir(directory)
+
+
+def main() -> None:
+    argparser = argparse.ArgumentParser(description=__doc__,
+                                        formatter_class=argparse.RawDescriptionHelpFormatter)
+    argparser.add_argument('--sessions', type=int, nargs='+', default=[1, 8, 32, 128])
+    argparser.add_argument('--ticks', type=int, default=300)
+    argparser.add_argument('--processes', type=int, default=os.cpu_count() or 1)
+    args = argparser.parse_args()
+
+    os.environ.setdefault('SDL_NO_SIGNAL_HANDLERS', '1')
+    init_headless()
+    print(f"{'sessions':>8} {'in-process':>12} {'1 process':>12} {f'{args.processes} processes':>14}"
+          f"   (sessions x ticks / s, {os.cpu_count()} CPU)")
+    for sessions in args.sessions:
+        print(f"{sessions:8d} {inprocess(sessions, args.ticks):12.0f} "
+              f"{overwire(sessions, args.ticks, 1):12.0f} "
+              f"{overwire(sessions, args.ticks, args.processes):14.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""Vector 연산 마이크로벤치마크.
+
+이전의 list 기반 Vector와 현재의 slot 기반 Vector, VectorArray의 연산당 시간을 비교한다.
+
+사용법: python -m benchmarks.vector
+"""
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterator
+import timeit
+
+import numpy as np
+
+from src.helpers.vector import Vector, VectorArray
+
+
+class ListVector:
+    """비교용으로 남겨둔 이전의 list 기반 Vector 구현이다."""
+    def __init__(self, *arg: float):
+        self.data = [*arg]
+        self.dimension = len(self.data)
+
+    def __iter__(self) -> Iterator[float]:
+        return self.data.__iter__()
+
+    def __add__(self, rhs: ListVector) -> ListVector:
+        return ListVector(*map(lambda t: t[0] + t[1], zip(self, rhs)))
+
+    def __iadd__(self, rhs: ListVector) -> ListVector:
+        return self.__add__(rhs)
+
+    def __sub__(self, rhs: ListVector) -> ListVector:
+        return ListVector(*map(lambda t: t[0] - t[1], zip(self, rhs)))
+
+    def __mul__(self, rhs: float) -> ListVector:
+        return ListVector(*map(lambda x: x*rhs, self))
+
+    def __truediv__(self, rhs: float) -> ListVector:
+        return ListVector(*map(lambda x: x/rhs, self))
+
+
+N: int = 1000  # VectorArray의 벡터 개수
+NUMBER: int = 100000
+
+
+def bench(stmt: Callable[[], Any], number: int = NUMBER) -> float:
+    """stmt의 1회 실행 시간(ns)을 반환한다."""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e9
+
+
+def main() -> None:
+    la, lb = ListVector(1.5, 2.5), ListVector(0.1, 0.2)
+    va, vb = Vector(1.5, 2.5), Vector(0.1, 0.2)
+    aa = VectorArray(np.random.rand(N, 2))
+    ab = VectorArray(np.random.rand(N, 2))
+
+    def l_iadd() -> None:
+        nonlocal la
+        la += lb
+
+    def v_iadd() -> None:
+        nonlocal va
+        va += vb
+
+    def a_iadd() -> None:
+        nonlocal aa
+        aa += ab
+
+    cases: Dict[str, Dict[str, Callable[[], Any]]] = {
+        'a + b': {'list': lambda: la + lb, 'slots': lambda: va + vb,
+                  'array': lambda: aa + ab},
+        'a - b': {'list': lambda: la - lb, 'slots': lambda: va - vb,
+                  'array': lambda: aa - ab},
+        'a * k': {'list': lambda: la * 1.01, 'slots': lambda: va * 1.01,
+                  'array': lambda: aa * 1.01},
+        'a / k': {'list': lambda: la / 1.01, 'slots': lambda: va / 1.01,
+                  'array': lambda: aa / 1.01},
+        'a += b': {'list': l_iadd, 'slots': v_iadd, 'array': a_iadd}}
+
+    print(f"{'op':<8}{'list (ns)':>12}{'slots (ns)':>12}{'speedup':>10}"
+          f"{'array/vec (ns)':>16}")
+    for name, impl in cases.items():
+        t_list = bench(impl['list'])
+        t_slots = bench(impl['slots'])
+        t_array = bench(impl['array'], NUMBER // 10) / N
+        print(f"{name:<8}{t_list:>12.1f}{t_slots:>12.1f}{t_list / t_slots:>9.1f}x"
+              f"{t_array:>16.2f}")
+
+
+if __name__ == '__main__':
+    main()
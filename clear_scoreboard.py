@@ -1,4 +1,20 @@
-import pickle
+"""스코어보드의 기록을 지운다.
 
-for fn in ["easy", "normal", "hard", "insane", "extra"]:
-    pickle.dump([], open(f"scores/{fn}.pkl", "wb"))
+난이도를 주지 않으면 모든 난이도의 기록을 지운다. 예전 .pkl 점수 파일은 이미 가져온 것으로 기록되어
+다시 가져오지 않는다.
+
+사용법: python clear_scoreboard.py [난이도 ...]
+"""
+import argparse
+
+from src.scoreboard import Scoreboard
+
+argparser = argparse.ArgumentParser(description=__doc__,
+                                    formatter_class=argparse.RawDescriptionHelpFormatter)
+argparser.add_argument('diffs', nargs='*', help='난이도 (기본값: 모든 난이도)')
+args = argparser.parse_args()
+
+with Scoreboard() as scoreboard:
+    for diff in args.diffs or [None]:
+        removed = scoreboard.clear(diff)
+        print(f"{diff or 'all'}: removed {removed} scores")
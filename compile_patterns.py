@@ -0,0 +1,60 @@
+"""패턴 파일을 Parser의 생성자 signature에 맞게 검사하고, 게임 시작 시 불러올 번들로 미리 컴파일한다.
+
+오류와 경고(Parser가 무시하는 key)를 파일 이름, JSON 경로와 함께 모두 출력하며,
+오류가 있거나 --strict에서 경고가 있으면 종료 코드 1로 끝난다.
+
+사용법: python compile_patterns.py [난이도 ...] [--check] [--force] [--strict]
+"""
+import argparse
+import json
+import sys
+
+from src import constant as ct
+from src.batch import patterndirs
+from src.pattern import Validator, bundlepath, compile_patterns, content_hash, load, read_bundle, \
+    sources
+
+argparser = argparse.ArgumentParser(description=__doc__,
+                                    formatter_class=argparse.RawDescriptionHelpFormatter)
+argparser.add_argument('diffs', nargs='*', help='난이도 (기본값: 모든 패턴 폴더)')
+argparser.add_argument('--check', action='store_true', help='검사만 하고 번들을 만들지 않음')
+argparser.add_argument('--force', action='store_true', help='바뀌지 않았어도 번들을 다시 만듦')
+argparser.add_argument('--strict', action='store_true', help='경고도 오류로 취급함')
+args = argparser.parse_args()
+
+validator = Validator()
+with open(f"{ct.PATTERNDIR}/player.json") as f:
+    errors = validator.validate(json.load(f), f"{ct.PATTERNDIR}/player.json")
+    for error in errors:
+        print(error)
+    for warning in validator.warnings:
+        print(f"warning: {warning}")
+    failed = bool(errors or args.strict and validator.warnings)
+
+for diff in args.diffs or patterndirs():
+    patterns, errors, warnings = compile_patterns(diff, validator)
+    for error in errors:
+        print(error)
+    for warning in warnings:
+        print(f"warning: {warning}")
+    if errors or args.strict and warnings:
+        failed = True
+        continue
+    if args.check:
+        print(f"{diff}: {len(patterns)} patterns ok")
+        continue
+
+    path = bundlepath(diff)
+    if args.force:
+        path.unlink(missing_ok=True)
+    load(diff)
+
+    bundle = read_bundle(path)
+    if bundle is None or bundle[0] != content_hash(sources(diff)):
+        print(f"{diff}: could not write {path}")
+        failed = True
+        continue
+    print(f"{diff}: {len(patterns)} patterns -> {path.relative_to(path.parents[1])} "
+          f"({path.stat().st_size} bytes, sha256 {bundle[0].hex()[:12]})")
+
+sys.exit(1 if failed else 0)
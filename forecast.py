@@ -0,0 +1,51 @@
+"""시드와 난이도마다 게임을 화면 없이 진행하여 프레임별 탄막 총알 수를 예측한다.
+
+시드마다 최대 총알 수와 그 프레임, 한 프레임에 많이 생성된 횟수, 패턴별 최대 총알 수를 출력하고,
+난이도마다 모든 시드에서 BulletPool이 크기를 바꾸지 않을 초기 용량을 제안한다.
+제안한 값은 src/constant.py의 POOLCAPACITIES에 반영하며, Simulation은 이를 기본 용량으로 사용한다.
+--out을 주면 프레임별 기록을 JSON 파일로 저장한다.
+
+사용법: python forecast.py [난이도 ...] [--seeds N] [--seed S] [--input idle random dodge]
+                           [--burst N] [--window N] [--out PATH]
+"""
+import argparse
+import json
+
+from src.batch import make_input, patterndirs
+from src.forecast import capacity_hint, forecast
+from src.headless import init_headless
+from src.inputs import inputsources
+
+argparser = argparse.ArgumentParser(description=__doc__,
+                                    formatter_class=argparse.RawDescriptionHelpFormatter)
+argparser.add_argument('diffs', nargs='*', help='난이도 (기본값: 모든 패턴 폴더)')
+argparser.add_argument('--seeds', type=int, default=5, help='예측할 시드 수')
+argparser.add_argument('--seed', type=int, default=0, help='첫 시드')
+argparser.add_argument('--input', nargs='+', default=['idle'], choices=sorted(inputsources))
+argparser.add_argument('--burst', type=int, default=100, help='한 프레임에 이만큼 생성되면 burst로 셈')
+argparser.add_argument('--window', type=int, default=600, help='시간대별 최댓값을 보여줄 프레임 간격')
+argparser.add_argument('--out', default=None, help='프레임별 기록을 저장할 JSON 파일')
+args = argparser.parse_args()
+
+init_headless()
+results = []
+for diff in args.diffs or patterndirs():
+    peak = 0
+    for name in args.input:
+        for seed in range(args.seed, args.seed + args.seeds):
+            result = forecast(diff, seed, make_input(name, seed))
+            results.append(dict(result.summary(), input=name))
+            peak = max(peak, result.peak)
+
+            timeline = ' '.join(str(int(result.high[i:i + args.window].max()))
+                                for i in range(0, result.frames, args.window))
+            top = sorted(result.patterns.items(), key=lambda item: -item[1])[:3]
+            print(f"{diff:>8} {name:>6} seed {seed:<4} peak {result.peak:5d} "
+                  f"@ frame {result.peakframe:<5d} bursts {len(result.bursts(args.burst)):4d}  "
+                  f"{', '.join(f'{k} {v}' for k, v in top)}")
+            print(f"{'':>20}per {args.window} frames: {timeline}")
+    print(f"{diff:>8} peak {peak} -> capacity {capacity_hint(peak)}")
+
+if args.out is not None:
+    with open(args.out, 'w') as f:
+        json.dump(results, f)
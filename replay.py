@@ -0,0 +1,23 @@
+"""입력 기록을 화면 없이 최대 속도로 재생하고, 기록된 점수와 같은지 확인한다.
+
+사용법: python replay.py replays/<난이도>.rpl
+"""
+import argparse
+import sys
+
+from src import constant as ct
+from src.headless import init_headless
+from src.replay import Replay, play
+
+argparser = argparse.ArgumentParser(description=__doc__)
+argparser.add_argument('path')
+argparser.add_argument('--collision', default=ct.COLLISION, choices=['brute', 'hash', 'grid'])
+args = argparser.parse_args()
+
+init_headless()
+
+result = play(Replay.load(args.path), args.collision)
+print(result.report.format())
+print(f"recorded score {result.replay.score}, replayed score {result.report.score}: "
+      f"{'OK' if result.ok else 'MISMATCH'}")
+sys.exit(0 if result.ok else 1)
@@ -0,0 +1,39 @@
+"""Unix 소켓으로 접속한 클라이언트들의 게임을 고정된 tick에 맞추어 진행하는 서버를 실행한다.
+
+--processes가 2 이상이면 프로세스마다 '<경로>.<번호>' 소켓을 열며, 클라이언트는 그중 하나에 접속한다.
+프로토콜은 src/server.py를 참고한다.
+
+사용법: python serve.py [--path PATH] [--rate TPS] [--processes N]
+"""
+import argparse
+import multiprocessing
+import signal
+
+from src import constant as ct
+from src.server import run_shard, shard_paths
+
+argparser = argparse.ArgumentParser(description=__doc__,
+                                    formatter_class=argparse.RawDescriptionHelpFormatter)
+argparser.add_argument('--path', default=ct.SOCKETPATH, help='Unix 소켓 경로')
+argparser.add_argument('--rate', type=float, default=ct.FPS, help='초당 tick 수 (0: 쉬지 않고 진행)')
+argparser.add_argument('--processes', type=int, default=1, help='서버 프로세스 수')
+args = argparser.parse_args()
+
+signal.signal(signal.SIGTERM, signal.default_int_handler)
+paths = shard_paths(args.path, args.processes)
+if len(paths) == 1:
+    print(f"serving on {paths[0]}")
+    run_shard(paths[0], args.rate)
+else:
+    workers = [multiprocessing.Process(target=run_shard, args=(path, args.rate), name=path)
+               for path in paths]
+    for worker in workers:
+        worker.start()
+    print(f"serving on {', '.join(paths)}")
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.terminate()  # run_shard는 SIGTERM을 받으면 소켓 파일을 지우고 종료함
+            worker.join()
@@ -0,0 +1,34 @@
+"""게임을 화면 없이, 프레임 제한 없이 시뮬레이션하고 성능을 출력한다.
+
+사용법: python simulate.py [난이도] [--input idle|random|dodge] [--seed N] [--frames N]
+                          [--collision brute|hash|grid] [--profile PATH]
+"""
+import argparse
+
+from src import constant as ct
+from src.headless import init_headless, run_headless
+from src.inputs import inputsources
+from src.profiler import FrameProfiler
+
+argparser = argparse.ArgumentParser(description=__doc__,
+                                    formatter_class=argparse.RawDescriptionHelpFormatter)
+argparser.add_argument('diff', nargs='?', default='normal',
+                       choices=['easy', 'normal', 'hard', 'insane', 'extra'])
+argparser.add_argument('--input', default='random', choices=sorted(inputsources))
+argparser.add_argument('--seed', type=int, default=0)
+argparser.add_argument('--frames', type=int, default=None)
+argparser.add_argument('--collision', default=ct.COLLISION, choices=['brute', 'hash', 'grid'])
+argparser.add_argument('--profile', metavar='PATH', default=None,
+                       help='구간별 시간을 저장할 파일 (.csv: 프레임별, .json: 요약)')
+args = argparser.parse_args()
+
+init_headless()
+
+inputsource = inputsources[args.input]() if args.input == 'idle' \
+    else inputsources[args.input](args.seed)
+profiler = FrameProfiler(enabled=args.profile is not None)
+report = run_headless(args.diff, inputsource, args.collision, args.frames, args.seed, profiler)
+print(report.format())
+
+if args.profile is not None:
+    profiler.dump(args.profile)
@@ -1,10 +1,10 @@
 import sys
+import time
 import json
 import random
 import copy
-import pickle
 from pathlib import Path
-from typing import Final, Tuple, Dict, List, Any
+from typing import Final, Tuple, Dict, List, Any, Optional
 
 import pygame as pg
 
@@ -14,74 +14,22 @@ from .mover import AccelerationMover, EventMover
 from .basedanmaku import RadialBaseDanmaku, BurstBaseDanmaku, PlaneBaseDanmaku
 from .image import BlockImage
 from .helpers.vector import Coordinate, parseVector, Vector
-from .parser import Parser  # 보조 함수들 불러오기
-
-
-def loadfiles(diff: str) -> Dict[str, Dict[str, Any]]:
-    """패턴 폴더에서 diff 난이도에 해당하는 패턴 파일을 불러온다."""
-    patterndir = Path.cwd() / ct.PATTERNDIR / diff
-
-    ret: Dict[str, Any] = dict()
-    for path in patterndir.iterdir():
-        with path.open() as f:
-            ret[path.stem] = json.loads(f.read())  # 파일 불러오기
-
-    return ret
-
-
-def loadsounds() -> Dict[str, pg.mixer.Sound]:
-    """오디오 파일 폴더에서 오디오 파일을 불러온다."""
-    audiodir: Path = Path.cwd() / ct.AUDIODIR
-
-    ret: Dict[str, pg.mixer.Sound] = dict()
-    for path in audiodir.iterdir():
-        ret[path.stem] = pg.mixer.Sound(path.open())  # 소리 불러오기
-
-    return ret
-
-
-def enemychoose(enemygroup: pg.sprite.Group, parser: Parser,
-                loadeddict: Dict[str, Dict[str, Any]]) -> None:
-    """새로운 적을 랜덤으로 생성한다.
-
-    Args:
-        enemygroup: 적이 추가될 스프라이트 그룹
-        parser: Parser 객체
-        loadeddict: loadfiles 함수에 의해 로드된 패턴 딕셔너리
-
-    """
-    def _add(*args: str) -> None:
-        for st in args:
-            enemygroup.add(parser.parse(loadeddict[st]))
-
-    rn: int = random.randrange(21)
-
-    if rn == 0:
-        _add('mix')
-    if 1 <= rn <= 3:
-        _add('burst')
-    if 4 <= rn <= 6:
-        _add('plane')
-    if 7 <= rn <= 9:
-        _add('radial')
-    if 10 <= rn <= 11:
-        _add('burst_follow')
-    if 12 <= rn <= 13:
-        _add('plane_follow')
-    if 14 <= rn <= 15:
-        _add('radial_follow')
-    if rn == 16:
-        _add('burst', 'radial')
-    if rn == 17:
-        _add('burst', 'plane')
-    if rn == 18:
-        _add('plane', 'radial')
-    if rn == 19:
-        _add('burst', 'plane', 'radial')  # 적 고르기
+from .parser import Parser, Factory
+from .text import textrenderer
+from .sound import SoundBank, loadsounds
+from .simulation import Simulation, loadfiles, compilefiles, enemychoose
+from .replay import InputRecorder
+from .profiler import FrameProfiler
+from .render import DirtyRects
+from .recycler import GCPolicy
+from .timestep import FixedTimestep
+from .quality import QualityController
+from .scoreboard import Scoreboard
+from .startup import StartupTimer, Preloader, require  # 보조 함수들 불러오기
 
 
 def write_text(screen: pg.surface.Surface, size: int, pos: Coordinate,
-               text: str, color: Tuple[int, int, int]) -> None:
+               text: str, color: Tuple[int, int, int]) -> pg.rect.Rect:
     """왼쪽 위를 위치의 기준으로 하여 텍스트를 쓴다.
 
     Args:
@@ -91,15 +39,15 @@ def write_text(screen: pg.surface.Surface, size: int, pos: Coordinate,
         text: 텍스트 내용
         color: 텍스트 색상
 
-    """
-    font = pg.font.SysFont(pg.font.get_default_font(), size)
+    Returns:
+        텍스트가 그려진 영역
 
-    textsurf = font.render(text, True, color)
-    screen.blit(textsurf, parseVector(pos).as_trimmed_tuple())
+    """
+    return textrenderer.blit(screen, size, parseVector(pos).as_trimmed_tuple(), text, color)
 
 
 def write_text_ct(screen: pg.surface.Surface, size: int, pos: Coordinate,
-                  text: str, color: Tuple[int, int, int]) -> None:
+                  text: str, color: Tuple[int, int, int]) -> pg.rect.Rect:
     """중앙을 위치의 기준으로 하여 텍스트를 쓴다.
 
     Args:
@@ -109,17 +57,16 @@ def write_text_ct(screen: pg.surface.Surface, size: int, pos: Coordinate,
         text: 텍스트 내용
         color: 텍스트 색상
 
-    """
-    font = pg.font.SysFont(pg.font.get_default_font(), size)
-
-    textsurf = font.render(text, True, color)
+    Returns:
+        텍스트가 그려진 영역
 
-    blit_pos = parseVector(pos) - Vector(*textsurf.get_size()) / 2
-    screen.blit(textsurf, blit_pos.as_trimmed_tuple())
+    """
+    blit_pos = parseVector(pos) - Vector(*textrenderer.size(size, text, color)) / 2
+    return textrenderer.blit(screen, size, blit_pos.as_trimmed_tuple(), text, color)
 
 
 def write_text_rt(screen: pg.surface.Surface, size: int, pos: Coordinate,
-                  text: str, color: Tuple[int, int, int]) -> None:
+                  text: str, color: Tuple[int, int, int]) -> pg.rect.Rect:
     """오른쪽 위를 위치의 기준으로 하여 텍스트를 쓴다.
 
     Args:
@@ -129,37 +76,46 @@ def write_text_rt(screen: pg.surface.Surface, size: int, pos: Coordinate,
         text: 텍스트 내용
         color: 텍스트 색상
 
+    Returns:
+        텍스트가 그려진 영역
+
     """
-    font = pg.font.SysFont(pg.font.get_default_font(), size)
+    blit_pos = parseVector(pos) - Vector(textrenderer.size(size, text, color)[0], 0)
+    return textrenderer.blit(screen, size, blit_pos.as_trimmed_tuple(), text, color)
 
-    textsurf = font.render(text, True, color)
 
-    blit_pos = parseVector(pos) - Vector(textsurf.get_width(), 0)
-    screen.blit(textsurf, blit_pos.as_trimmed_tuple())
+def init(startup: Optional[StartupTimer] = None) -> Tuple[pg.surface.Surface, pg.time.Clock]:
+    """게임을 초기화한다.
 
+    화면과 글꼴만 초기화하며, mixer는 소리를 불러올 때 초기화된다.
 
-def init() -> Tuple[pg.surface.Surface, pg.time.Clock]:
-    """게임을 초기화한다.
+    Args:
+        startup: 단계별 시간을 기록할 StartupTimer or None
 
     Returns:
         초기화된 최상위 Surface와 Clock 객체
 
     """
-    pg.init()  # 초기화
+    startup = startup or StartupTimer()
+    with startup.phase('init.subsystems'):
+        require('display', 'font')  # 필요한 subsystem만 초기화
 
-    pg.display.set_caption('막장 피하기&슈팅')  # 제목
-    displaysurf = pg.display.set_mode((ct.WIDTH, ct.HEIGHT), 0, 32)  # 게임 크기 설정
+    with startup.phase('init.display'):
+        pg.display.set_caption('막장 피하기&슈팅')  # 제목
+        displaysurf = pg.display.set_mode((ct.WIDTH, ct.HEIGHT), 0, 32)  # 게임 크기 설정
     clock = pg.time.Clock()  # 시간 설정
 
     return displaysurf, clock
 
 
-def prompt_difficulty(displaysurf: pg.surface.Surface, clock: pg.time.Clock) -> Tuple[str, Tuple[int, int, int]]:
+def prompt_difficulty(displaysurf: pg.surface.Surface, clock: pg.time.Clock,
+                      startup: Optional[StartupTimer] = None) -> Tuple[str, Tuple[int, int, int]]:
     """난이도 선택 화면을 구현한다.
 
     Args:
         displaysurf: init 함수에 의해 반환된 최상위 Surface
         clock: init 함수에 의해 반환된 Clock
+        startup: 화면이 처음 표시된 시각과 선택까지의 시간을 기록할 StartupTimer or None
 
     Returns:
         난이도, 난이도에 해당하는 색상을 tuple로 반환한다.    
@@ -188,106 +144,163 @@ def prompt_difficulty(displaysurf: pg.surface.Surface, clock: pg.time.Clock) ->
     write_text_ct(displaysurf, 40, (ct.WIDTH / 2, ct.HEIGHT * 0.85),
                   'q: quit', ct.WHITE)
 
+    pg.display.update()
+    shown = time.perf_counter()
+    if startup is not None:
+        startup.record('menu.first frame', shown, shown)  # 처음으로 입력을 받을 수 있는 화면
+
     while True:
-        for event in pg.event.get():
-            if event.type == pg.QUIT\
-               or (event.type == pg.KEYDOWN and event.key == ord('q')):  # 종료
-                pg.quit()
-                sys.exit()
+        event = pg.event.wait()  # 화면이 바뀌지 않으므로 이벤트가 올 때까지 대기
+        if event.type == pg.QUIT\
+           or (event.type == pg.KEYDOWN and event.key == ord('q')):  # 종료
+            pg.quit()
+            sys.exit()
 
-            if event.type == pg.KEYDOWN and event.key in allow:
-                return allow[event.key]
+        if event.type == pg.KEYDOWN and event.key in allow:
+            if startup is not None:
+                startup.record('menu.wait', shown, time.perf_counter())
+            return allow[event.key]
 
-        pg.display.update()
-        clock.tick(ct.FPS)
+        if event.type == pg.VIDEOEXPOSE:  # 창이 다시 보일 때
+            pg.display.update()
 
 
 def game(displaysurf: pg.surface.Surface, clock: pg.time.Clock,
-         diff: str, diff_color: Tuple[int, int, int]) -> int:
+         diff: str, diff_color: Tuple[int, int, int],
+         collision: str = ct.COLLISION, profile: bool = ct.PROFILE,
+         display: str = ct.DISPLAYMODE, gcmode: str = ct.GCMODE,
+         preloader: Optional[Preloader] = None, startup: Optional[StartupTimer] = None,
+         adaptive: bool = ct.QUALITY) -> int:
     """게임의 메인 로직을 실행한다.
 
+    시뮬레이션은 FixedTimestep에 따라 렌더링 속도와 관계없이 초당 FPS 틱으로 진행되며,
+    화면은 RENDERFPS로 제한된 속도로 틱 사이를 보간하여 그린다.
+    프레임이 예산을 넘으면 QualityController가 HUD, 그리기, 효과음, 렌더링 빈도를 단계적으로 줄인다.
+    줄이는 것은 화면과 소리뿐이며, 틱은 항상 같은 입력으로 진행되어 점수와 리플레이는 바뀌지 않는다.
+
     Args:
         displaysurf: init 함수에 의해 반환된 최상위 Surface
         clock: init 함수에 의해 반환된 Clock
         diff: prompt_difficulty 함수에 의해 반환된 난이도
         diff_color: prompt_difficulty 함수에 의해 반환된 난이도에 해당하는 색상
+        collision: 충돌 판정 방식 ('brute', 'hash')
+        profile: True일 경우 구간별 시간을 화면에 표시하고, 게임이 끝나면 파일로 저장한다.
+        display: 화면 갱신 방식. 'full'은 매 프레임 화면 전체를, 'dirty'는 바뀐 영역만 갱신한다.
+        gcmode: 게임 중 gc 제어 방식 ('default', 'freeze', 'disable')
+        preloader: 소리와 패턴을 미리 불러오고 있는 Preloader or None(여기서 불러옴)
+        startup: 단계별 시간을 기록할 StartupTimer or None. 주어지면 첫 프레임 후 기록을 저장한다.
+        adaptive: True일 경우 프레임 시간에 따라 렌더링 품질을 자동으로 낮춘다.
 
     Returns:
         게임 결과(점수)
 
     """
 
-    screenrect = displaysurf.get_rect()  # 게임 영역 설정
-
-    groupdict: Dict[str, pg.sprite.Group] = dict()  # 그룹 불러오기
-    groupdict = {'bullet': pg.sprite.Group(),
-                 'player': pg.sprite.Group(),
-                 'enemy': pg.sprite.Group(),
-                 'danmaku': pg.sprite.Group()}
-
-    spritedict: Dict[str, Element] = dict()
-
-    parser = Parser(screenrect, groupdict, spritedict)  # 패턴 구문분석
-
-    spritedict['player'] = parser.load('assets/player.json')
-    groupdict['player'].add(spritedict['player'])  # 플레이어 추가
-
-    loadeddict = loadfiles(diff)  # 패턴 파일 로드
-    sounddict = loadsounds()
-
-    _frame: int = 0
-    frame: int = 0
-    score: int = ct.INITIALSCORE
-    limittime: float = ct.LIMITTIME
-    onon: int = 0  # 변수 결정
-
-    pg.mixer.Sound.play(sounddict['bgm'])
+    profiler = FrameProfiler(enabled=profile)
+    timer = startup or StartupTimer()
+    with timer.phase('load.sounds'):
+        soundbank = SoundBank.load() if preloader is None else preloader.soundbank()
+    with timer.phase('load.simulation'):
+        simulation = Simulation(diff, displaysurf.get_rect(),
+                                collision=collision, soundbank=soundbank,
+                                seed=random.randrange(2**32), profiler=profiler)
+    recorder = InputRecorder(simulation)  # 입력 기록
+    dirty = DirtyRects(displaysurf.get_size()) if display == 'dirty' else None
+
+    gcpolicy = GCPolicy(gcmode)
+    timestep = FixedTimestep()
+    quality = QualityController(enabled=adaptive)
+    soundwindow = soundbank.window
+    fulldisplay = dirty is None  # 직전에 그린 프레임이 화면 전체를 갱신했는지 여부
+    hudscore = simulation.score  # HUD에 표시 중인 점수
+    frame = 0
+    simulation.interpolate = True
+    pending: List[pg.event.Event] = []  # 아직 틱에 전달되지 않은 이벤트
+    running = True
+
+    soundbank.play_music('bgm')
+    gcpolicy.start()
 
     while True:  # 게임 구동기
-        _frame += 1  # 시간 증가
-        frame += 1
-
-        if frame == limittime // 1 and onon == 0:  # 게임 중 적 생성 시간일 때
-            enemychoose(groupdict['enemy'], parser, loadeddict)  # 적 생성
-            frame = 0  # 적 생성 시간 초기화
-            if limittime > ct.OVERLIMIT:
-                limittime -= ct.LIMITREDUCE  # 적 생성 주기 단축
-            else:
-                onon = 1  # 게임 종료 시간
-
-        if onon == 1:  # 게임 끝
-            if frame == ct.OVERTIME:
-                return score
-
-        for event in pg.event.get():
-            groupdict['player'].update(event=event)  # 객체 위치 이동
+        started = time.perf_counter()
+        profiler.begin_frame()
+        with profiler.phase('poll'):
+            events = pg.event.get()
+        for event in events:
             if event.type == pg.QUIT:  # 종료 버튼
                 pg.quit()
                 sys.exit()
 
-        displaysurf.fill(ct.BLACK)  # 배경 색
-        if pg.sprite.groupcollide(groupdict['player'], groupdict['danmaku'], False, False):
-            score -= 1  # 부딫혔을 때 충돌 카운트 +1
-            pg.mixer.Sound.play(sounddict['gothit'])
-
-        # 쏜 총이 적 맞았을 때 적 kill
-        pg.sprite.groupcollide(groupdict['bullet'], groupdict['enemy'],
-                               False, True)
-
-        enemyn = len(groupdict['enemy'])
-        for key in groupdict:
-            groupdict[key].update()  # 모든 객체 위치 업데이트
-            groupdict[key].draw(displaysurf)
-        # 적이 자연적으로 죽을 경우 페널티
-        score -= ct.PENALTY * (enemyn - len(groupdict['enemy']))
+        tier = quality.tier
+        soundbank.window = soundwindow * tier.soundscale  # 효과음 재생 횟수 줄이기
+        pending += events
+        for _ in range(timestep.advance()):  # 밀린 틱 진행
+            recorder.record(pending)
+            running = simulation.step(pending)
+            pending = []
+            if not running:
+                break
+
+        if not running:  # 게임 끝
+            gcpolicy.stop()
+            replaydir = Path.cwd() / ct.REPLAYDIR
+            replaydir.mkdir(exist_ok=True)
+            recorder.replay().save(replaydir / f"{diff}.rpl")
+
+            if profile:
+                profiledir = Path.cwd() / ct.PROFILEDIR
+                profiler.dump(profiledir / f"{diff}.csv")
+                profiler.dump(profiledir / f"{diff}.json",
+                              {'text': textrenderer.stats(), 'sound': soundbank.stats(),
+                               **simulation.stats(), 'quality': quality.stats(),
+                               'timestep': {'ticks': timestep.ticks, 'dropped': timestep.dropped}})
+            return simulation.score
 
-        write_text(displaysurf, 60, (20, 20),
-                   f"{score}", ct.WHITE)
-        write_text_rt(displaysurf, 60, (ct.WIDTH-20, 20),
-                      diff, diff_color)
-
-        pg.display.update()
-        clock.tick(ct.FPS)  # 시간 업데이트
+        frame += 1
+        if frame % tier.renderevery == 0:  # 건너뛴 프레임은 이전 화면을 그대로 둠
+            if dirty is not None and fulldisplay and not tier.fulldisplay:
+                dirty.reset()  # 화면 전체 갱신에서 돌아옴
+            fulldisplay = dirty is None or tier.fulldisplay
+            target = None if fulldisplay else dirty
+
+            with profiler.phase('draw'):
+                if target is None:
+                    displaysurf.fill(ct.BLACK)  # 배경 색
+                else:
+                    target.clear(displaysurf)
+                alpha = timestep.alpha if tier.interpolate else 1.0
+                simulation.draw(displaysurf, alpha)
+
+            with profiler.phase('text'):
+                if frame % tier.hudevery == 0:  # 그 사이에는 캐시된 점수 텍스트를 그림
+                    hudscore = simulation.score
+                rects = [write_text(displaysurf, 60, (20, 20),
+                                    f"{hudscore}", ct.WHITE),
+                         write_text_rt(displaysurf, 60, (ct.WIDTH-20, 20),
+                                       diff, diff_color),
+                         profiler.overlay(displaysurf)]
+                if quality.level:  # 현재 품질 단계 표시
+                    rects.append(write_text(displaysurf, 20, (20, 80),
+                                            f"quality: {tier.name}", ct.GRAY))
+
+            with profiler.phase('display'):
+                if target is None:
+                    pg.display.update()
+                else:
+                    for group in simulation.groupdict.values():
+                        target.add_group(group, alpha)
+                    for rect in rects:
+                        target.add(rect)
+                    pg.display.update(target.flush())  # 바뀐 영역만 갱신
+        profiler.end_frame(simulation.groupdict)
+        quality.record(time.perf_counter() - started)  # 렌더링 속도 제한으로 기다린 시간은 제외
+
+        if startup is not None:  # 첫 프레임
+            startup.mark('game.first frame')
+            startup.dump(Path.cwd() / ct.PROFILEDIR / ct.STARTUPLOG)
+            startup = None
+
+        clock.tick(ct.RENDERFPS)  # 렌더링 속도 제한
 
 
 def result(displaysurf: pg.surface.Surface, clock: pg.time.Clock,
@@ -302,21 +315,11 @@ def result(displaysurf: pg.surface.Surface, clock: pg.time.Clock,
         score: game 함수에 의해 반환된 점수
 
     """
-    scorefile: Path = Path.cwd() / ct.SCOREDIR / f"{diff}.pkl"
-
-    scores: List[int] = []
-
-    try:
-        scores = pickle.load(scorefile.open("rb"))
-    except FileNotFoundError:
-        pass
-
-    scores.append(score)
-    scores.sort()
-    scores.reverse()
-    scores = scores[:5]
-
-    pickle.dump(scores, scorefile.open("wb"))
+    with Scoreboard() as scoreboard:
+        scoreboard.add(diff, score)  # 다른 프로세스와 동시에 기록해도 안전
+        scores: List[int] = scoreboard.top(diff, 5)
+        rank = scoreboard.rank(diff, score)
+        played = scoreboard.stats(diff).games
 
     displaysurf.fill(ct.BLACK)
     write_text_ct(displaysurf, 60, (ct.WIDTH / 2, ct.HEIGHT * 0.15),
@@ -328,13 +331,16 @@ def result(displaysurf: pg.surface.Surface, clock: pg.time.Clock,
 
     write_text_ct(displaysurf, 40, (ct.WIDTH / 2, ct.HEIGHT * 0.85),
                   f'Your score: {score}', ct.WHITE)
+    write_text_ct(displaysurf, 30, (ct.WIDTH / 2, ct.HEIGHT * 0.92),
+                  f'Rank {rank} / {played}', ct.GRAY)
 
+    pg.display.update()
     while True:
-        for event in pg.event.get():
-            if event.type == pg.QUIT\
-               or (event.type == pg.KEYDOWN and event.key == ord('q')):  # 종료
-                pg.quit()
-                sys.exit()
-
-        pg.display.update()
-        clock.tick(ct.FPS)
+        event = pg.event.wait()  # 화면이 바뀌지 않으므로 이벤트가 올 때까지 대기
+        if event.type == pg.QUIT\
+           or (event.type == pg.KEYDOWN and event.key == ord('q')):  # 종료
+            pg.quit()
+            sys.exit()
+
+        if event.type == pg.VIDEOEXPOSE:  # 창이 다시 보일 때
+            pg.display.update()
@@ -1,37 +1,122 @@
 from __future__ import annotations
-from typing import Optional, Generator
+from typing import Optional, Generator, Tuple
 import abc
 
+import numpy as np
 import pygame as pg
 
 from . import constant as ct
-from .helpers import get_uniform_dispersion
-from .helpers.vector import Coordinate, Vector, parseVector, getHat
+from .helpers.vector import Coordinate, parseVector
 from .mover import VelocityMover, TrackingMover
 from .element import Element
+from .bulletpool import DanmakuGroup
+from .recycler import ElementPool, PooledGroup
 
 
 ElementGenerator = Generator[Element, None, None]
+ComposedArrays = Tuple[np.ndarray, np.ndarray]
+StageGenerator = Generator[ComposedArrays, None, None]
 
 
 class BaseDanmaku(pg.sprite.Group):
-    """스프라이트 그룹을 상속한, 기본적인 탄막을 구현하는 추상 클래스이다."""
+    """스프라이트 그룹을 상속한, 기본적인 탄막을 구현하는 추상 클래스이다.
+
+    총알의 초기 위치와 속도는 생성 시에 배열로 계산되며,
+    총알 스프라이트는 emit이 일반 스프라이트 그룹을 대상으로 할 때만 만들어진다.
+
+    stages나 perframe이 주어지면 DanmakuGroup에 emit할 때 총알을 여러 묶음으로 나누어
+    한 프레임에 한 묶음씩 생성한다. 다른 그룹에는 항상 한꺼번에 추가된다.
+
+    Attributes:
+        positions: 총알의 초기 위치 (N, 2)
+        velocities: 총알의 초기 속도 (N, 2)
+        stages: 총알을 나누어 생성할 프레임 수
+        perframe: 한 프레임에 생성할 최대 총알 수. 0일 경우 제한 없음
+
+    """
     @abc.abstractmethod
     def __init__(self, pos: Coordinate, vel: float, N: int,
                  image: pg.surface.Surface,
-                 track: Optional[Element] = None):
+                 track: Optional[Element] = None, stages: int = 1, perframe: int = 0):
         super().__init__()
 
+        if stages < 1 or perframe < 0:
+            raise ValueError
+
         self.pos = parseVector(pos)
         self.vel = vel
         self.N = N
         self.image = image
         self.toTrack = track
+        self.stages = stages
+        self.perframe = perframe
+
+        self.positions, self.velocities = self._compose()
+
+    @abc.abstractmethod
+    def _compose(self) -> ComposedArrays:
+        """총알의 초기 위치와 속도를 배열로 계산한다."""
+
+    @property
+    def nstages(self) -> int:
+        """총알을 나누어 생성할 묶음 수"""
+        ret = self.stages
+        if self.perframe:
+            ret = max(ret, -(-self.N // self.perframe))
+        return max(min(ret, self.N), 1)
+
+    def staged(self) -> StageGenerator:
+        """총알의 초기 위치와 속도를 nstages개의 묶음으로 나누어 차례로 반환한다."""
+        stages = self.nstages
+        yield from zip(np.array_split(self.positions, stages),
+                       np.array_split(self.velocities, stages))
+
+    def _compose_element(self, recycler: Optional[ElementPool] = None) -> ElementGenerator:
+        """총알 스프라이트를 생성한다. recycler가 주어지면 보관된 객체를 다시 사용한다."""
+        for pos, vel in zip(self.positions.tolist(), self.velocities.tolist()):
+            if self.toTrack is None:
+                if recycler is None:
+                    yield Element(VelocityMover((pos[0], pos[1]), (vel[0], vel[1])),
+                                  self.image)
+                else:
+                    yield recycler.acquire(VelocityMover, self.image,
+                                           (pos[0], pos[1]), (vel[0], vel[1]))
+            else:
+                if recycler is None:
+                    yield Element(TrackingMover((pos[0], pos[1]), (vel[0], vel[1]), self.toTrack.mover),
+                                  self.image)
+                else:
+                    yield recycler.acquire(TrackingMover, self.image, (pos[0], pos[1]),
+                                           (vel[0], vel[1]), self.toTrack.mover)
+
+    def emit(self, group: pg.sprite.Group, tag: Optional[str] = None) -> None:
+        """탄막의 총알을 group에 추가한다.
 
-        self.add(*self._compose_element())
+        group이 DanmakuGroup일 경우 스프라이트를 만들지 않고 group의 scheduler를 통해 pool에 추가하며,
+        PooledGroup일 경우 group의 recycler에서 받은 스프라이트를 이 탄막에 포함하지 않고 바로 추가한다.
 
-    def _compose_element(self) -> ElementGenerator:
-        pass
+        Args:
+            group: 총알이 추가될 스프라이트 그룹
+            tag: 총알을 쏜 패턴 이름 or None. DanmakuGroup에서만 기록된다.
+
+        """
+        if isinstance(group, DanmakuGroup):
+            track = None if self.toTrack is None else self.toTrack.mover
+            group.scheduler.submit(group.pool, self, track, tag)
+            return
+
+        if isinstance(group, PooledGroup):
+            group.add(*self._compose_element(group.recycler))
+            return
+
+        if not self:
+            self.add(*self._compose_element())
+        group.add(*self)
+
+
+def _hats(theta: np.ndarray) -> np.ndarray:
+    """편각 배열 theta에 대한 단위벡터 배열 (N, 2)를 반환한다."""
+    return np.stack((np.cos(theta), np.sin(theta)), axis=1)
 
 
 class RadialBaseDanmaku(BaseDanmaku):
@@ -44,27 +129,23 @@ class RadialBaseDanmaku(BaseDanmaku):
         offset: 탄막이 정위치에서 회전한 정도. 일반적으로 [0, 1)의 값을 가짐.
         image: 총알을 렌더링할 이미지
         track: 유도할 대상 or None
+        stages: 총알을 나누어 생성할 프레임 수
+        perframe: 한 프레임에 생성할 최대 총알 수. 0일 경우 제한 없음
 
     """
     def __init__(self, pos: Coordinate, vel: float, N: int, offset: float,
                  image: pg.surface.Surface,
-                 track: Optional[Element] = None):
+                 track: Optional[Element] = None, stages: int = 1, perframe: int = 0):
         self.offset = offset
 
-        super().__init__(pos, vel, N, image, track=track)
+        super().__init__(pos, vel, N, image, track=track, stages=stages, perframe=perframe)
 
-    def _compose_element(self) -> ElementGenerator:
+    def _compose(self) -> ComposedArrays:
         theta = 2 * ct.PI / self.N
 
-        for i in range(self.N):
-            hatVector = getHat(theta * (i + self.offset))
-
-            if self.toTrack is None:
-                yield Element(VelocityMover(self.pos, hatVector * self.vel),
-                              self.image)
-            else:
-                yield Element(TrackingMover(self.pos, hatVector * self.vel, self.toTrack.mover),
-                              self.image)
+        velocities = _hats(theta * (np.arange(self.N) + self.offset)) * self.vel
+        positions = np.tile(self.pos.as_tuple(), (self.N, 1))
+        return positions, velocities
 
 
 class BurstBaseDanmaku(BaseDanmaku):
@@ -80,28 +161,26 @@ class BurstBaseDanmaku(BaseDanmaku):
         image: 총알을 렌더링할 이미지
         track: 유도할 대상 or None
         direction: 탄막의 방향
+        stages: 총알을 나누어 생성할 프레임 수
+        perframe: 한 프레임에 생성할 최대 총알 수. 0일 경우 제한 없음
 
     """
     def __init__(self, pos: Coordinate, vel: float, baseN: int, N: int,
                  image: pg.surface.Surface,
-                 track: Optional[Element] = None, direction: float = ct.PI / 2):
+                 track: Optional[Element] = None, direction: float = ct.PI / 2,
+                 stages: int = 1, perframe: int = 0):
         self.baseN = baseN
         self.direction = direction
 
-        super().__init__(pos, vel, N, image, track=track)
+        super().__init__(pos, vel, N, image, track=track, stages=stages, perframe=perframe)
 
-    def _compose_element(self) -> ElementGenerator:
-        gen = get_uniform_dispersion(self.direction,
-                                     2 * ct.PI / self.baseN, self.N)
-        for theta in gen:
-            hatVector = getHat(theta)
+    def _compose(self) -> ComposedArrays:
+        sep = 2 * ct.PI / self.baseN
+        theta = self.direction - sep * (self.N - 1) / 2 + sep * np.arange(self.N)
 
-            if self.toTrack is None:
-                yield Element(VelocityMover(self.pos, hatVector * self.vel),
-                              self.image)
-            else:
-                yield Element(TrackingMover(self.pos, hatVector * self.vel, self.toTrack.mover),
-                              self.image)
+        velocities = _hats(theta) * self.vel
+        positions = np.tile(self.pos.as_tuple(), (self.N, 1))
+        return positions, velocities
 
 
 class PlaneBaseDanmaku(BaseDanmaku):
@@ -115,30 +194,28 @@ class PlaneBaseDanmaku(BaseDanmaku):
         image: 총알을 렌더링할 이미지
         track: 유도할 대상 or None
         direction: 탄막의 방향
+        stages: 총알을 나누어 생성할 프레임 수
+        perframe: 한 프레임에 생성할 최대 총알 수. 0일 경우 제한 없음
 
     """
     def __init__(self, pos: Coordinate, vel: float, N: int, sep: float,
                  image: pg.surface.Surface,
-                 track: Optional[Element] = None, direction: float = ct.PI / 2):
+                 track: Optional[Element] = None, direction: float = ct.PI / 2,
+                 stages: int = 1, perframe: int = 0):
         self.sep = sep
         self.direction = direction
 
-        super().__init__(pos, vel, N, image, track=track)
+        super().__init__(pos, vel, N, image, track=track, stages=stages, perframe=perframe)
 
-    def _compose_element(self) -> ElementGenerator:
-        velocityHat: Vector
+    def _compose(self) -> ComposedArrays:
         if self.toTrack is None:
-            velocityHat = getHat(self.direction)
+            velocityHat = np.array([np.cos(self.direction), np.sin(self.direction)])
         else:
-            velocityHat = (self.toTrack.mover.pos - self.pos).normalize()
+            velocityHat = np.array((self.toTrack.mover.pos - self.pos).normalize().as_tuple())
 
-        seperateHat = velocityHat.rotate(ct.PI / 2)
+        seperateHat = np.array([-velocityHat[1], velocityHat[0]])  # pi/2 회전
 
-        gen = get_uniform_dispersion(0, self.sep, self.N)
-        for dist in gen:
-            if self.toTrack is None:
-                yield Element(VelocityMover(self.pos + seperateHat * dist, velocityHat * self.vel),
-                              self.image)
-            else:
-                yield Element(TrackingMover(self.pos + seperateHat * dist, velocityHat * self.vel, self.toTrack.mover),
-                              self.image)
+        dist = self.sep * (np.arange(self.N) - (self.N - 1) / 2)
+        positions = np.array(self.pos.as_tuple()) + np.outer(dist, seperateHat)
+        velocities = np.tile(velocityHat * self.vel, (self.N, 1))
+        return positions, velocities
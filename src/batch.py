@@ -0,0 +1,190 @@
+from __future__ import annotations
+from itertools import product
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+import json
+import os
+import time
+
+import numpy as np
+
+from . import constant as ct
+from .headless import init_headless
+from .inputs import InputSource, inputsources
+from .simulation import Rules, Simulation
+
+
+class Job(NamedTuple):
+    """헤드리스 게임 한 판의 설정이다.
+
+    Attributes:
+        diff: 난이도(패턴 폴더 이름)
+        seed: Simulation과 입력의 시드
+        input: inputsources의 key
+        rules: 점수와 적 생성 주기에 관한 규칙
+
+    """
+    diff: str
+    seed: int
+    input: str = 'random'
+    rules: Rules = Rules()
+
+
+class GameResult(NamedTuple):
+    """헤드리스 게임 한 판의 결과이다.
+
+    Attributes:
+        job: 실행한 설정
+        score: 최종 점수
+        frames: 진행한 프레임 수
+        damage: 플레이어가 맞은 프레임 수의 패턴별 dict
+        escapes: 자연적으로 죽은 적 수의 패턴별 dict
+        elapsed: 실행에 걸린 시간(초)
+
+    """
+    job: Job
+    score: int
+    frames: int
+    damage: Dict[str, int]
+    escapes: Dict[str, int]
+    elapsed: float
+
+
+def make_input(name: str, seed: int) -> InputSource:
+    """이름이 name인 InputSource를 seed로 생성한다."""
+    if not name in inputsources:
+        raise ValueError
+    if name == 'idle':
+        return inputsources[name]()
+    return inputsources[name](seed)
+
+
+def run_job(job: Job) -> GameResult:
+    """job을 실행한다. init_headless 등으로 pygame이 초기화되어 있어야 한다."""
+    start = time.perf_counter()
+    simulation = Simulation(job.diff, seed=job.seed, rules=job.rules)
+    inputsource = make_input(job.input, job.seed)
+    while simulation.step(inputsource(simulation)):
+        pass
+
+    return GameResult(job, simulation.score, simulation.totalframe,
+                      dict(simulation.damage), dict(simulation.escapes),
+                      time.perf_counter() - start)
+
+
+def make_jobs(diffs: Sequence[str], seeds: Iterable[int],
+              inputs: Sequence[str] = ('random',),
+              rulesets: Sequence[Rules] = (Rules(),)) -> List[Job]:
+    """난이도, 시드, 입력, 규칙의 모든 조합에 대한 Job list를 반환한다."""
+    return [Job(diff, seed, name, rules)
+            for diff, name, rules, seed in product(diffs, inputs, rulesets, list(seeds))]
+
+
+def sweep_rules(overrides: Dict[str, Sequence[Any]]) -> List[Rules]:
+    """Rules의 필드 이름을 key로, 값 list를 value로 하는 overrides의 모든 조합을 반환한다.
+
+    Raises:
+        ValueError: Rules의 필드가 아닌 key가 있을 경우
+
+    """
+    for name in overrides:
+        if not name in Rules._fields:
+            raise ValueError
+
+    names = list(overrides)
+    return [Rules()._replace(**dict(zip(names, values)))
+            for values in product(*(overrides[name] for name in names))]
+
+
+def _init_worker() -> None:
+    # SDL이 SIGTERM을 QUIT 이벤트로 바꾸면 Pool.terminate가 작업 프로세스를 끝내지 못한다.
+    os.environ.setdefault('SDL_NO_SIGNAL_HANDLERS', '1')
+    init_headless()
+
+
+def run_batch(jobs: Sequence[Job], processes: Optional[int] = None,
+              chunksize: int = 4) -> Iterator[GameResult]:
+    """jobs를 프로세스 풀에서 나누어 실행하고, 끝나는 순서대로 결과를 반환한다.
+
+    게임끼리 공유하는 상태가 없으므로, 게임 수가 충분하면 처리량은 프로세스 수에 비례한다.
+
+    Args:
+        jobs: 실행할 Job list
+        processes: 프로세스 수. None일 경우 CPU 수. 1일 경우 현재 프로세스에서 실행한다.
+        chunksize: 프로세스에 한 번에 보내는 Job 수
+
+    Yields:
+        게임 결과
+
+    """
+    if processes == 1:
+        init_headless()
+        yield from map(run_job, jobs)
+        return
+
+    with Pool(processes or os.cpu_count(), initializer=_init_worker) as pool:
+        yield from pool.imap_unordered(run_job, jobs, chunksize)
+
+
+def _stats(values: Sequence[float]) -> Dict[str, float]:
+    arr = np.asarray(values, dtype=np.float64)
+    return {'mean': float(arr.mean()),
+            'std': float(arr.std()),
+            'min': float(arr.min()),
+            'p10': float(np.percentile(arr, 10)),
+            'p50': float(np.percentile(arr, 50)),
+            'p90': float(np.percentile(arr, 90)),
+            'max': float(arr.max())}
+
+
+def summarize(results: Iterable[GameResult]) -> List[Dict[str, Any]]:
+    """결과를 (난이도, 입력, 규칙)별로 묶어 점수 분포와 패턴별 통계를 반환한다.
+
+    패턴별 damage는 게임당 평균 피격 프레임 수이며, 한 프레임에 여러 패턴의 총알에 겹친 경우
+    각 패턴에 모두 센다. escapes는 게임당 평균 자연사한 적 수이다.
+
+    """
+    groups: Dict[Tuple[str, str, Rules], List[GameResult]] = dict()
+    for result in results:
+        job = result.job
+        groups.setdefault((job.diff, job.input, job.rules), []).append(result)
+
+    ret: List[Dict[str, Any]] = []
+    for (diff, name, rules), group in groups.items():
+        games = len(group)
+        damage: Dict[str, float] = dict()
+        escapes: Dict[str, float] = dict()
+        for result in group:
+            for tag, count in result.damage.items():
+                damage[tag] = damage.get(tag, 0) + count / games
+            for tag, count in result.escapes.items():
+                escapes[tag] = escapes.get(tag, 0) + count / games
+
+        ret.append({'diff': diff,
+                    'input': name,
+                    'rules': rules._asdict(),
+                    'games': games,
+                    'score': _stats([r.score for r in group]),
+                    'frames': _stats([r.frames for r in group]),
+                    'damage': dict(sorted(damage.items())),
+                    'escapes': dict(sorted(escapes.items()))})
+    return ret
+
+
+def save(path: Union[str, Path], results: Sequence[GameResult],
+         extra: Optional[Dict[str, Any]] = None) -> None:
+    """요약과 게임별 결과를 JSON으로 저장한다."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    games = [{'diff': r.job.diff, 'seed': r.job.seed, 'input': r.job.input,
+              'rules': r.job.rules._asdict(), 'score': r.score, 'frames': r.frames,
+              'damage': r.damage, 'escapes': r.escapes} for r in results]
+    with path.open('w') as f:
+        json.dump({**(extra or {}), 'summary': summarize(results), 'games': games}, f, indent=2)
+
+
+def patterndirs() -> List[str]:
+    """패턴 폴더 아래의 난이도 폴더 이름 list를 반환한다."""
+    return sorted(p.name for p in (Path.cwd() / ct.PATTERNDIR).iterdir() if p.is_dir())
@@ -0,0 +1,110 @@
+from __future__ import annotations
+from typing import Dict, List, Tuple
+import time
+
+import numpy as np
+
+from . import constant as ct
+from .mover import EventMover
+from .observation import Observation
+
+_DIRECTIONS: List[Tuple[int, Tuple[int, int]]] = [
+    (0b0000, (0, 0)), (0b0001, (0, -1)), (0b0010, (-1, 0)), (0b0100, (0, 1)), (0b1000, (1, 0)),
+    (0b0011, (-1, -1)), (0b0110, (-1, 1)), (0b1100, (1, 1)), (0b1001, (1, -1))]  # KEYBITS 순서의 방향키
+_SLOW: int = 0b10000  # LShift
+
+
+class DodgeBot:
+    """가까운 총알의 궤적을 예측하여 피하는 기준 자동 플레이어이다.
+
+    정지와 8방향 × (보통, 느린) 속도의 17가지 행동마다 그 행동을 horizon 프레임 유지했을 때의 플레이어 위치와
+    총알의 등속 위치를 한꺼번에 계산하여, 겹치는 횟수가 가장 적고 총알과 가장 멀며 home에 가까운 행동을 고른다.
+    계산량은 행동 수 × horizon × nearest로 고정되어 있어 프레임마다 budget 안에서 결정을 마친다.
+    같은 관측에는 항상 같은 행동을 고르므로, 결정 시간은 기록만 하고 결정에 사용하지 않는다.
+
+    Attributes:
+        budget: 한 번의 결정에 허용하는 시간(초)
+        horizon: 예측할 프레임 수
+        nearest: 고려할 가까운 총알의 최대 수
+        margin: 총알과 플레이어 rect 사이에 둘 여유(픽셀)
+        home: 위협이 없을 때 돌아갈 위치
+        decisions: 결정 횟수
+        overruns: budget을 넘긴 결정 횟수
+        worst: 가장 오래 걸린 결정 시간(초)
+        total: 결정 시간의 합(초)
+
+    """
+    decay: float = 0.85  # 먼 미래의 충돌일수록 가볍게
+    clearance: float = 48.0  # 이 거리 이상 떨어진 총알은 모두 똑같이 안전하다고 본다.
+
+    def __init__(self, budget: float = ct.BOTBUDGET, horizon: int = ct.BOTHORIZON,
+                 nearest: int = ct.OBSNEAREST, margin: float = 2.0,
+                 home: Tuple[float, float] = (ct.WIDTH / 2, ct.HEIGHT * 0.85)):
+        if budget <= 0 or horizon < 1 or nearest < 0:
+            raise ValueError
+
+        self.budget = budget
+        self.horizon = horizon
+        self.nearest = nearest
+        self.margin = margin
+        self.home = np.array(home)
+        self.decisions = 0
+        self.overruns = 0
+        self.worst = 0.0
+        self.total = 0.0
+
+        actions, velocities = [], []
+        for keys, direction in _DIRECTIONS:
+            for slow in ((False,) if not keys else (False, True)):
+                speed = EventMover.magnitude / (EventMover.amplifier if slow else 1)
+                actions.append(keys | (_SLOW if slow else 0))
+                velocities.append((direction[0] * speed, direction[1] * speed))
+        self.actions = np.array(actions)
+        self._velocities = np.array(velocities)
+        self._t = np.arange(1, horizon + 1, dtype=np.float64)
+        self._weights = self.decay ** self._t
+        self._last = 0
+
+    def __call__(self, observation: Observation) -> int:
+        """observation에 대한 행동(눌린 키 bitmask)을 반환한다."""
+        start = time.perf_counter()
+
+        center = observation.player[:2].astype(np.float64)
+        size = observation.player[2:4].astype(np.float64)
+        t = self._t
+        # (행동, 프레임, 2)
+        path = np.clip(center + self._velocities[:, None, :] * t[None, :, None],
+                       0, (ct.WIDTH, ct.HEIGHT))
+
+        bullets = observation.bullets[:self.nearest][observation.mask[:self.nearest]]
+        cost = np.linalg.norm(path[:, -1] - self.home, axis=1) * 0.01
+        if len(bullets):
+            bullets = bullets.astype(np.float64)
+            # (프레임, 총알, 2)
+            future = center + bullets[None, :, 0:2] + bullets[None, :, 2:4] * t[:, None, None]
+            reach = (bullets[:, 4:6] + size) / 2 + self.margin
+            gap = np.abs(future[None] - path[:, :, None]) - reach  # (행동, 프레임, 총알, 2)
+            separation = gap.max(axis=3)  # 두 rect 사이의 거리. 음수면 겹침
+            hits = (separation < 0) @ np.ones(len(bullets))
+            cost += (hits @ self._weights) * 100
+            cost -= np.minimum(separation.min(axis=(1, 2)), self.clearance)
+
+        cost[self.actions == self._last] -= 0.5  # 비슷하면 같은 행동 유지
+        action = int(self.actions[int(np.argmin(cost))])
+        self._last = action
+
+        elapsed = time.perf_counter() - start
+        self.decisions += 1
+        self.total += elapsed
+        self.worst = max(self.worst, elapsed)
+        if elapsed > self.budget:
+            self.overruns += 1
+        return action
+
+    def stats(self) -> Dict[str, float]:
+        """결정 시간 통계를 dict로 반환한다. 시간은 ms이다."""
+        return {'decisions': self.decisions,
+                'overruns': self.overruns,
+                'mean': self.total / self.decisions * 1000 if self.decisions else 0.0,
+                'worst': self.worst * 1000,
+                'budget': self.budget * 1000}
@@ -0,0 +1,404 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Tuple, Union
+import math
+
+import numpy as np
+import pygame as pg
+
+from . import constant as ct
+from .mover import Mover, TrackingMover
+from .helpers.kinematics import NEVER, exit_frames
+from .render import BatchRenderer
+from .emission import EmissionScheduler
+
+_COSMAX: float = math.cos(TrackingMover.maxDeg)
+_SINMAX: float = math.sin(TrackingMover.maxDeg)
+
+
+class BulletPool:
+    """탄막 총알을 구조체 배열(Structure of Arrays) 형태로 관리한다.
+
+    총알 하나마다 Element, Mover, Vector 객체를 만드는 대신,
+    모든 총알의 상태를 연속된 NumPy 배열에 저장하고 한 번의 벡터 연산으로 갱신한다.
+    살아있는 총알은 항상 배열의 앞 n개 칸에 모여 있다.
+
+    위치는 항상 매 프레임 속도를 더해 구한다. analytic이 True일 경우 등속 총알이 경계에 가까워지는 tick을
+    생성 시점에 미리 구해 두어, 그 전까지는 경계를 검사하지 않는다.
+    유도 총알은 매 프레임 검사하며, 유도가 끝나는 시점에 등속 총알로 바뀐다.
+
+    Attributes:
+        n: 살아있는 총알의 개수
+        spawned: 생성된 총알 수
+        despawned: 제거된 총알 수
+        peak: 동시에 살아있던 총알 수의 최댓값
+        resizes: 배열을 늘린 횟수
+        tick: pool이 생성된 뒤 지난 프레임 수
+        pos: 총알의 위치 (capacity, 2)
+        prev: 직전 update 이전의 총알 위치 (capacity, 2). 그릴 때 보간에 사용한다.
+        vel: 총알의 속도 (capacity, 2)
+        kind: 총알의 운동 종류 (VELOCITY, TRACKING)
+        heading: 유도 총알의 진행 방향 단위벡터 (capacity, 2)
+        vsize: 유도 총알의 속력
+        followframe: 유도 총알이 유도를 멈추는 프레임
+        frame: 총알이 생성된 뒤 지난 프레임 수
+        target: 유도 대상의 targets 내 인덱스, 유도하지 않을 경우 -1
+        image: 총알 이미지의 images 내 인덱스
+        tag: 총알을 쏜 패턴 이름의 tags 내 인덱스, 없을 경우 -1
+        size: 총알 이미지의 크기 (capacity, 2)
+        deadline: 등속 총알의 경계 검사를 시작하는 tick
+        images: 총알 이미지 list
+        targets: 유도 대상 Mover list
+        tags: 패턴 이름 list
+
+    """
+    VELOCITY: int = 0
+    TRACKING: int = 1
+
+    # _allocate가 setattr로 만드는 배열들
+    pos: np.ndarray
+    prev: np.ndarray
+    vel: np.ndarray
+    kind: np.ndarray
+    heading: np.ndarray
+    vsize: np.ndarray
+    followframe: np.ndarray
+    frame: np.ndarray
+    target: np.ndarray
+    image: np.ndarray
+    tag: np.ndarray
+    size: np.ndarray
+    deadline: np.ndarray
+
+    analytic: bool = ct.ANALYTIC  # 경계 검사 생략 여부
+    margin: float = 1e-6  # 닫힌 식과 매 프레임 더한 위치의 부동소수점 오차보다 충분히 큰 값
+
+    def __init__(self, capacity: int = ct.POOLCAPACITY):
+        self.n = 0
+        self.spawned = 0
+        self.despawned = 0
+        self.peak = 0
+        self.resizes = 0
+        self.tick = 0
+        self._nextdeadline = NEVER
+        self.images: List[pg.surface.Surface] = []
+        self.targets: List[Mover] = []
+        self.tags: List[str] = []
+        self._imageindex: Dict[int, int] = dict()
+        self._targetindex: Dict[int, int] = dict()
+        self._tagindex: Dict[str, int] = dict()
+
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        """배열의 크기를 capacity로 맞춘다. 살아있는 총알의 상태는 유지된다."""
+        n = self.n
+        fields: Dict[str, Tuple[Tuple[int, ...], Any]] = {
+            'pos': ((capacity, 2), np.float64),
+            'prev': ((capacity, 2), np.float64),
+            'vel': ((capacity, 2), np.float64),
+            'kind': ((capacity,), np.uint8),
+            'heading': ((capacity, 2), np.float64),
+            'vsize': ((capacity,), np.float64),
+            'followframe': ((capacity,), np.float64),
+            'frame': ((capacity,), np.int64),
+            'target': ((capacity,), np.int32),
+            'image': ((capacity,), np.int32),
+            'tag': ((capacity,), np.int32),
+            'size': ((capacity, 2), np.int64),
+            'deadline': ((capacity,), np.int64)}
+
+        for name, (shape, dtype) in fields.items():
+            arr = np.zeros(shape, dtype=dtype)
+            if n:
+                arr[:n] = getattr(self, name)[:n]
+            setattr(self, name, arr)
+
+        self.capacity = capacity
+
+    def __len__(self) -> int:
+        return self.n
+
+    def _index(self, obj: Any, lst: List[Any], index: Dict[Any, int], key: Any = None) -> int:
+        """obj의 lst 내 인덱스를 반환한다. 없으면 새로 추가한다. key가 None이면 id(obj)를 사용한다."""
+        key = id(obj) if key is None else key
+        if not key in index:
+            index[key] = len(lst)
+            lst.append(obj)
+
+        return index[key]
+
+    def spawn(self, positions: np.ndarray, velocities: np.ndarray,
+              image: pg.surface.Surface, track: Optional[Mover] = None,
+              tag: Optional[str] = None) -> None:
+        """총알 여러 개를 한꺼번에 생성한다.
+
+        Args:
+            positions: 총알의 초기 위치 (k, 2)
+            velocities: 총알의 초기 속도 (k, 2)
+            image: 총알을 렌더링할 이미지
+            track: 유도할 대상의 Mover or None
+            tag: 총알을 쏜 패턴 이름 or None
+
+        """
+        k = len(positions)
+        if k == 0:
+            return
+
+        if self.n + k > self.capacity:
+            capacity = self.capacity
+            while self.n + k > capacity:
+                capacity *= 2
+            self._allocate(capacity)
+            self.resizes += 1
+
+        s = slice(self.n, self.n + k)
+        self.pos[s] = positions
+        self.prev[s] = positions
+        self.vel[s] = velocities
+        self.frame[s] = 0
+        self.image[s] = self._index(image, self.images, self._imageindex)
+        self.size[s] = image.get_size()
+        self.tag[s] = -1 if tag is None else self._index(tag, self.tags, self._tagindex, tag)
+
+        if track is None:
+            self.kind[s] = BulletPool.VELOCITY
+            self.target[s] = -1
+            if self.analytic:
+                self._schedule(s)
+        else:
+            vsize = np.hypot(velocities[:, 0], velocities[:, 1])
+
+            self.kind[s] = BulletPool.TRACKING
+            self.target[s] = self._index(track, self.targets, self._targetindex)
+            self.heading[s] = np.where(vsize[:, None] > 0,
+                                       velocities / np.where(vsize > 0, vsize, 1)[:, None],
+                                       (1.0, 0.0))
+            self.vsize[s] = vsize
+            self.followframe[s] = np.minimum(TrackingMover.maxtrackTime,
+                                             TrackingMover.trackTime / vsize) * ct.FPS
+
+        self.n += k
+        self.spawned += k
+        self.peak = max(self.peak, self.n)
+
+    def _schedule(self, index: Union[slice, np.ndarray]) -> None:
+        """index의 등속 총알이 현재 위치에서 경계에 margin보다 가까워지는 tick을 구한다.
+
+        그 전까지는 매 프레임 더한 위치도 반드시 경계 안에 있으므로 경계를 검사하지 않는다.
+
+        """
+        self.deadline[index] = self.tick + exit_frames(self.pos[index], self.vel[index],
+                                                       ct.WIDTH, ct.HEIGHT, self.margin)
+        self._nextdeadline = min(self._nextdeadline, int(self.deadline[index].min()))
+
+    def _steer(self) -> None:
+        """유도 중인 총알의 방향을 TrackingMover와 같은 규칙으로 한꺼번에 튼다.
+
+        편각 대신 진행 방향 단위벡터를 저장하여, atan2 없이 내적, 외적과
+        maxDeg만큼의 회전 행렬만으로 방향을 갱신한다.
+
+        """
+        n = self.n
+        active = np.nonzero((self.kind[:n] == BulletPool.TRACKING)
+                            & (self.frame[:n] <= self.followframe[:n]))[0]
+        if not len(active):
+            return
+
+        targetpos = np.array([m.as_tuple() for m in self.targets], dtype=np.float64)
+        delta = targetpos[self.target[active]] - self.pos[active]
+
+        dist = np.hypot(delta[:, 0], delta[:, 1])
+        same = dist == 0
+        dist[same] = 1
+        dx = np.where(same, 1.0, delta[:, 0] / dist)  # atan2(0, 0) == 0
+        dy = np.where(same, 0.0, delta[:, 1] / dist)
+
+        hx = self.heading[active, 0]
+        hy = self.heading[active, 1]
+        dot = hx * dx + hy * dy
+        ccw = hx * dy - hy * dx
+
+        sin = np.where(ccw > 0, _SINMAX, -_SINMAX)  # 한계 이상이면 maxDeg만큼만 회전
+        rx = hx * _COSMAX - hy * sin
+        ry = hx * sin + hy * _COSMAX
+        norm = np.hypot(rx, ry)
+
+        follow = dot >= TrackingMover.minDot
+        hx = np.where(follow, dx, rx / norm)
+        hy = np.where(follow, dy, ry / norm)
+
+        vsize = self.vsize[active]
+        self.heading[active, 0] = hx
+        self.heading[active, 1] = hy
+        self.vel[active, 0] = hx * vsize
+        self.vel[active, 1] = hy * vsize
+
+    @staticmethod
+    def _in_bound(pos: np.ndarray) -> np.ndarray:
+        x = pos[:, 0]
+        y = pos[:, 1]
+        return (0 <= x) & (x <= ct.WIDTH) & (0 <= y) & (y <= ct.HEIGHT)  # 경계에 닿으면 kill
+
+    def update(self) -> None:
+        """모든 총알의 1프레임 후 상태를 업데이트하고, 경계를 벗어난 총알을 제거한다."""
+        self.tick += 1
+        n = self.n
+        if n == 0:
+            return
+
+        self.prev[:n] = self.pos[:n]
+        self._steer()
+        self.pos[:n] += self.vel[:n]
+        self.frame[:n] += 1
+        alive = self._check_scheduled() if self.analytic else self._in_bound(self.pos[:n])
+
+        if alive is not None and not alive.all():
+            self._compact(alive)
+
+    def _check_scheduled(self) -> Optional[np.ndarray]:
+        """유도 총알과 deadline이 지난 등속 총알만 경계를 검사하고, 살아있는 총알의 bool 배열을 반환한다.
+
+        모두 살아있으면 None을 반환한다.
+
+        """
+        n = self.n
+        tracking = self.kind[:n] == BulletPool.TRACKING
+        check = tracking
+        if self.tick >= self._nextdeadline:
+            check = check | (self.deadline[:n] <= self.tick)
+        index = np.flatnonzero(check)
+        if not len(index):
+            return None
+
+        alive = np.ones(n, dtype=bool)
+        alive[index] = self._in_bound(self.pos[index])
+
+        # 유도가 끝난 총알은 이후 등속 총알
+        released = np.flatnonzero(tracking & alive & (self.frame[:n] > self.followframe[:n]))
+        if len(released):
+            self.kind[released] = BulletPool.VELOCITY
+            self._schedule(released)
+
+        return alive
+
+    def _compact(self, alive: np.ndarray) -> None:
+        """살아있는 총알만 배열의 앞쪽으로 모은다."""
+        n = self.n
+        k = int(alive.sum())
+        for name in ('pos', 'prev', 'vel', 'kind', 'heading', 'vsize', 'followframe', 'frame',
+                     'target', 'image', 'tag', 'size', 'deadline'):
+            arr: np.ndarray = getattr(self, name)
+            arr[:k] = arr[:n][alive]
+
+        self.despawned += n - k
+        self.n = k
+        if self.analytic:
+            velocity = self.kind[:k] == BulletPool.VELOCITY
+            self._nextdeadline = int(self.deadline[:k][velocity].min()) if velocity.any() else NEVER
+
+    def clear(self) -> None:
+        """모든 총알을 제거한다."""
+        self.despawned += self.n
+        self.n = 0
+        self._nextdeadline = NEVER
+
+    def stats(self) -> Dict[str, int]:
+        """pool 통계를 dict로 반환한다."""
+        return {'live': self.n,
+                'peak': self.peak,
+                'capacity': self.capacity,
+                'resizes': self.resizes,
+                'spawned': self.spawned,
+                'despawned': self.despawned}
+
+    def positions_at(self, ahead: int) -> np.ndarray:
+        """ahead 프레임 후 총알의 위치 (n, 2)를 반환한다.
+
+        등속 총알은 정확한 위치를, 유도 중인 총알은 현재 속도로 직진한다고 가정한 위치를 계산한다.
+
+        """
+        n = self.n
+        return self.pos[:n] + self.vel[:n] * ahead
+
+    def nearest(self, center: Tuple[float, float], k: int) -> np.ndarray:
+        """center에 가장 가까운 총알 최대 k개의 index를 가까운 순서로 반환한다."""
+        n = self.n
+        k = min(k, n)
+        if k <= 0:
+            return np.zeros(0, dtype=np.intp)
+
+        rel = self.pos[:n] - center
+        dist = rel[:, 0] ** 2 + rel[:, 1] ** 2
+        index = np.argpartition(dist, k - 1)[:k] if k < n else np.arange(n)
+        return index[np.argsort(dist[index], kind='stable')]
+
+    def topleft(self, alpha: float = 1.0) -> np.ndarray:
+        """Element.rect와 같은 규칙으로 계산한 총알 rect의 왼쪽 위 좌표 (n, 2)
+
+        Args:
+            alpha: 1보다 작을 경우 직전 update 이전 위치와 현재 위치를 alpha로 보간한 위치를 사용한다.
+
+        """
+        n = self.n
+        pos = self.pos[:n]
+        if alpha < 1:
+            pos = self.prev[:n] + (pos - self.prev[:n]) * alpha
+        return pos.astype(np.int64) - self.size[:n] // 2
+
+    def collide_rect(self, rect: pg.rect.Rect) -> np.ndarray:
+        """rect와 겹치는 총알을 나타내는 bool 배열을 반환한다. Rect.colliderect와 같은 규칙을 따른다."""
+        if rect.w == 0 or rect.h == 0:
+            return np.zeros(self.n, dtype=bool)
+
+        tl = self.topleft()
+        size = self.size[:self.n]
+        return ((tl[:, 0] < rect.x + rect.w) & (tl[:, 1] < rect.y + rect.h)
+                & (tl[:, 0] + size[:, 0] > rect.x) & (tl[:, 1] + size[:, 1] > rect.y)
+                & (size[:, 0] > 0) & (size[:, 1] > 0))
+
+
+class DanmakuGroup(pg.sprite.Group):
+    """BulletPool을 포함하는 스프라이트 그룹이다.
+
+    일반 스프라이트는 pg.sprite.Group과 같이 다루고,
+    BaseDanmaku.emit을 통해 추가된 총알은 pool에서 한꺼번에 처리한다.
+
+    Attributes:
+        pool: 총알을 관리하는 BulletPool 객체
+        renderer: pool의 총알을 그리는 BatchRenderer 객체
+        scheduler: 탄막 총알의 생성을 프레임에 나누는 EmissionScheduler 객체
+
+    """
+    def __init__(self, *sprites: pg.sprite.Sprite, capacity: int = ct.POOLCAPACITY):
+        super().__init__(*sprites)
+        self.pool = BulletPool(capacity)
+        self.renderer = BatchRenderer()
+        self.scheduler = EmissionScheduler()
+
+    def __len__(self) -> int:
+        return super().__len__() + len(self.pool)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.scheduler.flush(self.pool)
+        self.pool.update()
+
+    def draw(self, surface: pg.surface.Surface) -> None:  # type: ignore[override]
+        super().draw(surface)
+        self.renderer.draw(surface, self.pool)
+
+    def empty(self) -> None:
+        super().empty()
+        self.pool.clear()
+        self.scheduler.clear()
+
+    def collideany(self, group: pg.sprite.Group) -> bool:
+        """group의 스프라이트 중 하나라도 이 그룹의 스프라이트나 총알과 겹치는지 반환한다."""
+        if pg.sprite.groupcollide(group, self, False, False):
+            return True
+
+        for sprite in group:
+            if self.pool.collide_rect(sprite.rect).any():
+                return True
+
+        return False
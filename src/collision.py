@@ -0,0 +1,272 @@
+from __future__ import annotations
+from typing import Dict, List, Iterator, Tuple, Any, Set
+import abc
+
+import numpy as np
+import pygame as pg
+
+from . import constant as ct
+from .bulletpool import BulletPool, DanmakuGroup
+from .occupancy import OccupancyGrid
+
+
+class SpatialHash:
+    """균일 격자를 이용한 공간 해시이다.
+
+    rect가 걸치는 모든 칸에 원소를 등록하고, 질의한 rect가 걸치는 칸의 원소만 후보로 반환한다.
+
+    Attributes:
+        cellsize: 격자 한 칸의 크기
+        cells: 칸의 좌표를 key로, (등록 순서, 원소)의 list를 value로 하는 dict
+
+    """
+    def __init__(self, cellsize: int = ct.CELLSIZE):
+        self.cellsize = cellsize
+        self.cells: Dict[Tuple[int, int], List[Tuple[int, Any]]] = dict()
+        self._count = 0
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self._count = 0
+
+    def _span(self, rect: pg.rect.Rect) -> Iterator[Tuple[int, int]]:
+        """rect가 걸치는 칸의 좌표를 반환한다."""
+        cs = self.cellsize
+        for cx in range(rect.left // cs, (rect.right - 1) // cs + 1):
+            for cy in range(rect.top // cs, (rect.bottom - 1) // cs + 1):
+                yield (cx, cy)
+
+    def insert(self, item: Any, rect: pg.rect.Rect) -> None:
+        """item을 rect가 걸치는 모든 칸에 등록한다."""
+        entry = (self._count, item)
+        self._count += 1
+
+        for cell in self._span(rect):
+            self.cells.setdefault(cell, []).append(entry)
+
+    def query(self, rect: pg.rect.Rect) -> List[Any]:
+        """rect와 같은 칸에 등록된 원소를 등록 순서대로 중복 없이 반환한다."""
+        found: Dict[int, Any] = dict()
+        for cell in self._span(rect):
+            for order, item in self.cells.get(cell, ()):
+                found[order] = item
+
+        return [found[order] for order in sorted(found)]
+
+
+def hashcollide(groupa: pg.sprite.Group, groupb: pg.sprite.Group,
+                dokilla: bool, dokillb: bool,
+                cellsize: int = ct.CELLSIZE) -> Dict[pg.sprite.Sprite, List[pg.sprite.Sprite]]:
+    """pg.sprite.groupcollide와 같은 결과를 공간 해시를 이용하여 반환한다.
+
+    Args:
+        groupa: 첫째 스프라이트 그룹
+        groupb: 둘째 스프라이트 그룹
+        dokilla: 충돌한 groupa의 스프라이트를 kill할지 여부
+        dokillb: 충돌한 groupb의 스프라이트를 kill할지 여부
+        cellsize: 격자 한 칸의 크기
+
+    Returns:
+        groupa의 스프라이트를 key로, 충돌한 groupb의 스프라이트 list를 value로 하는 dict
+
+    """
+    grid = SpatialHash(cellsize)
+    for sprite in groupb:
+        grid.insert(sprite, sprite.rect)
+
+    killed: Set[pg.sprite.Sprite] = set()
+    crashed: Dict[pg.sprite.Sprite, List[pg.sprite.Sprite]] = dict()
+    for sprite in groupa.sprites():
+        rect = sprite.rect
+        hits = [other for other in grid.query(rect)
+                if not other in killed and rect.colliderect(other.rect)]
+        if not hits:
+            continue
+
+        crashed[sprite] = hits
+        if dokillb:
+            for other in hits:
+                other.kill()
+                killed.add(other)
+        if dokilla:
+            sprite.kill()
+
+    return crashed
+
+
+class PoolGrid:
+    """BulletPool의 총알을 균일 격자에 정렬하여 등록한 색인이다.
+
+    각 총알을 rect가 걸치는 모든 칸에 등록한 뒤 칸 번호로 정렬해 두며,
+    질의한 rect가 걸치는 칸의 총알만 정확한 rect 검사를 수행한다.
+
+    Attributes:
+        pool: 색인할 BulletPool
+        cellsize: 격자 한 칸의 크기
+
+    """
+    def __init__(self, pool: BulletPool, cellsize: int = ct.CELLSIZE):
+        self.pool = pool
+        self.cellsize = cellsize
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """pool의 현재 상태로 색인을 다시 만든다."""
+        pool = self.pool
+        cs = self.cellsize
+        self.columns = ct.WIDTH // cs + 3  # 경계 밖으로 조금 나간 총알을 위한 여유
+
+        tl = pool.topleft()
+        br = tl + np.maximum(pool.size[:pool.n] - 1, 0)
+        bound = np.array([self.columns - 1, np.iinfo(np.int32).max])
+        c0 = np.clip(tl // cs + 1, 0, bound)
+        c1 = np.clip(br // cs + 1, 0, bound)
+        span = int((c1 - c0).max(initial=0)) + 1
+
+        keys: List[np.ndarray] = []
+        indices: List[np.ndarray] = []
+        every = np.arange(pool.n)
+        for dx in range(span):
+            for dy in range(span):
+                mask = (c0[:, 0] + dx <= c1[:, 0]) & (c0[:, 1] + dy <= c1[:, 1])
+                keys.append((c0[mask, 1] + dy) * self.columns + c0[mask, 0] + dx)
+                indices.append(every[mask])
+
+        key = np.concatenate(keys) if keys else np.zeros(0, dtype=np.int64)
+        index = np.concatenate(indices) if indices else np.zeros(0, dtype=np.int64)
+
+        order = np.argsort(key, kind='stable')
+        self._keys = key[order]
+        self._indices = index[order]
+
+    def candidates(self, rect: pg.rect.Rect) -> np.ndarray:
+        """rect가 걸치는 칸에 등록된 총알의 인덱스를 반환한다."""
+        cs = self.cellsize
+        x0 = max(rect.left // cs + 1, 0)
+        x1 = min((rect.right - 1) // cs + 1, self.columns - 1)
+        found: List[np.ndarray] = []
+        for cy in range(max(rect.top // cs + 1, 0), (rect.bottom - 1) // cs + 2):
+            lo, hi = np.searchsorted(self._keys, (cy * self.columns + x0,
+                                                  cy * self.columns + x1 + 1))
+            found.append(self._indices[lo:hi])
+
+        if not found:
+            return np.zeros(0, dtype=np.int64)
+        return np.unique(np.concatenate(found))
+
+    def collide_rect(self, rect: pg.rect.Rect) -> np.ndarray:
+        """rect와 겹치는 총알의 인덱스를 반환한다."""
+        idx = self.candidates(rect)
+        if not len(idx) or rect.w == 0 or rect.h == 0:
+            return idx[:0]
+
+        pool = self.pool
+        tl = pool.pos[idx].astype(np.int64) - pool.size[idx] // 2
+        size = pool.size[idx]
+        hit = ((tl[:, 0] < rect.x + rect.w) & (tl[:, 1] < rect.y + rect.h)
+               & (tl[:, 0] + size[:, 0] > rect.x) & (tl[:, 1] + size[:, 1] > rect.y)
+               & (size[:, 0] > 0) & (size[:, 1] > 0))
+        return idx[hit]
+
+
+class Collider:
+    """게임 루프에서 사용하는 충돌 판정 방식을 정의하는 추상 클래스이다."""
+    @abc.abstractmethod
+    def groupcollide(self, groupa: pg.sprite.Group, groupb: pg.sprite.Group,
+                     dokilla: bool, dokillb: bool) -> Dict[pg.sprite.Sprite, List[pg.sprite.Sprite]]:
+        """pg.sprite.groupcollide와 같은 결과를 반환한다."""
+
+    @abc.abstractmethod
+    def collideany(self, group: pg.sprite.Group, danmaku: DanmakuGroup) -> bool:
+        """group의 스프라이트 중 하나라도 danmaku의 스프라이트나 총알과 겹치는지 반환한다."""
+
+
+class BruteCollider(Collider):
+    """모든 쌍을 검사하는 기존의 충돌 판정 방식이다."""
+    def groupcollide(self, groupa: pg.sprite.Group, groupb: pg.sprite.Group,
+                     dokilla: bool, dokillb: bool) -> Dict[pg.sprite.Sprite, List[pg.sprite.Sprite]]:
+        ret: Dict[pg.sprite.Sprite, List[pg.sprite.Sprite]] = \
+            pg.sprite.groupcollide(groupa, groupb, dokilla, dokillb)
+        return ret
+
+    def collideany(self, group: pg.sprite.Group, danmaku: DanmakuGroup) -> bool:
+        return danmaku.collideany(group)
+
+
+class HashCollider(Collider):
+    """공간 해시를 이용한 충돌 판정 방식이다.
+
+    탄막 총알과의 판정은 질의할 rect가 indexmin개 이상일 때만 PoolGrid 색인을 만들고,
+    그보다 적으면(게임에서는 플레이어 하나) BulletPool 전체를 한 번의 벡터 연산으로 검사하는 편이 빠르다.
+
+    Attributes:
+        cellsize: 격자 한 칸의 크기
+
+    """
+    indexmin: int = 16  # PoolGrid를 만드는 최소 rect 수
+    def __init__(self, cellsize: int = ct.CELLSIZE):
+        self.cellsize = cellsize
+
+    def groupcollide(self, groupa: pg.sprite.Group, groupb: pg.sprite.Group,
+                     dokilla: bool, dokillb: bool) -> Dict[pg.sprite.Sprite, List[pg.sprite.Sprite]]:
+        return hashcollide(groupa, groupb, dokilla, dokillb, self.cellsize)
+
+    def collideany(self, group: pg.sprite.Group, danmaku: DanmakuGroup) -> bool:
+        if hashcollide(group, danmaku, False, False, self.cellsize):
+            return True
+
+        pool = danmaku.pool
+        if len(group) < self.indexmin:
+            return any(pool.collide_rect(sprite.rect).any() for sprite in group)
+
+        grid = PoolGrid(pool, self.cellsize)
+        for sprite in group:
+            if len(grid.collide_rect(sprite.rect)):
+                return True
+
+        return False
+
+
+class GridCollider(HashCollider):
+    """탄막 총알과의 충돌을 OccupancyGrid로 판정하는 방식이다.
+
+    스프라이트끼리의 충돌은 HashCollider와 같다. collideany를 호출할 때마다 grid를 다시 채우고,
+    각 스프라이트는 rect 주변 칸에 속한 총알만 검사한다.
+
+    Attributes:
+        grid: 마지막으로 판정한 프레임의 OccupancyGrid
+
+    """
+    def __init__(self, cellsize: int = ct.CELLSIZE, resolution: int = ct.OCCUPANCYCELL):
+        super().__init__(cellsize)
+        self.grid = OccupancyGrid(resolution)
+
+    def collideany(self, group: pg.sprite.Group, danmaku: DanmakuGroup) -> bool:
+        if hashcollide(group, danmaku, False, False, self.cellsize):
+            return True
+
+        self.grid.rebuild(danmaku.pool)
+        for sprite in group:
+            if self.grid.collideany(sprite.rect):
+                return True
+
+        return False
+
+
+colliders: Dict[str, type] = {'brute': BruteCollider,
+                              'hash': HashCollider,
+                              'grid': GridCollider}
+
+
+def get_collider(name: str) -> Collider:
+    """이름에 해당하는 충돌 판정 객체를 반환한다.
+
+    Raises:
+        ValueError: name이 colliders에 없을 경우
+
+    """
+    if not name in colliders:
+        raise ValueError
+
+    collider: Collider = colliders[name]()
+    return collider
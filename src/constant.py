@@ -1,4 +1,4 @@
-from typing import Final, Tuple
+from typing import Dict, Final, Tuple
 import math
 
 WIDTH: Final[int] = 512     #너비
@@ -29,3 +29,38 @@ OVERTIME: Final[int] = 450  # 기타 상수
 PATTERNDIR: Final[str] = 'assets'
 AUDIODIR: Final[str] = 'audio'
 SCOREDIR: Final[str] = 'scores'
+REPLAYDIR: Final[str] = 'replays'
+PROFILEDIR: Final[str] = 'profiles'
+STARTUPLOG: Final[str] = 'startup.jsonl'  # 프로파일 폴더 안의 시작 시간 기록 파일
+SOCKETPATH: Final[str] = 'danmaku.sock'  # 서버 모드의 기본 Unix 소켓 경로
+BUNDLEDIR: Final[str] = 'compiled'  # 미리 컴파일한 패턴 번들 폴더
+SCOREDB: Final[str] = 'scores.db'  # 점수 폴더 안의 스코어보드 데이터베이스 파일
+SCORETIMEOUT: Final[float] = 5.0  # 다른 프로세스가 스코어보드를 쓰는 동안 기다릴 최대 시간(초)
+
+COLLISION: Final[str] = 'hash'  # 충돌 판정 방식 ('brute', 'hash', 'grid')
+CELLSIZE: Final[int] = 32  # 공간 해시 격자 한 칸의 크기
+OCCUPANCYCELL: Final[int] = 8  # 총알 점유 격자 한 칸의 크기
+RENDERMODE: Final[str] = 'pixels'  # 탄막 총알 렌더링 방식 ('blits', 'pixels')
+DISPLAYMODE: Final[str] = 'dirty'  # 화면 갱신 방식 ('full', 'dirty')
+DIRTYCELL: Final[int] = 32  # 바뀐 영역을 기록하는 격자 한 칸의 크기
+GCMODE: Final[str] = 'default'  # 게임 중 gc 제어 방식 ('default', 'freeze', 'disable')
+MAXFRAMESKIP: Final[int] = 5  # 렌더링 한 프레임당 진행할 수 있는 최대 틱 수
+RENDERFPS: Final[int] = 60  # 렌더링 프레임 수 제한. 0일 경우 제한 없음
+QUALITY: Final[bool] = True  # 프레임이 예산을 넘으면 렌더링 품질을 자동으로 낮출지 여부
+QUALITYWINDOW: Final[int] = 30  # 품질 단계를 판단할 최근 프레임 수
+QUALITYHOLD: Final[int] = 60  # 품질 단계를 바꾼 뒤 다시 바꾸지 않을 프레임 수
+ANALYTIC: Final[bool] = True  # 등속 탄막 총알의 위치를 닫힌 식으로 계산하고, 등속, 등가속 운동이 경계에 가까워지는 프레임을 미리 구할지 여부
+POOLCAPACITY: Final[int] = 1024  # BulletPool의 초기 용량. 모자라면 두 배씩 늘린다.
+POOLCAPACITIES: Final[Dict[str, int]] = {  # 난이도별 BulletPool의 초기 용량. 없는 난이도는 POOLCAPACITY
+    'easy': 1024, 'normal': 1024, 'hard': 1024, 'insane': 1024,
+    'extra': 4096}  # python forecast.py --seeds 5 --input idle random dodge 결과 (extra 최대 3103개)
+EMITBUDGET: Final[int] = 0  # 프레임당 생성할 수 있는 탄막 총알 수. 0일 경우 제한 없음
+OBSNEAREST: Final[int] = 32  # 자동 플레이어가 관측하는 가까운 탄막 총알 수
+BOTHORIZON: Final[int] = 16  # 자동 플레이어가 총알의 궤적을 예측하는 프레임 수
+BOTBUDGET: Final[float] = 0.002  # 자동 플레이어가 한 프레임의 행동을 결정하는 데 쓸 수 있는 시간(초)
+TEXTCACHESIZE: Final[int] = 128  # 렌더링된 텍스트 Surface를 캐시할 최대 개수
+SOUNDCHANNELS: Final[int] = 6  # 효과음 채널 수
+SOUNDWINDOW: Final[int] = 6  # 같은 효과음을 다시 재생하기까지의 최소 프레임 수
+PROFILE: Final[bool] = False  # 프레임 구간별 시간 기록 여부
+PROFILEWINDOW: Final[int] = 120  # 오버레이의 백분위수를 계산할 최근 프레임 수
+PROFILEREFRESH: Final[int] = 15  # 오버레이를 다시 렌더링하는 프레임 간격
@@ -13,6 +13,7 @@ class Element(pg.sprite.Sprite):
     Attributes:
         mover: 스프라이트의 이동을 처리하는 Mover 객체
         image: 총알을 렌더링할 이미지
+        previous: 직전 틱의 rect 왼쪽 위 좌표. 그릴 때 보간에 사용한다.
 
     """
     def __init__(self, mover: Mover, image: pg.surface.Surface):
@@ -25,6 +26,17 @@ class Element(pg.sprite.Sprite):
         self.image = image
         self.rect = self.image.get_rect()
         self.rect.center = self.mover.as_trimmed_tuple()
+        self.previous = self.rect.topleft
+
+        self._frame = 0
+
+    def reset(self, image: pg.surface.Surface) -> None:
+        """mover가 reset된 뒤, 객체를 다시 사용할 수 있도록 제자리에서 초기 상태로 되돌린다."""
+        self.image = image
+        rect = get_actual(self.rect)
+        rect.size = image.get_size()
+        rect.center = self.mover.as_trimmed_tuple()
+        self.previous = rect.topleft
 
         self._frame = 0
 
@@ -32,7 +44,7 @@ class Element(pg.sprite.Sprite):
         """객체의 1프레임 후 상태를 업데이트한다."""
         self._frame += 1
         self.mover.advance(*args, **kwargs)
-        if not self.mover.in_bound():  # 경계에 닿으면 kill
+        if self.mover.expired():  # 경계에 닿으면 kill
             self.kill()
 
         get_actual(self.rect).center = self.mover.as_trimmed_tuple()
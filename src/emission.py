@@ -0,0 +1,145 @@
+from __future__ import annotations
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+import pygame as pg
+
+from . import constant as ct
+from .mover import Mover
+
+if TYPE_CHECKING:
+    from .basedanmaku import BaseDanmaku
+    from .bulletpool import BulletPool
+
+ComposedArrays = Tuple[np.ndarray, np.ndarray]
+
+
+class _Emission:
+    """스케줄러에 남아 있는 탄막 하나의 상태이다."""
+    __slots__ = ('stages', 'image', 'track', 'tag', 'remaining', 'due', 'carry', 'carrydue')
+
+    def __init__(self, stages: Iterator[ComposedArrays], count: int, image: pg.surface.Surface,
+                 track: Optional[Mover], tag: Optional[str], tick: int):
+        self.stages = stages
+        self.image = image
+        self.track = track
+        self.tag = tag
+        self.remaining = count  # 아직 생성하지 않은 총알 수
+        self.due = tick  # 다음 묶음을 내보낼 tick
+        self.carry: Optional[ComposedArrays] = None  # 예산이 모자라 남은 묶음
+        self.carrydue = tick
+
+
+class EmissionScheduler:
+    """탄막 총알의 생성을 여러 프레임에 나누고, 프레임당 생성 수를 제한한다.
+
+    BaseDanmaku.staged가 반환하는 묶음을 한 프레임에 하나씩 BulletPool에 생성한다.
+    모든 탄막의 생성 수를 합하여 프레임당 budget개를 넘지 않도록 하며, 남은 총알은 다음 프레임으로 미룬다.
+    예산 때문에 미뤄진 등속 총알은 늦어진 프레임 수만큼 앞으로 옮겨 생성하므로 탄막의 모양이 유지된다.
+    유도 총알은 미뤄진 위치에서 그대로 생성된다.
+
+    Attributes:
+        budget: 프레임당 최대 생성 수. 0일 경우 제한 없음
+        used: 이번 프레임에 생성한 총알 수
+        deferred: 예산 때문에 다음 프레임으로 미뤄진 총알 수의 누적값. 여러 프레임 미뤄지면 매번 센다.
+        peakframe: 한 프레임에 생성한 총알 수의 최댓값
+
+    """
+    def __init__(self, budget: int = ct.EMITBUDGET):
+        if budget < 0:
+            raise ValueError
+
+        self.budget = budget
+        self.used = 0
+        self.deferred = 0
+        self.peakframe = 0
+
+        self._queue: Deque[_Emission] = deque()
+
+    def __len__(self) -> int:
+        """아직 생성하지 않은 총알 수"""
+        return sum(e.remaining for e in self._queue)
+
+    def submit(self, pool: BulletPool, danmaku: BaseDanmaku,
+               track: Optional[Mover] = None, tag: Optional[str] = None) -> None:
+        """danmaku의 총알을 pool에 생성하도록 예약한다.
+
+        기다리는 탄막이 없으면 첫 묶음은 바로 생성한다. 묶음이 하나이고 예산 제한이 없으면
+        스케줄러를 거치지 않고 pool.spawn을 호출하는 것과 같다.
+
+        Args:
+            pool: 총알을 생성할 BulletPool
+            danmaku: 생성할 탄막
+            track: 유도할 대상의 Mover or None
+            tag: 총알을 쏜 패턴 이름 or None
+
+        """
+        if not self._queue and not self.budget and danmaku.nstages == 1:
+            pool.spawn(danmaku.positions, danmaku.velocities, danmaku.image, track, tag)
+            self.used += danmaku.N
+            return
+
+        entry = _Emission(danmaku.staged(), danmaku.N, danmaku.image, track, tag, pool.tick)
+        self._queue.append(entry)
+        if len(self._queue) == 1:
+            self._release(pool, entry)
+            if not entry.remaining:
+                self._queue.popleft()
+
+    def flush(self, pool: BulletPool) -> None:
+        """차례가 된 묶음을 예산 안에서 생성하고 프레임을 마친다. pool.update 전에 호출한다."""
+        for entry in list(self._queue):
+            if not self._release(pool, entry):
+                break
+
+        self._queue = deque(e for e in self._queue if e.remaining)
+
+        self.peakframe = max(self.peakframe, self.used)
+        self.used = 0
+
+    def _release(self, pool: BulletPool, entry: _Emission) -> bool:
+        """entry의 차례가 된 묶음을 생성한다. 예산을 다 쓰면 False를 반환한다."""
+        while True:
+            if entry.carry is None:
+                if entry.due > pool.tick:
+                    return True
+                entry.carry = next(entry.stages, None)
+                if entry.carry is None:
+                    entry.remaining = 0
+                    return True
+                entry.carrydue = entry.due
+                entry.due += 1
+
+            positions, velocities = entry.carry
+            k = len(positions)
+            room = k if not self.budget else min(k, self.budget - self.used)
+            if room <= 0:
+                return False
+
+            positions = positions[:room]
+            delay = pool.tick - entry.carrydue
+            if delay > 0 and entry.track is None:  # 늦어진 만큼 앞으로
+                positions = positions + velocities[:room] * delay
+
+            pool.spawn(positions, velocities[:room], entry.image, entry.track, entry.tag)
+            self.used += room
+            entry.remaining -= room
+
+            if room < k:
+                entry.carry = (entry.carry[0][room:], entry.carry[1][room:])
+                self.deferred += k - room
+                return False
+            entry.carry = None
+
+    def clear(self) -> None:
+        """예약된 모든 탄막을 버린다."""
+        self._queue.clear()
+        self.used = 0
+
+    def stats(self) -> Dict[str, int]:
+        """스케줄러 통계를 dict로 반환한다."""
+        return {'pending': len(self),
+                'budget': self.budget,
+                'deferred': self.deferred,
+                'peakframe': self.peakframe}
@@ -0,0 +1,154 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import time
+
+import numpy as np
+
+from . import constant as ct
+from .inputs import KEYBITS, mask_events
+from .observation import Observation, observe
+from .occupancy import OccupancyGrid
+from .simulation import Rules, Simulation
+
+ACTIONS: int = 1 << len(KEYBITS)  # 행동은 눌린 키의 bitmask(0 ~ ACTIONS - 1)이다.
+
+StepResult = Tuple[Observation, int, bool, Dict[str, Any]]
+
+
+class DanmakuEnv:
+    """Simulation을 gym 형태의 reset, step API로 감싼다.
+
+    행동은 inputs.KEYBITS 순서의 눌린 키 bitmask이며, 직전 행동과의 차이가 KEYDOWN, KEYUP 이벤트로 전달된다.
+    보상은 그 프레임의 점수 변화량이다.
+
+    Attributes:
+        nearest: 관측할 가까운 총알 수
+        danger: 관측에 포함할 위험도 지도의 반지름(칸). 0일 경우 포함하지 않는다.
+        rules: 게임 규칙
+        collision: 충돌 판정 방식
+        simulation: 진행 중인 게임. reset 전에는 None
+
+    """
+    def __init__(self, nearest: int = ct.OBSNEAREST, rules: Optional[Rules] = None,
+                 collision: str = ct.COLLISION, danger: int = 0):
+        if nearest < 0 or danger < 0:
+            raise ValueError
+
+        self.nearest = nearest
+        self.danger = danger
+        self.rules = rules or Rules()
+        self.collision = collision
+        self.simulation: Optional[Simulation] = None
+
+        self._keys = 0
+        self._grid = OccupancyGrid() if danger else None
+
+    def _observe(self, simulation: Simulation) -> Observation:
+        return observe(simulation, self.nearest, self._grid, self.danger)
+
+    def reset(self, seed: Optional[int] = None, difficulty: str = 'normal') -> Observation:
+        """새 게임을 시작하고 첫 관측을 반환한다."""
+        self.simulation = Simulation(difficulty, collision=self.collision, seed=seed,
+                                     rules=self.rules)
+        self._keys = 0
+        return self._observe(self.simulation)
+
+    def step(self, action: int) -> StepResult:
+        """action을 적용하여 게임을 1프레임 진행한다.
+
+        Returns:
+            (관측, 보상, 게임이 끝났는지 여부, 정보 dict)
+
+        Raises:
+            ValueError: action이 범위를 벗어나거나, reset 전이거나 끝난 게임에서 호출한 경우
+
+        """
+        sim = self.simulation
+        if sim is None or sim.done or not 0 <= action < ACTIONS:
+            raise ValueError
+
+        score = sim.score
+        running = sim.step(mask_events(self._keys, action))
+        self._keys = action
+        info = {'score': sim.score, 'frame': sim.totalframe}
+        return self._observe(sim), sim.score - score, not running, info
+
+
+class VectorEnv:
+    """DanmakuEnv n개를 한 프로세스에서 함께 진행한다.
+
+    관측은 Observation.stack으로 묶여 각 배열의 맨 앞 축이 게임을 나타낸다.
+    autoreset이 True일 경우 끝난 게임은 같은 난이도, 다음 시드(시드 + n)로 바로 다시 시작하며,
+    그 게임의 정보 dict에 'final_score'를 담고 새 게임의 첫 관측을 반환한다.
+
+    Attributes:
+        envs: DanmakuEnv list
+        autoreset: 끝난 게임을 자동으로 다시 시작할지 여부
+        steps: 모든 게임에서 진행한 프레임 수의 합
+        elapsed: step에 걸린 시간의 합(초)
+
+    """
+    def __init__(self, n: int, nearest: int = ct.OBSNEAREST, rules: Optional[Rules] = None,
+                 collision: str = ct.COLLISION, danger: int = 0, autoreset: bool = True):
+        if n < 1:
+            raise ValueError
+
+        self.envs = [DanmakuEnv(nearest, rules, collision, danger) for _ in range(n)]
+        self.autoreset = autoreset
+        self.steps = 0
+        self.elapsed = 0.0
+
+        self._seeds: List[Optional[int]] = [None] * n
+        self._difficulty = 'normal'
+
+    def __len__(self) -> int:
+        return len(self.envs)
+
+    def reset(self, seeds: Optional[Sequence[Optional[int]]] = None,
+              difficulty: str = 'normal') -> Observation:
+        """모든 게임을 새로 시작한다. seeds가 None이면 무작위 시드를 사용한다.
+
+        Raises:
+            ValueError: seeds의 길이가 게임 수와 다른 경우
+
+        """
+        if seeds is not None and len(seeds) != len(self.envs):
+            raise ValueError
+
+        self._seeds = list(seeds) if seeds is not None else [None] * len(self.envs)
+        self._difficulty = difficulty
+        return Observation.stack([env.reset(seed, difficulty)
+                                  for env, seed in zip(self.envs, self._seeds)])
+
+    def step(self, actions: Sequence[int]) -> Tuple[Observation, np.ndarray, np.ndarray,
+                                                    List[Dict[str, Any]]]:
+        """모든 게임을 1프레임 진행한다.
+
+        Returns:
+            (묶인 관측, 보상 배열, 끝남 여부 배열, 정보 dict list)
+
+        Raises:
+            ValueError: actions의 길이가 게임 수와 다른 경우
+
+        """
+        if len(actions) != len(self.envs):
+            raise ValueError
+
+        start = time.perf_counter()
+        observations: List[Observation] = []
+        rewards = np.zeros(len(self.envs), dtype=np.int64)
+        dones = np.zeros(len(self.envs), dtype=bool)
+        infos: List[Dict[str, Any]] = []
+        for i, (env, action) in enumerate(zip(self.envs, actions)):
+            observation, rewards[i], dones[i], info = env.step(int(action))
+            if dones[i] and self.autoreset:
+                info['final_score'] = info['score']
+                seed = self._seeds[i]
+                self._seeds[i] = None if seed is None else seed + len(self.envs)
+                observation = env.reset(self._seeds[i], self._difficulty)
+            observations.append(observation)
+            infos.append(info)
+
+        self.steps += len(self.envs)
+        self.elapsed += time.perf_counter() - start
+        return Observation.stack(observations), rewards, dones, infos
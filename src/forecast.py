@@ -0,0 +1,154 @@
+from __future__ import annotations
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from . import constant as ct
+from .inputs import IdleInput, InputSource
+from .simulation import Rules, Simulation
+
+
+class SpawnEvent(NamedTuple):
+    """enemychoose가 적을 생성한 프레임 하나이다.
+
+    Attributes:
+        frame: 프레임 번호(1부터 시작)
+        names: 생성된 패턴 이름들
+
+    """
+    frame: int
+    names: Tuple[str, ...]
+
+
+class Forecast(NamedTuple):
+    """한 시드, 한 난이도에 대한 프레임별 탄막 총알 수 예측이다.
+
+    배열의 i번째 값은 i + 1번째 프레임이 끝난 뒤의 값이다.
+
+    Attributes:
+        diff: 난이도
+        seed: 시드
+        live: 프레임이 끝난 뒤 살아있는 탄막 총알 수
+        high: 프레임 안에서 살아있던 탄막 총알 수의 최댓값. 경계를 벗어난 총알이 제거되기 전의 값이다.
+        spawned: 그 프레임에 생성된 탄막 총알 수
+        enemies: 살아있는 적 수
+        spawns: 적 생성 list
+        patterns: 패턴 이름을 key로, 그 패턴이 쏜 총알이 한 프레임에 가장 많이 살아있던 수를 value로 하는 dict
+
+    """
+    diff: str
+    seed: int
+    live: np.ndarray
+    high: np.ndarray
+    spawned: np.ndarray
+    enemies: np.ndarray
+    spawns: List[SpawnEvent]
+    patterns: Dict[str, int]
+
+    @property
+    def frames(self) -> int:
+        return len(self.live)
+
+    @property
+    def peak(self) -> int:
+        """BulletPool이 동시에 담아야 했던 총알 수의 최댓값"""
+        return int(self.high.max(initial=0))
+
+    @property
+    def peakframe(self) -> int:
+        """peak에 처음으로 도달한 프레임"""
+        return int(self.high.argmax()) + 1 if len(self.high) else 0
+
+    def bursts(self, threshold: int) -> List[Tuple[int, int]]:
+        """한 프레임에 threshold개 이상 생성된 (프레임, 생성 수) list를 반환한다."""
+        frames = np.flatnonzero(self.spawned >= threshold)
+        return [(int(i) + 1, int(self.spawned[i])) for i in frames]
+
+    def capacity(self) -> int:
+        """BulletPool이 게임 중 크기를 바꾸지 않도록 처음부터 할당할 용량을 반환한다."""
+        return capacity_hint(self.peak)
+
+    def summary(self) -> Dict[str, Any]:
+        """JSON으로 저장할 수 있는 dict를 반환한다."""
+        return {'diff': self.diff,
+                'seed': self.seed,
+                'frames': self.frames,
+                'peak': self.peak,
+                'peakframe': self.peakframe,
+                'capacity': self.capacity(),
+                'patterns': self.patterns,
+                'spawns': [[e.frame, list(e.names)] for e in self.spawns],
+                'live': self.live.tolist(),
+                'high': self.high.tolist(),
+                'spawned': self.spawned.tolist(),
+                'enemies': self.enemies.tolist()}
+
+
+def capacity_hint(peak: int, base: int = ct.POOLCAPACITY) -> int:
+    """peak개의 총알을 담을 수 있는, base에서 두 배씩 늘린 용량 중 가장 작은 것을 반환한다.
+
+    BulletPool은 용량이 모자라면 두 배로 늘리므로, 이 값으로 시작하면 같은 부하에서 한 번도 늘리지 않는다.
+
+    """
+    capacity = base
+    while capacity < peak:
+        capacity *= 2
+    return capacity
+
+
+def forecast(diff: str, seed: int, inputsource: Optional[InputSource] = None,
+             rules: Optional[Rules] = None, collision: str = ct.COLLISION) -> Forecast:
+    """diff 난이도, seed 시드의 게임을 화면 없이 진행하여 프레임별 탄막 총알 수를 기록한다.
+
+    적 생성 일정과 패턴의 랜덤 위치는 같은 난수 생성기를 공유하고, 적이 격추되는 순서에 따라 이후의 생성이
+    달라지므로, 입력까지 같은 게임을 Simulation과 BulletPool로 그대로 진행하여 정확히 같은 부하를 얻는다.
+
+    Args:
+        diff: 난이도
+        seed: 시드
+        inputsource: 플레이어 입력 or None(IdleInput)
+        rules: 게임 규칙
+        collision: 충돌 판정 방식. 격추 순서가 바뀌므로 게임과 같은 방식을 사용해야 한다.
+
+    """
+    sim = Simulation(diff, collision=collision, seed=seed, rules=rules)
+    inputsource = inputsource or IdleInput()
+
+    pool = sim.danmakugroup.pool
+    enemygroup = sim.groupdict['enemy']
+    live: List[int] = []
+    high: List[int] = []
+    spawned: List[int] = []
+    enemies: List[int] = []
+    spawns: List[SpawnEvent] = []
+    patterns: Dict[str, int] = dict()
+
+    before = set(enemygroup)
+    while True:
+        count = pool.spawned
+        pool.peak = pool.n  # 이번 프레임 안에서의 최댓값을 얻기 위해
+        if not sim.step(inputsource(sim)):
+            break
+
+        current = set(enemygroup)
+        if sim.frame == 0:  # 이번 프레임에 enemychoose가 실행됨
+            spawns.append(SpawnEvent(sim.totalframe, tuple(sorted(
+                getattr(e, 'tag', None) or 'unknown' for e in current - before))))
+        before = current
+
+        live.append(pool.n)
+        high.append(pool.peak)
+        spawned.append(pool.spawned - count)
+        enemies.append(len(enemygroup))
+        if pool.n:
+            tags = np.bincount(pool.tag[:pool.n] + 1)  # -1은 태그 없음
+            for index in np.flatnonzero(tags):
+                name = pool.tags[index - 1] if index else 'unknown'
+                patterns[name] = max(patterns.get(name, 0), int(tags[index]))
+
+    return Forecast(diff, seed,
+                    live=np.array(live, dtype=np.int64),
+                    high=np.array(high, dtype=np.int64),
+                    spawned=np.array(spawned, dtype=np.int64),
+                    enemies=np.array(enemies, dtype=np.int64),
+                    spawns=spawns, patterns=patterns)
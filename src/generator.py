@@ -1,11 +1,12 @@
 from __future__ import annotations
-from typing import Any, Callable, Tuple, List
+from typing import Any, Callable, Tuple, List, Optional
 
 import pygame as pg
 
 from .mover import Mover
 from .element import Element
 from .basedanmaku import BaseDanmaku
+from .sound import SoundBank
 
 
 class Generator(Element):
@@ -19,27 +20,33 @@ class Generator(Element):
         image: 총알을 렌더링할 이미지
         group: 생성될 스프라이트가 포함될 그룹
         danmaku: 탄막 생성 주기와 생성 함수를 포함하는 list
+        soundbank: 파괴될 때 효과음을 재생할 SoundBank or None(소리 없음)
+        tag: 이 적을 만든 패턴 이름 or None. 생성한 총알에 전달된다.
 
     """
     def __init__(self, mover: Mover, image: pg.Surface,
                  group: pg.sprite.Group,
-                 danmaku: List[Tuple[int, Callable[[Tuple[int, int]], BaseDanmaku]]]) -> None:
+                 danmaku: List[Tuple[int, Callable[[Tuple[int, int]], BaseDanmaku]]],
+                 soundbank: Optional[SoundBank] = None) -> None:
         super().__init__(mover, image)
 
         self.group = group
         self.danmaku = danmaku
+        self.soundbank = soundbank
+        self.tag: Optional[str] = None
 
     def update(self, *args: Any, **kwargs: Any) -> None:
         super().update(*args, **kwargs)
 
         for ref, gen in self.danmaku:
             if ref > 0 and self._frame % ref == 0:
-                self.group.add(*gen(self.mover.pos.as_trimmed_tuple()))
+                gen(self.mover.pos.as_trimmed_tuple()).emit(self.group, self.tag)
 
     def kill(self) -> None:
         for ref, gen in self.danmaku:
             if ref == -1:
-                self.group.add(*gen(self.mover.pos.as_trimmed_tuple()))
-                pg.mixer.Sound.play(pg.mixer.Sound('audio/matched.wav'))
+                gen(self.mover.pos.as_trimmed_tuple()).emit(self.group, self.tag)
+                if self.soundbank is not None:
+                    self.soundbank.play('matched')
 
         super().kill()
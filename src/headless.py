@@ -0,0 +1,99 @@
+from __future__ import annotations
+from typing import List, NamedTuple, Optional
+import os
+import time
+
+import numpy as np
+
+from . import constant as ct
+from .inputs import InputSource, IdleInput
+from .simulation import Simulation
+from .profiler import FrameProfiler
+
+
+class HeadlessReport(NamedTuple):
+    """헤드리스 실행 결과이다.
+
+    Attributes:
+        diff: 난이도
+        score: 최종 점수
+        frames: 시뮬레이션한 프레임 수
+        elapsed: 시뮬레이션에 걸린 시간(초)
+        frametimes: 프레임별 소요 시간(초)
+
+    """
+    diff: str
+    score: int
+    frames: int
+    elapsed: float
+    frametimes: List[float]
+
+    @property
+    def fps(self) -> float:
+        """초당 시뮬레이션한 프레임 수"""
+        return self.frames / self.elapsed if self.elapsed else float('inf')
+
+    def percentile(self, q: float) -> float:
+        """프레임 소요 시간의 q 백분위수(ms)를 반환한다."""
+        if not self.frametimes:
+            return 0.0
+        return float(np.percentile(self.frametimes, q)) * 1000
+
+    def format(self) -> str:
+        """사람이 읽을 수 있는 형태의 문자열을 반환한다."""
+        return (f"{self.diff}: score {self.score}, {self.frames} frames in {self.elapsed:.2f}s "
+                f"({self.fps:.0f} fps)\n"
+                f"frame time p50 {self.percentile(50):.3f}ms, p90 {self.percentile(90):.3f}ms, "
+                f"p99 {self.percentile(99):.3f}ms, max {self.percentile(100):.3f}ms")
+
+
+def init_headless() -> None:
+    """화면과 소리 출력 없이 pygame을 사용하도록 설정한다.
+
+    Simulation은 pygame subsystem 없이 동작하므로 아무것도 초기화하지 않는다.
+    이후 subsystem을 초기화하더라도 화면과 소리 장치를 열지 않도록 dummy 드라이버를 지정한다.
+
+    """
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+
+def run_headless(diff: str, inputsource: Optional[InputSource] = None,
+                 collision: str = ct.COLLISION,
+                 maxframes: Optional[int] = None,
+                 seed: Optional[int] = None,
+                 profiler: Optional[FrameProfiler] = None) -> HeadlessReport:
+    """프레임 제한 없이 게임 한 판을 시뮬레이션한다.
+
+    init_headless 등으로 pygame이 초기화되어 있어야 한다.
+
+    Args:
+        diff: 난이도
+        inputsource: 플레이어 입력을 공급하는 InputSource. None일 경우 입력하지 않는다.
+        collision: 충돌 판정 방식
+        maxframes: 최대 프레임 수. None일 경우 게임이 끝날 때까지 진행한다.
+        seed: 난수 생성기의 시드 or None(무작위)
+        profiler: 구간별 시간을 기록할 FrameProfiler or None
+
+    Returns:
+        실행 결과
+
+    """
+    inputsource = inputsource or IdleInput()
+    profiler = profiler or FrameProfiler(enabled=False)
+    simulation = Simulation(diff, collision=collision, seed=seed, profiler=profiler)
+
+    frametimes: List[float] = []
+    clock = time.perf_counter
+    start = clock()
+    while maxframes is None or simulation.totalframe < maxframes:
+        begin = clock()
+        profiler.begin_frame()
+        running = simulation.step(inputsource(simulation))
+        profiler.end_frame(simulation.groupdict)
+        frametimes.append(clock() - begin)
+        if not running:
+            break
+    elapsed = clock() - start
+
+    return HeadlessReport(diff, simulation.score, len(frametimes), elapsed, frametimes)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+from typing import Final, List, Sequence, Tuple
+import math
+
+import numpy as np
+
+NEVER: Final[int] = np.iinfo(np.int64).max // 4  # 경계를 벗어나지 않는 경우의 프레임
+
+
+def position_at(pos: Sequence[float], vel: Sequence[float], acc: Sequence[float],
+                frame: int) -> Tuple[float, float]:
+    """매 프레임 vel += acc, pos += vel 순서로 움직이는 물체의 frame 프레임 후 위치를 반환한다.
+
+    pos(t) = pos + vel * t + acc * t(t+1)/2
+
+    """
+    k = frame * (frame + 1) / 2
+    return (pos[0] + vel[0] * frame + acc[0] * k,
+            pos[1] + vel[1] * frame + acc[1] * k)
+
+
+def _in_bound(p: Tuple[float, float], width: float, height: float, margin: float) -> bool:
+    return margin <= p[0] <= width - margin and margin <= p[1] <= height - margin
+
+
+def exit_frame(pos: Sequence[float], vel: Sequence[float], acc: Sequence[float],
+               width: float, height: float, margin: float = 0.0) -> int:
+    """position_at에 의한 위치가 처음으로 [0, width] x [0, height]를 벗어나는 프레임(1 이상)을 반환한다.
+
+    각 성분이 경계값과 같아지는 시각(2차 방정식의 근)에서만 경계 안팎이 바뀌므로,
+    그 주변의 정수 프레임만 position_at으로 확인한다.
+
+    Args:
+        pos: 초기 위치
+        vel: 초기 속도
+        acc: 가속도
+        width: 경계의 너비
+        height: 경계의 높이
+        margin: 0보다 클 경우 경계를 안쪽으로 margin만큼 좁혀, 경계에 margin보다 가까워지는 프레임을 구한다.
+
+    Returns:
+        처음으로 경계를 벗어나는 프레임. 벗어나지 않을 경우 NEVER
+
+    """
+    candidates: List[int] = [1]
+    for axis, bound in ((0, width), (1, height)):
+        a = acc[axis] / 2
+        b = vel[axis] + acc[axis] / 2
+        for c in (pos[axis] - margin, pos[axis] - bound + margin):
+            roots: List[float] = []
+            if a == 0:
+                if b != 0:
+                    roots.append(-c / b)
+            else:
+                disc = b * b - 4 * a * c
+                if disc >= 0:
+                    sq = math.sqrt(disc)
+                    roots += [(-b - sq) / (2 * a), (-b + sq) / (2 * a)]
+
+            for root in roots:
+                if root < NEVER:
+                    base = math.floor(root)
+                    candidates += [t for t in (base, base + 1, base + 2) if t >= 1]
+
+    for t in sorted(set(candidates)):
+        if not _in_bound(position_at(pos, vel, acc, t), width, height, margin):
+            return t
+    return NEVER
+
+
+def positions_at(pos: np.ndarray, vel: np.ndarray, frame: np.ndarray) -> np.ndarray:
+    """등속운동하는 물체들의 frame 프레임 후 위치 (N, 2)를 반환한다."""
+    return pos + vel * frame[:, None]
+
+
+def exit_frames(pos: np.ndarray, vel: np.ndarray, width: float, height: float,
+                margin: float = 0.0) -> np.ndarray:
+    """등속운동하는 물체들이 positions_at에 의해 처음으로 경계를 벗어나는 프레임(1 이상)을 반환한다.
+
+    경계 안에 있는 구간은 하나의 구간이므로, 성분별로 구한 근사값을 positions_at으로 확인하며 보정한다.
+
+    Args:
+        pos: 초기 위치 (N, 2)
+        vel: 속도 (N, 2)
+        width: 경계의 너비
+        height: 경계의 높이
+        margin: 0보다 클 경우 경계를 안쪽으로 margin만큼 좁혀, 경계에 margin보다 가까워지는 프레임을 구한다.
+
+    Returns:
+        프레임의 배열 (N,). 벗어나지 않을 경우 NEVER
+
+    """
+    def outside(t: np.ndarray) -> np.ndarray:
+        p = positions_at(pos, vel, t)
+        return ~((margin <= p[:, 0]) & (p[:, 0] <= width - margin)
+                 & (margin <= p[:, 1]) & (p[:, 1] <= height - margin))
+
+    high = np.array([width - margin, height - margin], dtype=np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.where(vel > 0, np.floor((high - pos) / vel) + 1,
+                     np.where(vel < 0, np.floor((pos - margin) / -vel) + 1, np.inf))
+    t = t.min(axis=1)
+    finite = t < NEVER  # float로 바꾼 NEVER는 NEVER보다 커지므로 정수로 따로 채움
+    t = np.where(finite, np.maximum(t, 1), 1).astype(np.int64)
+    t[~finite] = NEVER
+
+    first = np.ones(len(pos), dtype=np.int64)
+    t = np.where(outside(first), first, t)
+
+    finite = t < NEVER
+    for _ in range(4):  # 부동소수점 오차 보정
+        late = finite & (t > 1) & outside(np.maximum(t - 1, 1))
+        early = finite & ~outside(t)
+        if not late.any() and not early.any():
+            break
+        t = np.where(late, t - 1, np.where(early, t + 1, t))
+
+    return t
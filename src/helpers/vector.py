@@ -1,99 +1,142 @@
 from __future__ import annotations
-from typing import Tuple, Union, Sequence, Iterator
+from typing import Tuple, Union, Sequence, Iterator, List
 import math
 
+import numpy as np
+
 
 class Vector:
-    """일반적인 벡터 연산을 위한 객체이다.
+    """2차원 벡터 연산을 위한 객체이다.
+
+    성분을 list 대신 두 개의 slot에 저장하며, +=, -=, *=, /= 연산은 새 객체를 만들지 않고 자신을 수정한다.
+    같음과 hash는 성분값으로 정해지므로, set이나 dict의 key로 넣은 벡터에는 제자리 연산을 사용하면 안 된다.
 
     Attributes:
-        data: 벡터의 성분값을 가진 list
-        dimension: 벡터의 차원
-    
+        x: 벡터의 첫째 성분
+        y: 벡터의 둘째 성분
+
     """
+    __slots__ = ('x', 'y')
+
+    dimension: int = 2
 
     def __init__(self, *arg: float):
-        self.data = [*arg]
-        self.dimension = len(self.data)
+        if len(arg) != 2:  # 2차원 벡터만 지원
+            raise ValueError
+
+        self.x, self.y = arg
+
+    @property
+    def data(self) -> List[float]:
+        """벡터의 성분값을 가진 list"""
+        return [self.x, self.y]
 
     def __getitem__(self, key: int) -> float:
         """self.data[key]를 반환한다."""
-        return self.data[key]
+        return (self.x, self.y)[key]
 
     def __setitem__(self, key: int, item: float) -> None:
         """self.data[key] = item"""
-        self.data[key] = item
+        if key in (0, -2):
+            self.x = item
+        elif key in (1, -1):
+            self.y = item
+        else:
+            raise IndexError
 
     def __iter__(self) -> Iterator[float]:
-        """self.data의 iterator를 그대로 반환한다."""
-        return self.data.__iter__()
+        """성분의 iterator를 반환한다."""
+        return iter((self.x, self.y))
 
     def __len__(self) -> int:
-        """len(self.data)"""
-        return len(self.data)
+        return 2
+
+    def __repr__(self) -> str:
+        return f'Vector({self.x!r}, {self.y!r})'
+
+    def __eq__(self, rhs: object) -> bool:
+        if not isinstance(rhs, Vector):
+            return NotImplemented
+        return self.x == rhs.x and self.y == rhs.y
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
+    def copy(self) -> Vector:
+        """같은 성분을 가진 새 벡터를 반환한다."""
+        return Vector(self.x, self.y)
 
     def __add__(self, rhs: Vector) -> Vector:
         """self + rhs"""
         if not isinstance(rhs, Vector):
             raise TypeError
-
-        if self.dimension != rhs.dimension:
-            raise ValueError
-
-        return Vector(*map(lambda t: t[0] + t[1], zip(self, rhs)))
+        return Vector(self.x + rhs.x, self.y + rhs.y)
 
     def __iadd__(self, rhs: Vector) -> Vector:
-        return self.__add__(rhs)
+        """self += rhs (제자리 연산)"""
+        if not isinstance(rhs, Vector):
+            raise TypeError
+        self.x += rhs.x
+        self.y += rhs.y
+        return self
 
     def __sub__(self, rhs: Vector) -> Vector:
         """self - rhs"""
         if not isinstance(rhs, Vector):
             raise TypeError
-
-        if self.dimension != rhs.dimension:
-            raise ValueError
-
-        return Vector(*map(lambda t: t[0] - t[1], zip(self, rhs)))
+        return Vector(self.x - rhs.x, self.y - rhs.y)
 
     def __isub__(self, rhs: Vector) -> Vector:
-        return self.__sub__(rhs)
+        """self -= rhs (제자리 연산)"""
+        if not isinstance(rhs, Vector):
+            raise TypeError
+        self.x -= rhs.x
+        self.y -= rhs.y
+        return self
 
     def __abs__(self) -> float:
         """유클리드 Norm에 의한 원점과의 거리를 반환한다."""
-        return sum(map(lambda x: x**2, self))**0.5
+        return math.hypot(self.x, self.y)
 
     def __mul__(self, rhs: Union[int, float]) -> Vector:
         """self의 각 성분에 rhs(실수)를 곱하여 반환한다."""
         if not isinstance(rhs, (int, float)):
             raise TypeError
+        return Vector(self.x * rhs, self.y * rhs)
 
-        return Vector(*map(lambda x: x*rhs, self))
+    def __imul__(self, rhs: Union[int, float]) -> Vector:
+        """self *= rhs (제자리 연산)"""
+        if not isinstance(rhs, (int, float)):
+            raise TypeError
+        self.x *= rhs
+        self.y *= rhs
+        return self
 
     def __truediv__(self, rhs: Union[int, float]) -> Vector:
         """self의 각 성분을 rhs(실수)로 나누어 반환한다."""
         if not isinstance(rhs, (int, float)):
             raise TypeError
-        return Vector(*map(lambda x: x/rhs, self))
+        return Vector(self.x / rhs, self.y / rhs)
+
+    def __itruediv__(self, rhs: Union[int, float]) -> Vector:
+        """self /= rhs (제자리 연산)"""
+        if not isinstance(rhs, (int, float)):
+            raise TypeError
+        self.x /= rhs
+        self.y /= rhs
+        return self
 
     def __matmul__(self, rhs: Vector) -> float:
         """self와 rhs를 내적하여 반환한다."""
         if not isinstance(rhs, Vector):
             raise TypeError
-
-        if len(self) != len(rhs):
-            raise ValueError
-
-        ret: float = 0
-        for i, el in enumerate(self):
-            ret += (el * rhs[i])
-
-        return ret
+        return self.x * rhs.x + self.y * rhs.y
 
     def ccw(self, rhs: Vector) -> float:
-        """self와 rhs를 외적하여 반환한다. 3차원 이상일 경우 앞 2개 성분만 고려한다."""
+        """self와 rhs를 외적하여 반환한다."""
         if not isinstance(rhs, Vector):
             raise TypeError
-        return self[0]*rhs[1] - self[1]*rhs[0]
+        return self.x * rhs.y - self.y * rhs.x
 
     def normalize(self) -> Vector:
         """self / abs(self)"""
@@ -101,22 +144,143 @@ class Vector:
 
     def as_tuple(self) -> Sequence[float]:
         """벡터의 성분을 담은 tuple을 반환한다."""
-        return tuple(self)
+        return (self.x, self.y)
 
     def as_trimmed_tuple(self) -> Tuple[int, int]:
-        """벡터의 앞 두 성분만 담은 tuple을 반환한다."""
-        return (int(self[0]), int(self[1]))
+        """벡터의 성분을 정수로 자른 tuple을 반환한다."""
+        return (int(self.x), int(self.y))
 
     def get_theta(self) -> float:
-        """앞 2개 성분만 고려하여, 2차원 평면 상의 벡터의 편각을 반환한다."""
-        return math.atan2(self[1], self[0])
+        """2차원 평면 상의 벡터의 편각을 반환한다."""
+        return math.atan2(self.y, self.x)
 
     def rotate(self, deg: float) -> Vector:
-        """앞 2개 성분만 고려하여, 2차원 평면 상에서 벡터를 deg만큼 회전하여 반환한다."""
-        def _get_hat(theta: float) -> Vector:
-            return Vector(math.cos(theta), math.sin(theta))
+        """2차원 평면 상에서 벡터를 deg만큼 회전하여 반환한다."""
+        return getHat(self.get_theta() + deg) * abs(self)
+
+
+class VectorArray:
+    """2차원 벡터 여러 개에 대한 연산을 한꺼번에 수행하는 객체이다.
+
+    Vector와 같은 연산을 (N, 2) 크기의 NumPy 배열 위에서 수행한다.
+    스칼라 대신 길이 N의 배열을 곱하거나 나눌 수도 있다.
+
+    Attributes:
+        data: 벡터의 성분값을 가진 (N, 2) 배열
+
+    """
+    __slots__ = ('data',)
+
+    def __init__(self, data: Union[np.ndarray, Sequence[Sequence[float]]]):
+        arr = np.asarray(data, dtype=np.float64)
+        if arr.ndim != 2 or arr.shape[1] != 2:
+            raise ValueError
+
+        self.data = arr
+
+    @classmethod
+    def zeros(cls, N: int) -> VectorArray:
+        """영벡터 N개로 이루어진 VectorArray를 반환한다."""
+        return cls(np.zeros((N, 2)))
+
+    @classmethod
+    def from_theta(cls, theta: np.ndarray) -> VectorArray:
+        """편각 배열 theta에 대한 단위벡터 배열을 반환한다."""
+        return cls(np.stack((np.cos(theta), np.sin(theta)), axis=1))
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.data[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.data[:, 1]
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, key: int) -> Vector:
+        """key번째 벡터를 Vector로 반환한다."""
+        x, y = self.data[key].tolist()
+        return Vector(x, y)
+
+    def __iter__(self) -> Iterator[Vector]:
+        return (Vector(x, y) for x, y in self.data.tolist())
+
+    @staticmethod
+    def _operand(rhs: Union[VectorArray, Vector]) -> np.ndarray:
+        if isinstance(rhs, VectorArray):
+            return rhs.data
+        if isinstance(rhs, Vector):
+            return np.array((rhs.x, rhs.y))
+        raise TypeError
+
+    @staticmethod
+    def _scalar(rhs: Union[int, float, np.ndarray]) -> Union[float, np.ndarray]:
+        if isinstance(rhs, np.ndarray):
+            return rhs.reshape(-1, 1)
+        if isinstance(rhs, (int, float)):
+            return rhs
+        raise TypeError
+
+    def __add__(self, rhs: Union[VectorArray, Vector]) -> VectorArray:
+        return VectorArray(self.data + self._operand(rhs))
+
+    def __iadd__(self, rhs: Union[VectorArray, Vector]) -> VectorArray:
+        self.data += self._operand(rhs)
+        return self
+
+    def __sub__(self, rhs: Union[VectorArray, Vector]) -> VectorArray:
+        return VectorArray(self.data - self._operand(rhs))
+
+    def __isub__(self, rhs: Union[VectorArray, Vector]) -> VectorArray:
+        self.data -= self._operand(rhs)
+        return self
+
+    def __mul__(self, rhs: Union[int, float, np.ndarray]) -> VectorArray:
+        return VectorArray(self.data * self._scalar(rhs))
+
+    def __imul__(self, rhs: Union[int, float, np.ndarray]) -> VectorArray:
+        self.data *= self._scalar(rhs)
+        return self
+
+    def __truediv__(self, rhs: Union[int, float, np.ndarray]) -> VectorArray:
+        return VectorArray(self.data / self._scalar(rhs))
+
+    def __itruediv__(self, rhs: Union[int, float, np.ndarray]) -> VectorArray:
+        self.data /= self._scalar(rhs)
+        return self
+
+    def __abs__(self) -> np.ndarray:
+        """각 벡터의 유클리드 Norm을 담은 배열을 반환한다."""
+        return np.hypot(self.data[:, 0], self.data[:, 1])
+
+    def __matmul__(self, rhs: Union[VectorArray, Vector]) -> np.ndarray:
+        """각 벡터와 rhs를 내적한 값을 담은 배열을 반환한다."""
+        other = self._operand(rhs)
+        return self.data[:, 0] * other[..., 0] + self.data[:, 1] * other[..., 1]
+
+    def ccw(self, rhs: Union[VectorArray, Vector]) -> np.ndarray:
+        """각 벡터와 rhs를 외적한 값을 담은 배열을 반환한다."""
+        other = self._operand(rhs)
+        return self.data[:, 0] * other[..., 1] - self.data[:, 1] * other[..., 0]
+
+    def normalize(self) -> VectorArray:
+        return self / abs(self)
+
+    def get_theta(self) -> np.ndarray:
+        """각 벡터의 편각을 담은 배열을 반환한다."""
+        return np.arctan2(self.data[:, 1], self.data[:, 0])
+
+    def rotate(self, deg: Union[float, np.ndarray]) -> VectorArray:
+        """각 벡터를 deg만큼 회전하여 반환한다."""
+        c, s = np.cos(deg), np.sin(deg)
+        x, y = self.data[:, 0], self.data[:, 1]
+        return VectorArray(np.stack((x * c - y * s, x * s + y * c), axis=1))
 
-        return _get_hat(self.get_theta() + deg) * abs(self)
+    def as_trimmed_array(self) -> np.ndarray:
+        """성분을 정수로 자른 (N, 2) 배열을 반환한다."""
+        return self.data.astype(np.int64)
 
 
 Coordinate = Union[Vector, Tuple[float, float]]  # 순서쌍 종류
@@ -130,7 +294,7 @@ def parseVector(cor: Coordinate) -> Vector:
     if not isinstance(cor, (Vector, tuple)):
         raise TypeError
 
-    return Vector(*cor)
+    return Vector(cor[0], cor[1])
 
 
 def getHat(theta: float) -> Vector:
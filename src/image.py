@@ -1,17 +1,45 @@
 from __future__ import annotations
-from typing import Tuple
+from typing import ClassVar, Dict, Tuple
 
 import pygame as pg
 
 class BlockImage(pg.Surface):
     """기본적인 직사각형 이미지를 나타낸다.
 
+    화면이 설정되어 있을 경우 화면과 같은 픽셀 형식으로 생성되어, 그릴 때 변환이 일어나지 않는다.
+
     Attributes:
         width: 직사각형의 너비
         height: 직사각형의 높이
         color: 직사각형의 색상
 
     """
+    _cache: ClassVar[Dict[Tuple[int, int, Tuple[int, ...]], BlockImage]] = dict()
+
     def __init__(self, width: int, height: int, color: Tuple[int, int, int]):
-        super().__init__([width, height])
+        display = pg.display.get_surface()
+        if display is None:
+            super().__init__([width, height])
+        else:
+            super().__init__([width, height], 0, display)  # 화면의 픽셀 형식을 따름
         self.fill(color)
+        self.color = color
+
+    @classmethod
+    def shared(cls, width: int, height: int, color: Tuple[int, int, int]) -> BlockImage:
+        """(width, height, color)마다 한 번만 생성하여 공유하는 BlockImage를 반환한다.
+
+        Args:
+            width: 직사각형의 너비
+            height: 직사각형의 높이
+            color: 직사각형의 색상
+
+        Returns:
+            공유되는 BlockImage 객체
+
+        """
+        key = (width, height, tuple(color))
+        ret = cls._cache.get(key)
+        if ret is None:
+            ret = cls._cache[key] = cls(width, height, color)
+        return ret
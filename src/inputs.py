@@ -0,0 +1,118 @@
+from __future__ import annotations
+from typing import Dict, List, Sequence, TYPE_CHECKING
+import abc
+import random
+
+import pygame as pg
+
+from . import constant as ct
+from .bot import DodgeBot
+from .observation import observe
+
+if TYPE_CHECKING:
+    from .simulation import Simulation
+
+
+ARROWS: Sequence[int] = (pg.K_UP, pg.K_LEFT, pg.K_DOWN, pg.K_RIGHT)
+KEYBITS: Sequence[int] = (*ARROWS, pg.K_LSHIFT)  # 키 상태 bitmask의 i번째 비트가 나타내는 키
+
+
+def mask_events(previous: int, current: int) -> List[pg.event.Event]:
+    """눌린 키의 bitmask가 previous에서 current로 바뀔 때 발생하는 이벤트 list를 반환한다.
+
+    뗀 키의 KEYUP을 먼저, 누른 키의 KEYDOWN을 나중에, 각각 KEYBITS 순서로 반환한다.
+    EventMover는 LShift가 눌린 동안 방향키가 바뀌면 느린 속도를 고려하지 않으므로,
+    LShift가 눌려 있던 상태에서 키가 바뀌면 LShift를 가장 먼저 떼고, 계속 눌려 있다면 마지막에 다시 누른다.
+
+    Args:
+        previous: 직전 프레임에 눌려 있던 키의 bitmask
+        current: 이번 프레임에 눌려 있는 키의 bitmask
+
+    """
+    shift = 1 << KEYBITS.index(pg.K_LSHIFT)
+    if previous != current and previous & shift:
+        previous &= ~shift
+        events = [pg.event.Event(pg.KEYUP, key=pg.K_LSHIFT)]
+    else:
+        events = []
+
+    events += [pg.event.Event(pg.KEYUP, key=key) for i, key in enumerate(KEYBITS)
+               if previous >> i & 1 and not current >> i & 1]
+    events += [pg.event.Event(pg.KEYDOWN, key=key) for i, key in enumerate(KEYBITS)
+               if current >> i & 1 and not previous >> i & 1]
+    return events
+
+
+class InputSource:
+    """pg.event.get() 대신 Simulation에 이벤트를 공급하는 객체의 추상 클래스이다."""
+    @abc.abstractmethod
+    def __call__(self, simulation: Simulation) -> List[pg.event.Event]:
+        """simulation의 다음 프레임에 전달할 이벤트 list를 반환한다."""
+
+
+class IdleInput(InputSource):
+    """아무 입력도 하지 않는다."""
+    def __call__(self, simulation: Simulation) -> List[pg.event.Event]:
+        return []
+
+
+class ScriptedInput(InputSource):
+    """미리 정해진 프레임에 정해진 이벤트를 공급한다.
+
+    Attributes:
+        schedule: 프레임 번호(1부터 시작)를 key로, 이벤트 list를 value로 하는 dict
+
+    """
+    def __init__(self, schedule: Dict[int, List[pg.event.Event]]):
+        self.schedule = schedule
+
+    def __call__(self, simulation: Simulation) -> List[pg.event.Event]:
+        return self.schedule.get(simulation.totalframe + 1, [])
+
+
+class RandomInput(InputSource):
+    """방향키를 무작위로 누르고 떼는 간단한 자동 플레이어이다.
+
+    Attributes:
+        rng: 난수 생성기
+        hold: 한 방향을 유지하는 프레임 수
+
+    """
+    def __init__(self, seed: int = 0, hold: int = 20):
+        self.rng = random.Random(seed)
+        self.hold = hold
+        self._pressed: List[int] = []
+
+    def __call__(self, simulation: Simulation) -> List[pg.event.Event]:
+        if (simulation.totalframe + 1) % self.hold:
+            return []
+
+        events = [pg.event.Event(pg.KEYUP, key=key) for key in self._pressed]
+        self._pressed = self.rng.sample(ARROWS, self.rng.randrange(3))
+        events += [pg.event.Event(pg.KEYDOWN, key=key) for key in self._pressed]
+        return events
+
+
+class DodgeInput(InputSource):
+    """DodgeBot이 고른 행동을 이벤트로 바꾸어 공급하는 자동 플레이어이다.
+
+    Attributes:
+        bot: 행동을 결정하는 DodgeBot
+        nearest: 관측할 가까운 총알 수
+
+    """
+    def __init__(self, seed: int = 0, nearest: int = ct.OBSNEAREST):
+        self.bot = DodgeBot(nearest=nearest)  # 결정적이므로 seed는 사용하지 않음
+        self.nearest = nearest
+        self._keys = 0
+
+    def __call__(self, simulation: Simulation) -> List[pg.event.Event]:
+        keys = self.bot(observe(simulation, self.nearest))
+        events = mask_events(self._keys, keys)
+        self._keys = keys
+        return events
+
+
+inputsources: Dict[str, type] = {'idle': IdleInput,
+                                 'random': RandomInput,
+                                 'dodge': DodgeInput}
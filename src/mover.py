@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Tuple, Sequence, Any, Dict, Callable, Final
+from typing import Tuple, Sequence, Any, Dict, Callable, Final, Optional
 import abc
 import math
 
@@ -7,6 +7,7 @@ import pygame as pg
 
 from . import constant as ct
 from .helpers.vector import Coordinate, parseVector, Vector, getHat  # 보조 함수 불러오기
+from .helpers.kinematics import position_at, exit_frame
 
 
 class Mover:
@@ -16,12 +17,25 @@ class Mover:
         self.pos = parseVector(pos)
         self._frame = 0
 
+    def reset(self, pos: Coordinate) -> None:
+        """객체를 다시 사용할 수 있도록 새 초기 상태로 제자리에서 되돌린다."""
+        self.pos.x, self.pos.y = pos
+        self._frame = 0
+
     def advance(self, *args: Any, **kwargs: Any) -> None:  # pylint: disable=unused-argument
         self._frame += 1
 
     def in_bound(self) -> bool:  # 경계에 닿았는지
         return 0 <= self.pos[0] <= ct.WIDTH and 0 <= self.pos[1] <= ct.HEIGHT
 
+    def exit_frame(self) -> Optional[int]:
+        """생성 후 처음으로 경계를 벗어나는 프레임을 반환한다. 미리 알 수 없으면 None"""
+        return None
+
+    def expired(self) -> bool:
+        """경계를 벗어나 제거되어야 하는지 반환한다."""
+        return not self.in_bound()
+
     def as_tuple(self) -> Sequence[float]:
         return self.pos.as_tuple()
 
@@ -32,7 +46,7 @@ class Mover:
 def restrict(fun: Callable[..., None]) -> Callable[..., None]:
     """플레이어의 동작 구역을 최상위 Surface 안으로 제한하는 decorator이다."""
     def decorated(self: Mover, *args: Any, **kwargs: Any) -> None:
-        lastpos = self.pos
+        lastpos = self.pos.copy()  # advance가 pos를 제자리에서 수정하므로 복사
         fun(self, *args, **kwargs)
 
         if not self.in_bound():
@@ -44,15 +58,58 @@ def restrict(fun: Callable[..., None]) -> Callable[..., None]:
 class VelocityMover(Mover):
     """등속운동을 구현한다.
 
+    위치는 매 프레임 속도를 더해 구하고, analytic이 True일 경우 생성 시점의 상태로부터
+    경계에 가까워지는 프레임을 미리 구해 그 전까지는 경계 검사를 생략한다.
+
     Attributes:
         pos: 초기 위치
         vel: (초기) 속도
+        origin: 생성 시점의 위치
+        v0: 생성 시점의 속도
 
     """
+    analytic: bool = ct.ANALYTIC  # 경계 검사 생략 여부. 속도가 외부 요인으로 바뀌는 운동은 False
+    margin: float = 1e-6  # 닫힌 식과 매 프레임 더한 위치의 부동소수점 오차보다 충분히 큰 값
+
     def __init__(self, pos: Coordinate, vel: Coordinate):
         super().__init__(pos)
         self.vel = parseVector(vel)
 
+        self.origin = self.pos.copy()
+        self.v0 = self.vel.copy()
+        self._safe = self._predict()
+
+    def reset(self, pos: Coordinate, vel: Coordinate) -> None:  # type: ignore[override]
+        super().reset(pos)
+        self.vel.x, self.vel.y = vel
+        self.origin.x, self.origin.y = self.pos.x, self.pos.y
+        self.v0.x, self.v0.y = self.vel.x, self.vel.y
+        self._safe = self._predict()
+
+    def _predict(self) -> Optional[int]:
+        """경계에 margin보다 가까워지는 첫 프레임. 그 전에는 매 프레임 더한 위치도 반드시 경계 안에 있다."""
+        if not self.analytic:
+            return None
+        return exit_frame(self.origin.data, self.v0.data, self._acc(),
+                          ct.WIDTH, ct.HEIGHT, self.margin)
+
+    def _acc(self) -> Sequence[float]:
+        return (0.0, 0.0)
+
+    def position_at(self, frame: int) -> Vector:
+        """생성 후 frame 프레임이 지났을 때의 위치를 닫힌 식으로 반환한다."""
+        return Vector(*position_at(self.origin.data, self.v0.data, self._acc(), frame))
+
+    def exit_frame(self) -> Optional[int]:
+        if not self.analytic:
+            return None
+        return exit_frame(self.origin.data, self.v0.data, self._acc(), ct.WIDTH, ct.HEIGHT)
+
+    def expired(self) -> bool:
+        if self._safe is not None and self._frame < self._safe:
+            return False
+        return super().expired()
+
     def advance(self, *args: Any, **kwargs: Any) -> None:
         """1프레임 후 이동을 처리한다."""
         self.pos += self.vel
@@ -69,8 +126,16 @@ class AccelerationMover(VelocityMover):
 
     """
     def __init__(self, pos: Coordinate, vel: Coordinate, acc: Coordinate):
+        self.acc = parseVector(acc)  # 경계 검사를 생략할 프레임 계산에 필요
         super().__init__(pos, vel)
-        self.acc = parseVector(acc)
+
+    def reset(self, pos: Coordinate, vel: Coordinate,  # type: ignore[override]
+              acc: Coordinate) -> None:
+        self.acc.x, self.acc.y = acc
+        super().reset(pos, vel)
+
+    def _acc(self) -> Sequence[float]:
+        return self.acc.data
 
     def advance(self, *args: Any, **kwargs: Any) -> None:
         """1프레임 후 이동을 처리한다."""
@@ -89,6 +154,7 @@ class EventMover(VelocityMover):
     """
     amplifier: float = 2.5  # 쉬프트 없을 때 배속
     magnitude: float = 4.8
+    analytic = False
 
     def __init__(self, pos: Coordinate):
         super().__init__(pos, (0, 0))
@@ -134,16 +200,24 @@ class TrackingMover(VelocityMover):
     minDot: Final[float] = getHat(0) @ getHat(maxDeg)
     trackTime: Final[float] = 12  # 방향 트는 시간간격
     maxtrackTime: Final[float] = 3  # 실질 따라오는 시간
+    analytic = False
 
     def __init__(self, pos: Coordinate, vel: Coordinate, toTrack: Mover):
         super().__init__(pos, vel)
+        self._follow(toTrack)
+
+    def reset(self, pos: Coordinate, vel: Coordinate,  # type: ignore[override]
+              toTrack: Mover) -> None:
+        super().reset(pos, vel)
+        self._follow(toTrack)
 
+    def _follow(self, toTrack: Mover) -> None:
         self.vsize = abs(self.vel)
         self.theta = self.vel.get_theta()
         self.toFollow = toTrack
 
-        self._followframe: Final[float] = min(TrackingMover.maxtrackTime,
-                                              TrackingMover.trackTime / self.vsize) * ct.FPS  # 플레이어를 향해 움직임
+        self._followframe = min(TrackingMover.maxtrackTime,
+                                TrackingMover.trackTime / self.vsize) * ct.FPS  # 플레이어를 향해 움직임
 
     def advance(self, *args: Any, **kwargs: Any) -> None:
         """1프레임 후 이동을 처리한다."""
@@ -0,0 +1,74 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from .occupancy import OccupancyGrid
+
+if TYPE_CHECKING:
+    from .simulation import Simulation
+
+FEATURES: int = 6  # 총알 하나의 관측값: 상대 x, 상대 y, 속도 x, 속도 y, 너비, 높이
+
+
+class Observation(NamedTuple):
+    """플레이어와 가까운 탄막 총알의 NumPy 스냅샷이다.
+
+    여러 게임의 관측을 stack으로 묶으면 각 배열의 맨 앞에 게임 축이 추가된다.
+
+    Attributes:
+        player: 플레이어 rect의 (중심 x, 중심 y, 너비, 높이). shape (4,)
+        bullets: 플레이어에 가까운 순서의 총알 관측값. 남는 행은 0이다. shape (k, FEATURES)
+        mask: bullets의 각 행이 실제 총알인지 여부. shape (k,)
+        live: 살아있는 탄막 총알 수
+        danger: 플레이어가 있는 칸 주변의 OccupancyGrid.patch. 격자 밖은 -1이다.
+            shape (2 * radius + 1, 2 * radius + 1)이며 사용하지 않으면 (0, 0)
+
+    """
+    player: np.ndarray
+    bullets: np.ndarray
+    mask: np.ndarray
+    live: np.ndarray
+    danger: np.ndarray
+
+    @staticmethod
+    def stack(observations: Sequence[Observation]) -> Observation:
+        """여러 관측을 게임 축으로 묶는다."""
+        return Observation(*(np.stack(field) for field in zip(*observations)))
+
+    def split(self) -> List[Observation]:
+        """stack으로 묶인 관측을 게임별로 나눈다."""
+        return [Observation(*fields) for fields in zip(*self)]
+
+
+def observe(simulation: Simulation, nearest: int, grid: Optional[OccupancyGrid] = None,
+            radius: int = 0) -> Observation:
+    """simulation의 BulletPool에서 플레이어에 가장 가까운 총알 최대 nearest개를 관측한다.
+
+    Args:
+        simulation: 관측할 게임
+        nearest: 관측할 가까운 총알 수
+        grid: 위험도 지도를 만들 OccupancyGrid or None(만들지 않음). 현재 총알로 다시 채운다.
+        radius: 위험도 지도의 반지름(칸)
+
+    """
+    rect = simulation.player.rect
+    player = np.array([rect.centerx, rect.centery, rect.w, rect.h], dtype=np.float32)
+    bullets = np.zeros((nearest, FEATURES), dtype=np.float32)
+    mask = np.zeros(nearest, dtype=bool)
+
+    pool = simulation.danmakugroup.pool
+    index = pool.nearest(rect.center, nearest)
+    k = len(index)
+    bullets[:k, 0:2] = pool.pos[index] - rect.center
+    bullets[:k, 2:4] = pool.vel[index]
+    bullets[:k, 4:6] = pool.size[index]
+    mask[:k] = True
+
+    if grid is not None:
+        grid.rebuild(pool)
+        danger = grid.patch(rect.center, radius)
+    else:
+        danger = np.zeros((0, 0), dtype=np.int32)
+
+    return Observation(player, bullets, mask, np.array(pool.n), danger)
@@ -0,0 +1,143 @@
+from __future__ import annotations
+from typing import Optional, Tuple
+
+import numpy as np
+import pygame as pg
+
+from . import constant as ct
+from .bulletpool import BulletPool
+
+
+class OccupancyGrid:
+    """BulletPool 총알의 rect가 덮는 칸마다 총알 수를 센 격자이다.
+
+    매 프레임 rebuild가 모든 총알의 rect를 칸 범위로 바꾸어, 2차원 차분 배열에 한 번의 bincount로 더하고
+    누적합으로 칸별 개수를 구한다. 함께 총알 인덱스를 왼쪽 위 칸 번호로 정렬하고 칸별 시작 위치를 기록해 둔다.
+    질의는 rect가 걸치는 칸만 확인하고, 칸이 비어 있지 않을 때만 그 주변 칸에 속한 총알만 정확한 rect 검사를 한다.
+    rebuild는 총알 수에 비례하고, 질의는 전체 총알 수와 관계없이 질의 주변의 총알 수에 비례한다.
+
+    격자 밖으로 나간 rect는 가장자리 칸에 기록되므로, 비어 있는 칸에는 겹치는 총알이 없음이 보장된다.
+
+    Attributes:
+        resolution: 격자 한 칸의 크기(픽셀)
+        shape: (행 수, 열 수)
+        counts: 칸별로 rect가 덮는 총알 수. shape (행 수, 열 수)
+        pool: 마지막으로 rebuild한 BulletPool or None
+
+    """
+    def __init__(self, resolution: int = ct.OCCUPANCYCELL,
+                 size: Tuple[int, int] = (ct.WIDTH, ct.HEIGHT)):
+        if resolution < 1:
+            raise ValueError
+
+        self.resolution = resolution
+        self.shape = (-(-size[1] // resolution), -(-size[0] // resolution))
+        self.counts = np.zeros(self.shape, dtype=np.int32)
+        self.pool: Optional[BulletPool] = None
+
+        self._topleft = np.zeros((0, 2), dtype=np.int64)  # rebuild 시점의 총알 rect
+        self._size = np.zeros((0, 2), dtype=np.int64)
+        self._order = np.zeros(0, dtype=np.int64)  # 왼쪽 위 칸 번호로 정렬한 총알 인덱스
+        self._starts = np.zeros(self.shape[0] * self.shape[1] + 1, dtype=np.int64)  # 칸별 시작 위치
+        self._reach = 0  # 총알 rect가 왼쪽 위 칸에서 뻗어나가는 최대 칸 수
+
+    def rebuild(self, pool: BulletPool) -> None:
+        """pool의 현재 총알로 counts를 다시 채운다."""
+        self.pool = pool
+        rows, cols = self.shape
+        self._topleft = pool.topleft()
+        self._size = size = pool.size[:pool.n]
+        visible = (size[:, 0] > 0) & (size[:, 1] > 0)  # 크기가 0인 총알은 겹치지 않음
+        tl = self._topleft[visible]
+        br = tl + size[visible] - 1
+
+        res = self.resolution
+        x0 = np.clip(tl[:, 0] // res, 0, cols - 1)
+        y0 = np.clip(tl[:, 1] // res, 0, rows - 1)
+        x1 = np.clip(br[:, 0] // res, 0, cols - 1) + 1
+        y1 = np.clip(br[:, 1] // res, 0, rows - 1) + 1
+
+        stride = cols + 1
+        cells = (rows + 1) * stride
+        diff = np.bincount(np.concatenate((y0 * stride + x0, y1 * stride + x1)), minlength=cells) \
+            - np.bincount(np.concatenate((y0 * stride + x1, y1 * stride + x0)), minlength=cells)
+        counts = diff.reshape(rows + 1, stride).cumsum(axis=0).cumsum(axis=1)
+        self.counts = counts[:rows, :cols].astype(np.int32)
+
+        anchor = y0 * cols + x0
+        if rows * cols <= 1 << 16:  # 16비트 이하의 정수는 기수 정렬로 총알 수에 비례하는 시간에 정렬됨
+            anchor = anchor.astype(np.uint16)
+        self._order = np.flatnonzero(visible)[np.argsort(anchor, kind='stable')]
+        self._starts[1:] = np.cumsum(np.bincount(anchor, minlength=rows * cols))
+        self._reach = int(max((x1 - x0).max(initial=1), (y1 - y0).max(initial=1))) - 1
+
+    def _window(self, rect: pg.rect.Rect) -> Tuple[slice, slice]:
+        """rect가 걸치는 칸의 (행, 열) slice를 반환한다."""
+        rows, cols = self.shape
+        res = self.resolution
+        x0 = min(max(rect.left // res, 0), cols - 1)
+        y0 = min(max(rect.top // res, 0), rows - 1)
+        x1 = min(max((rect.right - 1) // res, 0), cols - 1) + 1
+        y1 = min(max((rect.bottom - 1) // res, 0), rows - 1) + 1
+        return slice(y0, y1), slice(x0, x1)
+
+    def occupied(self, rect: pg.rect.Rect) -> bool:
+        """rect가 걸치는 칸 중 총알이 있는 칸이 있는지 반환한다. 겹침의 필요조건이다."""
+        if rect.w <= 0 or rect.h <= 0:
+            return False
+        return bool(self.counts[self._window(rect)].any())
+
+    def candidates(self, rect: pg.rect.Rect) -> np.ndarray:
+        """rect와 겹칠 수 있는 총알의 인덱스를 반환한다. 왼쪽 위 칸이 rect 주변에 있는 총알들이다."""
+        if rect.w <= 0 or rect.h <= 0:
+            return np.zeros(0, dtype=np.int64)
+
+        cols = self.shape[1]
+        rows, columns = self._window(rect)
+        x0 = max(columns.start - self._reach, 0)
+        found = [self._order[self._starts[y * cols + x0]:self._starts[y * cols + columns.stop]]
+                 for y in range(max(rows.start - self._reach, 0), rows.stop)]
+        return np.concatenate(found)
+
+    def _hits(self, rect: pg.rect.Rect) -> np.ndarray:
+        """rect와 겹치는 총알의 인덱스를 반환한다. BulletPool.collide_rect와 같은 규칙을 따른다."""
+        if self.pool is None:
+            raise ValueError
+        if not self.occupied(rect):
+            return np.zeros(0, dtype=np.int64)
+
+        index = self.candidates(rect)
+        tl = self._topleft[index]
+        size = self._size[index]
+        return index[(tl[:, 0] < rect.x + rect.w) & (tl[:, 1] < rect.y + rect.h)
+                     & (tl[:, 0] + size[:, 0] > rect.x) & (tl[:, 1] + size[:, 1] > rect.y)]
+
+    def collide_rect(self, rect: pg.rect.Rect) -> np.ndarray:
+        """rect와 겹치는 총알을 나타내는 bool 배열을 반환한다. BulletPool.collide_rect와 결과가 같다."""
+        if self.pool is None:
+            raise ValueError
+        ret = np.zeros(self.pool.n, dtype=bool)
+        ret[self._hits(rect)] = True
+        return ret
+
+    def collideany(self, rect: pg.rect.Rect) -> bool:
+        """rect와 겹치는 총알이 있는지 반환한다. 질의 주변의 총알만 검사한다."""
+        return bool(len(self._hits(rect)))
+
+    def patch(self, center: Tuple[float, float], radius: int) -> np.ndarray:
+        """center가 속한 칸을 중심으로 한 (2 * radius + 1) 정사각형 범위의 counts를 반환한다.
+
+        격자 밖의 칸은 -1로 채운다. 자동 플레이어가 주변의 위험도를 읽는 데 사용한다.
+
+        """
+        rows, cols = self.shape
+        cy = int(center[1]) // self.resolution
+        cx = int(center[0]) // self.resolution
+        ret = np.full((2 * radius + 1, 2 * radius + 1), -1, dtype=np.int32)
+
+        y0, y1 = max(cy - radius, 0), min(cy + radius + 1, rows)
+        x0, x1 = max(cx - radius, 0), min(cx + radius + 1, cols)
+        if y0 < y1 and x0 < x1:
+            ret[y0 - cy + radius:y1 - cy + radius, x0 - cx + radius:x1 - cx + radius] = \
+                self.counts[y0:y1, x0:x1]
+        return ret
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from inspect import signature, Parameter, _ParameterKind
-from typing import Dict, Any, Tuple, Union, List, Final, TypeVar, Callable
+from typing import Dict, Any, Tuple, Union, List, Final, TypeVar, Callable, Optional
+from functools import partial
 from pathlib import Path
 import re
 import json
@@ -15,8 +16,17 @@ from .basedanmaku import BaseDanmaku, RadialBaseDanmaku, BurstBaseDanmaku, Plane
 from .image import BlockImage
 from .element import Element
 from .generator import Generator
+from .sound import SoundBank
 
 T = TypeVar('T')
+Factory = Callable[[], Any]
+
+
+def _constant(value: T) -> Callable[[], T]:
+    """항상 value를 반환하는 Callable을 반환한다."""
+    def ret() -> T:
+        return value
+    return ret
 
 
 class Parser:
@@ -26,26 +36,33 @@ class Parser:
         screenrect: 최상위 Surface의 boundary box
         groupdict: 스프라이트 그룹을 포함하는 dict
         spritedict: 스프라이트를 포함하는 dict
+        soundbank: 생성된 객체가 공유할 SoundBank or None(소리 없음)
+        rng: 랜덤 위치에 사용할 난수 생성기
 
     """
-    allow = {"Gen": Generator,
-             "Generator": Generator,
-             "Radial": RadialBaseDanmaku,
-             "Burst": BurstBaseDanmaku,
-             "Plane": PlaneBaseDanmaku,
-             "Velocity": VelocityMover,
-             "Acceleration": AccelerationMover,
-             "Event": EventMover,
-             "Tracking": TrackingMover,
-             "Block": BlockImage}
+    allow: Dict[str, Callable[..., Any]] = {"Gen": Generator,
+                                           "Generator": Generator,
+                                           "Radial": RadialBaseDanmaku,
+                                           "Burst": BurstBaseDanmaku,
+                                           "Plane": PlaneBaseDanmaku,
+                                           "Velocity": VelocityMover,
+                                           "Acceleration": AccelerationMover,
+                                           "Event": EventMover,
+                                           "Tracking": TrackingMover,
+                                           "Block": BlockImage.shared}
+    shared = (BlockImage.shared,)  # 한 번만 생성하여 공유하는 type
 
     def __init__(self,
                  screenrect: pg.rect.Rect,
                  groupdict: Dict[str, pg.sprite.Group],
-                 spritedict: Dict[str, Element]):
+                 spritedict: Dict[str, Element],
+                 soundbank: Optional[SoundBank] = None,
+                 rng: Optional[random.Random] = None):
         self.screenrect = screenrect
         self.groupdict = groupdict
         self.spritedict = spritedict
+        self.soundbank = soundbank
+        self.rng = rng or random.Random()
 
     def _parseRandom(self, mode: str) -> Vector:
         """랜덤 위치를 반환한다.
@@ -69,8 +86,8 @@ class Parser:
         """
         w = self.screenrect.width
         h = self.screenrect.height
-        rx = random.randint(0, w)
-        ry = random.randint(0, h)
+        rx = self.rng.randint(0, w)
+        ry = self.rng.randint(0, h)
         mx = w // 2
         my = h // 2
 
@@ -156,6 +173,22 @@ class Parser:
     def _parsePosition(self, data: Union[str, List[Union[int, float]]]) -> Vector:
         """위치를 파싱하여 반환한다.
 
+        data의 형식은 _compilePosition과 같다.
+
+        Args:
+            data: 위치 데이터
+
+        Returns:
+            파싱된 2차원 위치 벡터
+
+        """
+        return self._compilePosition(data)()
+
+    def _compilePosition(self, data: Union[str, List[Union[int, float]]]) -> Callable[[], Vector]:
+        """위치를 파싱하여, 위치를 반환하는 Callable을 반환한다.
+
+        랜덤 위치가 아닌 경우 파싱은 이 함수에서 한 번만 수행된다.
+
         data가 str인 경우,
         'center',
         'topleft', 'bottomleft', 'topright', 'bottomright',
@@ -172,7 +205,7 @@ class Parser:
             data: 위치 데이터
 
         Returns:
-            파싱된 2차원 위치 벡터
+            호출될 때마다 2차원 위치 벡터를 반환하는 Callable
 
         Raises:
             TypeError: data의 type이 str이나 list가 아닐 경우
@@ -187,6 +220,7 @@ class Parser:
                                       'rdmidx', 'rdmidy']
 
         st: str
+        vec: Vector
 
         if isinstance(data, str):
             if match := re.search(r'(?<=__).*(?=__)', data):
@@ -194,9 +228,10 @@ class Parser:
 
                 if st in allow:
                     coor: Tuple[int, int] = getattr(self.screenrect, st)
-                    return parseVector(coor)
+                    vec = parseVector(coor)
+                    return vec.copy
                 if st in allow_rd:
-                    return self._parseRandom(st)
+                    return lambda: self._parseRandom(st)
 
                 raise ValueError
 
@@ -206,19 +241,44 @@ class Parser:
             if [*filter(lambda x: not isinstance(x, (int, float)), data)]:
                 raise ValueError
 
-            return parseVector((data[0], data[1]))
+            vec = parseVector((data[0], data[1]))
+            return vec.copy
 
         else:
             raise TypeError
 
         raise ValueError
 
+    def _findSprite(self, name: str) -> Element:
+        """spritedict에서 name에 해당하는 스프라이트를 반환한다."""
+        if not name in self.spritedict:
+            raise ValueError
+        return self.spritedict[name]
+
     def parse(self, data: Dict[str, Any]) -> Any:
         """dict 형태의 JSON 데이터를 파싱하여 반환한다.
 
+        self.compile(data)()와 같다. 같은 data로 여러 번 객체를 생성할 경우 compile을 사용한다.
+
+        Args:
+            data: 파싱할 JSON 데이터
+
+        Returns:
+            파싱된 객체
+
+        """
+        return self.compile(data)()
+
+    def compile(self, data: Dict[str, Any]) -> Factory:
+        """dict 형태의 JSON 데이터를 미리 파싱하여, 객체를 생성하는 Callable을 반환한다.
+
         기본적으로 파싱할 객체의 signature를 runtime에 인식하여 자동으로 객체를 생성한다.
         data는 default값이 정의되어 있지 않은 argument의 이름을 모두 key로 가지고 있어야 한다.
 
+        signature 분석과 색상, 고정 위치의 파싱은 이 함수에서 한 번만 수행되며,
+        반환된 Callable은 호출될 때마다 랜덤 위치, 유도 대상과 같은 동적인 부분만 해석한다.
+        shared에 속하는 type(이미지)의 객체는 한 번만 생성되어 공유된다.
+
         argument의 이름이 아닌 특수한 key값은 다음과 같다.
             '__type__': 필수. 반환할 객체의 type을 정의한다.
             '__wrap__': 정의되어 있을 경우 파싱된 객체를 반환하는 Callable를 반환한다.
@@ -232,7 +292,7 @@ class Parser:
             data: 파싱할 JSON 데이터
 
         Returns:
-            파싱된 객체
+            호출될 때마다 파싱된 객체를 새로 생성하여 반환하는 Callable
 
         Raises:
             ValueError: 위의 파싱 규칙에 해당되지 않는 경우
@@ -250,8 +310,8 @@ class Parser:
         elem = self.allow[data['__type__']]
         sig = signature(elem)
 
-        args: List[Any] = list()
-        kwargs: Dict[str, Any] = dict()
+        args: List[Factory] = list()
+        kwargs: Dict[str, Factory] = dict()
         for name in sig.parameters:
             tmp: Any
             param = sig.parameters[name]
@@ -259,14 +319,18 @@ class Parser:
             if param.kind == _ParameterKind.VAR_POSITIONAL:
                 if "args" in data:
                     data_args: List[Any] = data["args"]
-                    args += data_args
+                    args += map(_constant, data_args)
 
             elif param.kind == _ParameterKind.VAR_KEYWORD:
                 if "kwargs" in data:
                     data_kwargs: Dict[str, Any] = data["kwargs"]
-                    kwargs.update(data_kwargs)
+                    kwargs.update({k: _constant(v) for k, v in data_kwargs.items()})
 
             else:
+                if param.annotation in ("Optional[SoundBank]",):  # JSON과 관계없이 주입
+                    kwargs.update({name: _constant(self.soundbank)})
+                    continue
+
                 if param.default == Parameter.empty:
                     if not name in data:
                         raise ValueError
@@ -279,49 +343,66 @@ class Parser:
                 if tmp == "__arg__":
                     continue
 
+                res: Factory = _constant(tmp)
+
                 if isinstance(tmp, dict) and "__type__" in tmp:
-                    tmp = self.parse(tmp)
+                    res = self.compile(tmp)
 
                 if elem == Generator and name in ("danmaku",):
-                    def parseBase(data: Dict[str, Any]) -> Tuple[int, Callable[[Tuple[int, int]], BaseDanmaku]]:
+                    def compileBase(data: Dict[str, Any]) -> Tuple[int, Factory]:
                         if not "refresh" in data:
                             raise ValueError
 
                         ref: int = data["refresh"]
-                        gen: Callable[[Tuple[int, int]],
-                                      BaseDanmaku] = self.parse(data)
-                        return (ref, gen)
+                        return (ref, self.compile(data))
+
+                    bases = [*map(compileBase, tmp)]
 
-                    tmp = [*map(parseBase, tmp)]
+                    def parseBases(bases: List[Tuple[int, Factory]] = bases) \
+                            -> List[Tuple[int, Callable[[Tuple[int, int]], BaseDanmaku]]]:
+                        return [(ref, gen()) for ref, gen in bases]
+
+                    res = parseBases
 
                 if name in ("direction",):
-                    tmp *= ct.PI
+                    res = _constant(tmp * ct.PI)
 
                 if param.annotation in ("pg.sprite.Group",):
                     if not tmp in self.groupdict:
                         raise ValueError
-                    tmp = self.groupdict[tmp]
+                    res = _constant(self.groupdict[tmp])
                 if param.annotation in ("Element", "Optional[Element]"):
-                    if not tmp in self.spritedict:
-                        raise ValueError
-                    tmp = self.spritedict[tmp]
+                    res = partial(self._findSprite, tmp)
 
                 if param.annotation in ("Coordinate",):
-                    tmp = self._parsePosition(tmp)
+                    res = self._compilePosition(tmp)
                 if param.annotation in ("Tuple[int, int, int]",):
-                    tmp = self._parseColor(tmp)
+                    res = _constant(self._parseColor(tmp))
 
                 if param.default == Parameter.empty:
-                    args.append(tmp)
+                    args.append(res)
                 else:
-                    kwargs.update({name: tmp})
+                    kwargs.update({name: res})
+
+        def build(*wrap_args: Any) -> Any:
+            return elem(*wrap_args,
+                        *[res() for res in args],
+                        **{name: res() for name, res in kwargs.items()})
+
+        if elem in self.shared and not wrap:
+            return _constant(build())
 
         if not wrap:
-            return elem(*args, **kwargs)
+            return build
         else:
-            def ret(*wrap_args: Any) -> Any:
-                return elem(*wrap_args, *args, **kwargs)
-            return ret
+            def factory() -> Any:
+                built_args = [res() for res in args]
+                built_kwargs = {name: res() for name, res in kwargs.items()}
+
+                def ret(*wrap_args: Any) -> Any:
+                    return elem(*wrap_args, *built_args, **built_kwargs)
+                return ret
+            return factory
 
     def load(self, rel_path: str) -> Any:
         """상대 경로에 정의되어 있는 json 확장자의 파일을 읽어서 파싱한다.
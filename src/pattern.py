@@ -0,0 +1,376 @@
+from __future__ import annotations
+from inspect import signature, Parameter, _ParameterKind
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import hashlib
+import json
+import marshal
+import mmap
+import os
+import struct
+import threading
+
+import pygame as pg
+
+from . import constant as ct
+from .mover import Mover
+from .generator import Generator
+from .parser import Parser
+
+GROUPS: Tuple[str, ...] = ('bullet', 'player', 'enemy', 'danmaku')  # Simulation의 그룹 이름
+SPRITES: Tuple[str, ...] = ('player',)  # Simulation의 스프라이트 이름
+
+MAGIC: bytes = b'DNMKPAT1'
+HEADER = struct.Struct('<8sI32s')  # magic, marshal 버전, 원본 파일의 sha256
+
+Meta = Dict[str, Tuple[int, int]]  # 파일 이름: (크기, 수정 시각(ns))
+
+_loaded: Dict[str, Tuple[Meta, Dict[str, Dict[str, Any]]]] = dict()  # 난이도: (원본 파일 정보, 패턴)
+
+
+class PatternError(ValueError):
+    """패턴 파일이 Parser.allow의 생성자 signature에 맞지 않을 때 발생한다.
+
+    Attributes:
+        message: 오류 설명
+        path: 오류가 난 값의 JSON 경로. Ex) '$.danmaku[0].image.color'
+        file: 오류가 난 파일 이름 or None
+
+    """
+    def __init__(self, message: str, path: str = '$', file: Optional[str] = None):
+        super().__init__(message, path, file)
+        self.message = message
+        self.path = path
+        self.file = file
+
+    def __str__(self) -> str:
+        return f"{self.file or '<data>'}: {self.path}: {self.message}"
+
+
+class Validator:
+    """패턴 데이터를 Parser.compile과 같은 규칙으로 검사한다.
+
+    Parser.compile은 첫 번째 잘못된 값에서 경로 없는 ValueError를 발생시키지만,
+    Validator는 객체를 생성하지 않고 모든 오류를 JSON 경로와 함께 모은다.
+    Parser가 무시하는 알 수 없는 key는 오류가 아닌 경고로 모은다.
+
+    Attributes:
+        groups: group 인자로 쓸 수 있는 그룹 이름
+        sprites: track 인자로 쓸 수 있는 스프라이트 이름
+        parser: 색상과 위치 검사에 사용하는 Parser 객체
+        warnings: 마지막 validate 호출에서 발견한 경고 list
+
+    """
+    def __init__(self, groups: Iterable[str] = GROUPS, sprites: Iterable[str] = SPRITES):
+        self.groups = tuple(groups)
+        self.sprites = tuple(sprites)
+        self.parser = Parser(pg.Rect(0, 0, ct.WIDTH, ct.HEIGHT), dict(), dict())
+
+        self.warnings: List[PatternError] = []
+
+        self._errors: List[PatternError] = []
+        self._file: Optional[str] = None
+
+    def validate(self, data: Any, file: Optional[str] = None) -> List[PatternError]:
+        """data의 모든 오류를 반환한다. 오류가 없으면 빈 list를 반환한다."""
+        self._errors = []
+        self.warnings = []
+        self._file = file
+        self._object(data, '$')
+        return self._errors
+
+    def check(self, data: Any, file: Optional[str] = None) -> None:
+        """data를 검사한다.
+
+        Raises:
+            PatternError: 오류가 있을 경우 첫 번째 오류
+
+        """
+        errors = self.validate(data, file)
+        if errors:
+            raise errors[0]
+
+    def _error(self, message: str, path: str) -> None:
+        self._errors.append(PatternError(message, path, self._file))
+
+    def _object(self, data: Any, path: str, extra: Sequence[str] = (),
+                kind: Optional[Callable[[Any], bool]] = None, expected: str = 'object') -> None:
+        """'__type__'을 가지는 객체 하나를 검사한다.
+
+        Args:
+            data: 검사할 값
+            path: data의 JSON 경로
+            extra: 상위 객체가 사용하는 추가 key (Ex. 'refresh')
+            kind: Parser.allow의 value를 받아 허용 여부를 반환하는 함수 or None(모두 허용)
+            expected: kind에 맞지 않을 때 오류에 표시할 이름
+
+        """
+        if not isinstance(data, dict):
+            self._error(f"expected {expected} with '__type__', got {type(data).__name__}", path)
+            return
+        if not '__type__' in data:
+            self._error("missing '__type__'", path)
+            return
+
+        typename = data['__type__']
+        if not typename in Parser.allow:
+            self._error(f"unknown type {typename!r} (expected one of {', '.join(Parser.allow)})",
+                        f"{path}.__type__")
+            return
+
+        elem = Parser.allow[typename]
+        if kind is not None and not kind(elem):
+            self._error(f"type {typename!r} is not a {expected}", f"{path}.__type__")
+            return
+
+        wrap = bool(data.get('__wrap__'))
+        params = signature(elem).parameters
+        known = {'__type__', '__wrap__', *extra}
+
+        for name, param in params.items():
+            if param.kind == _ParameterKind.VAR_POSITIONAL:
+                known.add('args')
+                if 'args' in data and not isinstance(data['args'], list):
+                    self._error("'args' must be a list", f"{path}.args")
+                continue
+            if param.kind == _ParameterKind.VAR_KEYWORD:
+                known.add('kwargs')
+                if 'kwargs' in data and not isinstance(data['kwargs'], dict):
+                    self._error("'kwargs' must be an object", f"{path}.kwargs")
+                continue
+            if param.annotation in ("Optional[SoundBank]",):  # JSON과 관계없이 주입
+                continue
+
+            known.add(name)
+            if not name in data:
+                if param.default == Parameter.empty:
+                    self._error(f"missing required key {name!r} for {typename!r}", path)
+                continue
+
+            value = data[name]
+            if value == "__arg__":
+                if not wrap:
+                    self._error("'__arg__' requires '__wrap__': true", f"{path}.{name}")
+                continue
+
+            self._value(elem, name, param.annotation, value, f"{path}.{name}")
+
+        for key in data:
+            if not key in known:  # Parser는 무시함
+                self.warnings.append(PatternError(f"unknown key {key!r} for {typename!r} is ignored",
+                                                  f"{path}.{key}", self._file))
+
+    def _value(self, elem: Any, name: str, annotation: str, value: Any, path: str) -> None:
+        """객체의 인자 하나를 annotation에 따라 검사한다."""
+        if elem == Generator and name in ("danmaku",):
+            self._danmaku(value, path)
+
+        elif annotation in ("pg.sprite.Group",):
+            if not value in self.groups:
+                self._error(f"unknown group {value!r} (expected one of {', '.join(self.groups)})",
+                            path)
+        elif annotation in ("Element", "Optional[Element]"):
+            if not value in self.sprites:
+                self._error(f"unknown sprite {value!r} (expected one of {', '.join(self.sprites)})",
+                            path)
+
+        elif annotation in ("Coordinate",):
+            try:
+                self.parser._compilePosition(value)
+            except (ValueError, TypeError):
+                self._error(f"invalid position {value!r} (expected [x, y] or '__center__' style "
+                            f"name)", path)
+        elif annotation in ("Tuple[int, int, int]",):
+            try:
+                self.parser._parseColor(value)
+            except (ValueError, TypeError):
+                self._error(f"invalid color {value!r} (expected [r, g, b], '#rrggbb' or "
+                            f"'__name__')", path)
+
+        elif annotation in ("int",):
+            if not isinstance(value, int) or isinstance(value, bool):
+                self._error(f"expected an integer, got {value!r}", path)
+        elif annotation in ("float",):
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                self._error(f"expected a number, got {value!r}", path)
+
+        elif annotation in ("Mover",):
+            self._object(value, path, kind=lambda e: isinstance(e, type) and issubclass(e, Mover),
+                         expected='mover')
+        elif annotation in ("pg.Surface", "pg.surface.Surface"):
+            self._object(value, path, kind=lambda e: e in Parser.shared, expected='image')
+
+        elif isinstance(value, dict) and '__type__' in value:
+            self._object(value, path)
+
+    def _danmaku(self, value: Any, path: str) -> None:
+        """Generator의 danmaku list를 검사한다."""
+        if not isinstance(value, list):
+            self._error(f"expected a list of danmaku, got {type(value).__name__}", path)
+            return
+
+        for i, item in enumerate(value):
+            itempath = f"{path}[{i}]"
+            self._object(item, itempath, extra=('refresh',))
+            if not isinstance(item, dict):
+                continue
+
+            if not 'refresh' in item:
+                self._error("missing required key 'refresh'", itempath)
+            elif (not isinstance(item['refresh'], int) or isinstance(item['refresh'], bool)
+                  or not (item['refresh'] > 0 or item['refresh'] == -1)):
+                self._error(f"'refresh' must be a positive integer or -1, got {item['refresh']!r}",
+                            f"{itempath}.refresh")
+
+            if not item.get('__wrap__'):
+                self._error("danmaku must set '__wrap__': true to receive the position",
+                            itempath)
+
+
+def sources(diff: str) -> List[Path]:
+    """diff 난이도의 패턴 파일 경로 list를 이름 순으로 반환한다."""
+    return sorted((Path.cwd() / ct.PATTERNDIR / diff).glob('*.json'))
+
+
+def bundlepath(diff: str) -> Path:
+    """diff 난이도의 번들 파일 경로를 반환한다."""
+    return Path.cwd() / ct.BUNDLEDIR / f"{diff}.bundle"
+
+
+def _meta(paths: Iterable[Path]) -> Meta:
+    ret: Meta = dict()
+    for path in paths:
+        st = path.stat()
+        ret[path.name] = (st.st_size, st.st_mtime_ns)
+    return ret
+
+
+def content_hash(paths: Iterable[Path]) -> bytes:
+    """파일 이름과 내용에 대한 sha256 digest를 반환한다."""
+    h = hashlib.sha256()
+    for path in paths:
+        content = path.read_bytes()
+        h.update(path.name.encode())
+        h.update(struct.pack('<Q', len(content)))
+        h.update(content)
+    return h.digest()
+
+
+def compile_patterns(diff: str, validator: Optional[Validator] = None) \
+        -> Tuple[Dict[str, Dict[str, Any]], List[PatternError], List[PatternError]]:
+    """diff 난이도의 패턴 파일을 읽고 검사한다.
+
+    Args:
+        diff: 난이도
+        validator: 사용할 Validator or None(기본 설정)
+
+    Returns:
+        (패턴 이름을 key로 하는 데이터 dict, 모든 파일의 오류 list, 모든 파일의 경고 list)
+
+    """
+    validator = validator or Validator()
+
+    patterns: Dict[str, Dict[str, Any]] = dict()
+    errors: List[PatternError] = []
+    warnings: List[PatternError] = []
+    for path in sources(diff):
+        file = f"{ct.PATTERNDIR}/{diff}/{path.name}"
+        try:
+            data = json.loads(path.read_text())
+        except json.JSONDecodeError as e:
+            errors.append(PatternError(f"invalid JSON: {e.msg} (line {e.lineno}, column {e.colno})",
+                                       '$', file))
+            continue
+
+        fileerrors = validator.validate(data, file)
+        errors += fileerrors
+        warnings += validator.warnings
+        if not fileerrors:
+            patterns[path.stem] = data
+
+    return patterns, errors, warnings
+
+
+def write_bundle(path: Path, digest: bytes, meta: Meta,
+                 patterns: Dict[str, Dict[str, Any]]) -> None:
+    """번들 파일을 쓴다. 여러 프로세스, 스레드가 동시에 써도 되도록 임시 파일을 쓴 뒤 교체한다."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with tmp.open('wb') as f:
+        f.write(HEADER.pack(MAGIC, marshal.version, digest))
+        f.write(marshal.dumps((meta, patterns)))
+    os.replace(tmp, path)
+
+
+def read_bundle(path: Path) -> Optional[Tuple[bytes, Meta, Dict[str, Dict[str, Any]]]]:
+    """번들 파일을 메모리 매핑하여 읽는다.
+
+    Returns:
+        (원본 파일의 digest, 원본 파일의 크기와 수정 시각, 패턴 dict)
+        파일이 없거나 형식이 맞지 않으면 None
+
+    """
+    try:
+        with path.open('rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, version, digest = HEADER.unpack_from(mm)
+            if magic != MAGIC or version != marshal.version:
+                return None
+            with memoryview(mm)[HEADER.size:] as body:
+                meta, patterns = marshal.loads(body)
+    except (OSError, ValueError, EOFError, TypeError, struct.error):
+        return None
+
+    return digest, meta, patterns
+
+
+def load(diff: str) -> Dict[str, Dict[str, Any]]:
+    """diff 난이도의 패턴을 번들에서 불러온다.
+
+    원본 파일의 크기와 수정 시각이 번들에 기록된 것과 같으면 번들을 그대로 사용한다.
+    다르면 내용의 hash를 비교하여, 내용이 바뀐 경우에만 검사 후 번들을 다시 만든다.
+    번들을 쓸 수 없는 경우에는 검사한 데이터를 그대로 반환한다.
+    불러온 패턴은 메모리에도 보관하여, 원본 파일이 그대로이면 다음 호출은 파일을 읽지 않는다.
+    반환된 dict는 공유되므로 수정하면 안 된다.
+
+    Raises:
+        PatternError: 패턴 파일에 오류가 있을 경우 첫 번째 오류
+
+    """
+    paths = sources(diff)
+    meta = _meta(paths)
+
+    cached = _loaded.get(diff)
+    if cached is not None and cached[0] == meta:
+        return cached[1]
+
+    patterns = _load_bundle(diff, paths, meta)
+    _loaded[diff] = (meta, patterns)
+    return patterns
+
+
+def _load_bundle(diff: str, paths: List[Path], meta: Meta) -> Dict[str, Dict[str, Any]]:
+    path = bundlepath(diff)
+
+    bundle = read_bundle(path)
+    if bundle is not None:
+        digest, oldmeta, patterns = bundle
+        if oldmeta == meta:
+            return patterns
+
+        if content_hash(paths) == digest:  # 수정 시각만 바뀜
+            try:
+                write_bundle(path, digest, meta, patterns)
+            except OSError:
+                pass
+            return patterns
+
+    patterns, errors, _ = compile_patterns(diff)
+    if errors:
+        raise errors[0]
+
+    try:
+        write_bundle(path, content_hash(paths), meta, patterns)
+    except OSError:
+        pass
+    return patterns
@@ -0,0 +1,196 @@
+from __future__ import annotations
+from collections import deque
+from contextlib import nullcontext
+from pathlib import Path
+from types import TracebackType
+from typing import Any, ContextManager, Deque, Dict, List, Optional, Type, Union
+import csv
+import gc
+import json
+import sys
+import time
+
+import numpy as np
+import pygame as pg
+
+from . import constant as ct
+from .text import TextRenderer, textrenderer
+
+_NULL: ContextManager[None] = nullcontext()
+
+
+class _Phase:
+    """with 문으로 감싼 구간의 시간을 FrameProfiler에 기록한다."""
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler: FrameProfiler, name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc: Optional[BaseException], tb: Optional[TracebackType]) -> None:
+        current = self.profiler._current
+        current[self.name] = current.get(self.name, 0.0) + time.perf_counter() - self.start
+
+
+class FrameProfiler:
+    """게임 루프의 구간별 소요 시간, 스프라이트 수, 메모리 할당을 프레임 단위로 기록한다.
+
+    비활성화된 경우 phase는 아무 일도 하지 않는 공유 context manager를 반환하고,
+    begin_frame, end_frame은 바로 반환한다.
+
+    Attributes:
+        enabled: 기록 여부
+        window: 백분위수를 계산할 최근 프레임 수
+        rows: 프레임별 기록의 list
+
+    """
+    def __init__(self, enabled: bool = ct.PROFILE, window: int = ct.PROFILEWINDOW):
+        self.enabled = enabled
+        self.window = window
+        self.rows: List[Dict[str, float]] = []
+
+        self._recent: Dict[str, Deque[float]] = dict()
+        self._phases: Dict[str, _Phase] = dict()
+        self._current: Dict[str, float] = dict()
+        self._start = 0.0
+        self._blocks = 0
+        self._collections = 0
+        self._overlay: Optional[pg.surface.Surface] = None
+
+    def phase(self, name: str) -> ContextManager[None]:
+        """with 문으로 감싼 구간의 시간을 name으로 기록하는 context manager를 반환한다."""
+        if not self.enabled:
+            return _NULL
+
+        ret = self._phases.get(name)
+        if ret is None:
+            ret = self._phases[name] = _Phase(self, name)
+        return ret
+
+    @staticmethod
+    def _gc_collections() -> int:
+        return sum(stat['collections'] for stat in gc.get_stats())
+
+    def begin_frame(self) -> None:
+        """프레임의 시작을 알린다."""
+        if not self.enabled:
+            return
+
+        self._current = dict()
+        self._blocks = sys.getallocatedblocks()
+        self._collections = self._gc_collections()
+        self._start = time.perf_counter()
+
+    def end_frame(self, groupdict: Optional[Dict[str, pg.sprite.Group]] = None) -> None:
+        """프레임의 끝을 알리고, 이번 프레임의 기록을 저장한다.
+
+        Args:
+            groupdict: 스프라이트 수를 기록할 스프라이트 그룹 dict
+
+        """
+        if not self.enabled:
+            return
+
+        row = {f'{name}_ms': t * 1000 for name, t in self._current.items()}
+        row['frame_ms'] = (time.perf_counter() - self._start) * 1000
+        row['alloc_blocks'] = sys.getallocatedblocks() - self._blocks
+        row['gc_collections'] = self._gc_collections() - self._collections
+        for key, group in (groupdict or {}).items():
+            row[f'{key}_count'] = len(group)
+        row['frame'] = len(self.rows) + 1
+
+        self.rows.append(row)
+        for key, value in row.items():
+            recent = self._recent.get(key)
+            if recent is None:
+                recent = self._recent[key] = deque(maxlen=self.window)
+            recent.append(value)
+
+    def percentile(self, key: str, q: float) -> float:
+        """최근 window 프레임 동안 key 값의 q 백분위수를 반환한다."""
+        recent = self._recent.get(key)
+        if not recent:
+            return 0.0
+        return float(np.percentile(recent, q))
+
+    def latest(self, key: str) -> float:
+        """가장 최근 프레임의 key 값을 반환한다."""
+        recent = self._recent.get(key)
+        return recent[-1] if recent else 0.0
+
+    def keys(self) -> List[str]:
+        """기록된 값의 이름 list를 반환한다."""
+        return [key for key in self._recent if key != 'frame']
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """전체 프레임에 대한 값별 평균, 백분위수, 최댓값을 반환한다."""
+        ret: Dict[str, Dict[str, float]] = dict()
+        for key in self.keys():
+            values = [row.get(key, 0.0) for row in self.rows]
+            ret[key] = {'mean': float(np.mean(values)),
+                        'p50': float(np.percentile(values, 50)),
+                        'p90': float(np.percentile(values, 90)),
+                        'p99': float(np.percentile(values, 99)),
+                        'max': float(np.max(values))}
+        return ret
+
+    def overlay(self, surface: pg.surface.Surface,
+                renderer: TextRenderer = textrenderer) -> Optional[pg.rect.Rect]:
+        """surface의 왼쪽 아래에 구간별 최근 백분위수와 스프라이트 수를 그리고, 그려진 영역을 반환한다.
+
+        오버레이는 PROFILEREFRESH 프레임마다 다시 렌더링하며, 텍스트 캐시를 사용하지 않는다.
+
+        """
+        if not self.enabled or not self.rows:
+            return None
+
+        if self._overlay is None or len(self.rows) % ct.PROFILEREFRESH == 0:
+            lines: List[str] = []
+            for key in self.keys():
+                if key.endswith('_ms'):
+                    lines.append(f"{key[:-3]:<10} p50 {self.percentile(key, 50):6.2f}"
+                                 f"  p99 {self.percentile(key, 99):6.2f} ms")
+            lines.append('  '.join(f"{key[:-6]} {int(self.latest(key))}"
+                                   for key in self.keys() if key.endswith('_count')))
+            lines.append(f"alloc {int(self.latest('alloc_blocks'))}"
+                         f"  gc {int(self.latest('gc_collections'))}")
+
+            font = renderer.font(16)
+            rendered = [font.render(line, True, ct.GREENTRACK) for line in lines]
+            self._overlay = pg.Surface((max(r.get_width() for r in rendered), 16 * len(lines)),
+                                       pg.SRCALPHA)
+            for i, r in enumerate(rendered):
+                self._overlay.blit(r, (0, 16 * i))
+
+        return surface.blit(self._overlay,
+                            (8, surface.get_height() - self._overlay.get_height() - 8))
+
+    def dump(self, path: Union[str, Path], extra: Optional[Dict[str, Any]] = None) -> None:
+        """기록을 파일로 저장한다.
+
+        path의 확장자가 .csv일 경우 프레임별 기록을, 그 외에는 요약을 JSON으로 저장한다.
+
+        Args:
+            path: 저장할 파일 경로
+            extra: JSON 요약에 함께 저장할 dict
+
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if path.suffix == '.csv':
+            fields = ['frame', *self.keys()]
+            with path.open('w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fields, restval=0)
+                writer.writeheader()
+                writer.writerows(self.rows)
+            return
+
+        with path.open('w') as f:
+            json.dump({'frames': len(self.rows), 'summary': self.summary(), **(extra or {})},
+                      f, indent=2)
@@ -0,0 +1,113 @@
+from __future__ import annotations
+from collections import deque
+from typing import Any, Deque, Dict, List, NamedTuple, Tuple
+
+import numpy as np
+
+from . import constant as ct
+
+
+class Tier(NamedTuple):
+    """렌더링 품질 단계 하나이다. 모든 항목은 화면과 소리에만 영향을 주며 시뮬레이션은 그대로 진행된다.
+
+    Attributes:
+        name: 단계 이름
+        hudevery: HUD의 점수를 이 프레임 간격으로만 새 값으로 렌더링한다. 그 사이에는 캐시된 텍스트를 그린다.
+        interpolate: 틱 사이의 위치를 보간하여 그릴지 여부. False일 경우 그룹별 한 번의 draw로 그린다.
+        fulldisplay: 바뀐 영역을 격자로 추적하지 않고 화면 전체를 한 번에 갱신할지 여부
+        soundscale: 같은 효과음을 다시 재생하기까지의 최소 프레임 수(SoundBank.window)에 곱할 값
+        renderevery: 이 프레임 간격으로만 화면을 그린다. 틱은 매 프레임 진행한다.
+
+    """
+    name: str
+    hudevery: int
+    interpolate: bool
+    fulldisplay: bool
+    soundscale: int
+    renderevery: int
+
+
+TIERS: Tuple[Tier, ...] = (
+    Tier('full', 1, True, False, 1, 1),
+    Tier('reduced', 4, False, False, 2, 1),
+    Tier('low', 8, False, True, 4, 1),
+    Tier('minimal', 15, False, True, 8, 2),
+)
+
+
+class QualityController:
+    """프레임마다 걸린 시간을 읽어 예산을 넘으면 품질 단계를 낮추고, 여유가 생기면 다시 올린다.
+
+    최근 window 프레임의 upper 백분위수가 예산을 넘으면 한 단계 내리고, 모든 프레임이 예산의 recover 배
+    안에 들어오면 한 단계 올린다. 단계를 바꾼 뒤 hold 프레임 동안은 다시 바꾸지 않으며, 올리는 것은
+    그 두 배를 기다려 단계가 오르내리기를 반복하지 않게 한다.
+
+    Attributes:
+        budget: 한 프레임에 쓸 수 있는 시간(초)
+        window: 판단에 사용할 최근 프레임 수
+        hold: 단계를 바꾼 뒤 다시 바꾸지 않을 프레임 수
+        enabled: False일 경우 항상 가장 높은 품질을 유지한다.
+        level: 현재 단계의 번호. 클수록 품질이 낮다.
+        frames: record가 호출된 횟수
+        changes: (프레임, 새 단계 번호) list
+
+    """
+    upper: float = 90.0  # 과부하를 판단할 백분위수
+    recover: float = 0.6  # 품질을 다시 올릴 수 있는 예산 대비 프레임 시간의 비율
+
+    def __init__(self, budget: float = 1 / (ct.RENDERFPS or ct.FPS),
+                 window: int = ct.QUALITYWINDOW, hold: int = ct.QUALITYHOLD,
+                 enabled: bool = ct.QUALITY):
+        if budget <= 0 or window < 1 or hold < 0:
+            raise ValueError
+
+        self.budget = budget
+        self.window = window
+        self.hold = hold
+        self.enabled = enabled
+        self.level = 0
+        self.frames = 0
+        self.changes: List[Tuple[int, int]] = []
+
+        self._recent: Deque[float] = deque(maxlen=window)
+        self._since = 0  # 마지막으로 단계를 바꾼 뒤 지난 프레임 수
+        self._counts = [0] * len(TIERS)
+
+    @property
+    def tier(self) -> Tier:
+        """현재 품질 단계"""
+        return TIERS[self.level]
+
+    def record(self, frametime: float) -> Tier:
+        """한 프레임에 걸린 시간(초)을 기록하고, 다음 프레임에 적용할 단계를 반환한다.
+
+        frametime은 렌더링 속도 제한으로 기다린 시간을 뺀, 틱 진행과 렌더링에 실제로 쓴 시간이어야 한다.
+
+        """
+        self.frames += 1
+        self._counts[self.level] += 1
+        self._recent.append(frametime)
+        self._since += 1
+        if not self.enabled or len(self._recent) < self.window or self._since < self.hold:
+            return self.tier
+
+        if self.level + 1 < len(TIERS) \
+           and np.percentile(self._recent, self.upper) > self.budget:
+            self._change(self.level + 1)
+        elif self.level > 0 and self._since >= 2 * self.hold \
+                and max(self._recent) < self.budget * self.recover:
+            self._change(self.level - 1)
+        return self.tier
+
+    def _change(self, level: int) -> None:
+        self.level = level
+        self.changes.append((self.frames, level))
+        self._since = 0
+        self._recent.clear()  # 새 단계에서 걸린 시간으로 다시 판단
+
+    def stats(self) -> Dict[str, Any]:
+        """현재 단계, 단계를 바꾼 횟수, 단계별로 머문 프레임 수를 dict로 반환한다."""
+        return {'tier': self.tier.name,
+                'level': self.level,
+                'changes': len(self.changes),
+                'frames': {tier.name: count for tier, count in zip(TIERS, self._counts)}}
@@ -0,0 +1,142 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Set, Type
+import gc
+
+import pygame as pg
+
+from . import constant as ct
+from .element import Element
+from .mover import Mover
+
+
+class ElementPool:
+    """총알 Element와 Mover 객체를 버리지 않고 다시 사용한다.
+
+    kill된 총알은 release로 반환되어 mover type별로 보관되고,
+    acquire는 보관된 객체가 있으면 Mover.reset과 Element.reset으로 제자리에서 초기화하여 반환한다.
+
+    Attributes:
+        created: 새로 생성한 객체 수
+        reused: 다시 사용한 객체 수
+        released: 반환된 객체 수
+
+    """
+    def __init__(self) -> None:
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+
+        self._free: Dict[Type[Mover], List[Element]] = dict()
+        self._inuse: Set[int] = set()
+
+    def acquire(self, cls: Type[Mover], image: pg.surface.Surface, *args: Any) -> Element:
+        """cls(*args)를 mover로 하는 Element를 반환한다.
+
+        Args:
+            cls: Mover의 type
+            image: 총알을 렌더링할 이미지
+            *args: cls의 생성자, reset에 전달할 argument
+
+        Returns:
+            초기화된 Element 객체
+
+        """
+        free = self._free.get(cls)
+        if free:
+            ret = free.pop()
+            ret.mover.reset(*args)  # type: ignore[call-arg]
+            ret.reset(image)
+            self.reused += 1
+        else:
+            ret = Element(cls(*args), image)  # type: ignore[call-arg]
+            self.created += 1
+
+        self._inuse.add(id(ret))
+        return ret
+
+    def release(self, element: Element) -> None:
+        """acquire로 받은 element를 반환한다. 이 pool의 객체가 아니면 무시한다."""
+        key = id(element)
+        if not key in self._inuse:
+            return
+
+        self._inuse.remove(key)
+        self._free.setdefault(type(element.mover), []).append(element)
+        self.released += 1
+
+    @property
+    def free(self) -> int:
+        """보관 중인 객체 수"""
+        return sum(len(free) for free in self._free.values())
+
+    def stats(self) -> Dict[str, int]:
+        """pool 통계를 dict로 반환한다."""
+        return {'created': self.created,
+                'reused': self.reused,
+                'released': self.released,
+                'inuse': len(self._inuse),
+                'free': self.free}
+
+
+class PooledGroup(pg.sprite.Group):
+    """그룹에서 제거된 총알을 ElementPool에 반환하는 스프라이트 그룹이다.
+
+    BaseDanmaku.emit은 이 그룹을 대상으로 할 때 recycler에서 총알을 받아온다.
+
+    Attributes:
+        recycler: 총알을 보관하는 ElementPool 객체
+
+    """
+    def __init__(self, *sprites: pg.sprite.Sprite):
+        super().__init__(*sprites)
+        self.recycler = ElementPool()
+
+    def remove_internal(self, sprite: pg.sprite.Sprite) -> None:
+        super().remove_internal(sprite)
+        if isinstance(sprite, Element):
+            self.recycler.release(sprite)
+
+
+class GCPolicy:
+    """게임 중 gc 모듈의 동작을 제어한다.
+
+    mode의 값은
+        'default': 아무것도 하지 않는다.
+        'freeze': 시작할 때 수거한 뒤 살아있는 객체를 gc.freeze로 수거 대상에서 제외한다.
+        'disable': 시작할 때 수거한 뒤 자동 수거를 끄고, 끝날 때 다시 켜서 수거한다.
+    이 중 하나이다.
+
+    Attributes:
+        mode: gc 제어 방식
+
+    """
+    modes = ('default', 'freeze', 'disable')
+
+    def __init__(self, mode: str = ct.GCMODE):
+        if not mode in GCPolicy.modes:
+            raise ValueError
+
+        self.mode = mode
+        self._enabled = gc.isenabled()
+
+    def start(self) -> None:
+        """게임 시작 시 호출한다."""
+        if self.mode == 'default':
+            return
+
+        gc.collect()
+        if self.mode == 'freeze':
+            gc.freeze()
+        else:
+            self._enabled = gc.isenabled()
+            gc.disable()
+
+    def stop(self) -> None:
+        """게임 종료 시 호출한다."""
+        if self.mode == 'freeze':
+            gc.unfreeze()
+        elif self.mode == 'disable' and self._enabled:
+            gc.enable()
+
+        if self.mode != 'default':
+            gc.collect()
@@ -0,0 +1,225 @@
+from __future__ import annotations
+from itertools import repeat
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+import pygame as pg
+
+from . import constant as ct
+from .image import BlockImage
+
+if TYPE_CHECKING:
+    from .bulletpool import BulletPool
+
+
+def interpolate(sprite: pg.sprite.Sprite, alpha: float) -> Tuple[int, int]:
+    """sprite의 직전 틱 위치(previous)와 현재 위치를 alpha로 보간한 rect의 왼쪽 위 좌표를 반환한다."""
+    x, y = sprite.rect.topleft  # type: ignore[attr-defined]
+    previous = getattr(sprite, 'previous', None)
+    if alpha >= 1 or previous is None:
+        return (x, y)
+    return (int(previous[0] + (x - previous[0]) * alpha),
+            int(previous[1] + (y - previous[1]) * alpha))
+
+
+class BatchRenderer:
+    """BulletPool의 총알을 이미지별로 모아 한꺼번에 그린다.
+
+    mode의 값은
+        'blits': 총알을 이미지별로 한 번의 Surface.blits 호출로 그린다.
+        'pixels': 단색 BlockImage 총알은 이미지별로 픽셀 배열에 직접 채우고,
+                  나머지 총알은 Surface.blits로 그린다.
+    이 중 하나이다. 'pixels' 모드는 32비트 Surface에서만 사용되며, 그 외에는 'blits'로 그린다.
+
+    Attributes:
+        mode: 렌더링 방식
+
+    """
+    modes: Tuple[str, ...] = ('blits', 'pixels')
+
+    def __init__(self, mode: str = ct.RENDERMODE):
+        if not mode in BatchRenderer.modes:
+            raise ValueError
+
+        self.mode = mode
+        self._offsets: Dict[Tuple[int, int, int], np.ndarray] = dict()
+
+    def draw(self, surface: pg.surface.Surface, pool: BulletPool, alpha: float = 1.0) -> None:
+        """pool의 모든 총알을 surface에 그린다.
+
+        Args:
+            surface: 총알을 그릴 Surface
+            pool: 그릴 BulletPool
+            alpha: 위치 보간 계수. BulletPool.topleft 참조
+
+        """
+        if pool.n == 0:
+            return
+
+        topleft = pool.topleft(alpha)
+        if self.mode == 'pixels' and surface.get_bitsize() == 32:
+            self._fill(surface, pool, topleft)
+        else:
+            self._blits(surface, pool, topleft, np.arange(pool.n))
+
+    @staticmethod
+    def _blits(surface: pg.surface.Surface, pool: BulletPool,
+               topleft: np.ndarray, index: np.ndarray) -> None:
+        """index의 총알을 이미지별로 한 번의 Surface.blits 호출로 그린다."""
+        image = pool.image[index]
+        for i in np.unique(image).tolist():
+            coords = topleft[index[image == i]].tolist()
+            surface.blits([*zip(repeat(pool.images[i]), coords)], False)
+
+    def _offset(self, width: int, height: int, pitch: int) -> np.ndarray:
+        """width x height 직사각형의 모든 픽셀의 왼쪽 위 픽셀 기준 오프셋을 반환한다."""
+        key = (width, height, pitch)
+        ret = self._offsets.get(key)
+        if ret is None:
+            dy, dx = np.mgrid[0:height, 0:width]
+            ret = self._offsets[key] = (dy * pitch + dx).ravel()
+        return ret
+
+    def _fill(self, surface: pg.surface.Surface, pool: BulletPool, topleft: np.ndarray) -> None:
+        """단색 총알은 픽셀 배열에 직접 채우고, 나머지는 blits로 그린다."""
+        n = pool.n
+        order = np.argsort(pool.image[:n], kind='stable')
+        bounds = np.cumsum(np.bincount(pool.image[:n], minlength=len(pool.images)))
+
+        width, height = surface.get_size()
+        pitch = surface.get_pitch() // 4
+        rest: List[np.ndarray] = []
+        # Surface 잠금. BufferProxy는 buffer protocol을 지원하지만 stub에 선언되어 있지 않음
+        pixels = np.frombuffer(surface.get_buffer(), dtype=np.uint32)  # type: ignore[call-overload]
+        try:
+            start = 0
+            for i, end in enumerate(bounds.tolist()):
+                index = order[start:end]
+                start = end
+                if not len(index):
+                    continue
+
+                image = pool.images[i]
+                if not isinstance(image, BlockImage):
+                    rest.append(index)
+                    continue
+
+                w, h = image.get_size()
+                tl = topleft[index]
+                inside = ((tl[:, 0] >= 0) & (tl[:, 0] + w <= width)
+                          & (tl[:, 1] >= 0) & (tl[:, 1] + h <= height))
+                rest.append(index[~inside])  # 화면에 걸친 총알은 blits로 잘라서 그림
+
+                tl = tl[inside]
+                pixels[((tl[:, 1] * pitch + tl[:, 0])[:, None] + self._offset(w, h, pitch))
+                       .ravel()] = surface.map_rgb(image.color)
+        finally:
+            del pixels  # Surface 잠금 해제
+
+        rest = [index for index in rest if len(index)]
+        if rest:
+            self._blits(surface, pool, topleft, np.concatenate(rest))
+
+
+class DirtyRects:
+    """프레임마다 그려진 영역을 격자 단위로 기록하여, 바뀐 영역만 지우고 화면에 반영한다.
+
+    pg.sprite.RenderUpdates와 같이, 이전 프레임에 그려진 영역을 배경색으로 지운 뒤
+    이번 프레임을 그리고, 두 프레임에 그려진 영역의 합집합만 화면에 반영한다.
+    총알이 수천 개일 때도 갱신할 rect의 수가 격자 크기로 제한되도록, 영역은 cellsize 단위로 기록하고
+    같은 행에서 이어진 칸은 하나의 rect로 합친다.
+
+    Attributes:
+        size: 화면의 크기
+        cellsize: 격자 한 칸의 크기
+        background: 배경색
+
+    """
+    def __init__(self, size: Tuple[int, int], cellsize: int = ct.DIRTYCELL,
+                 background: Tuple[int, int, int] = ct.BLACK):
+        self.size = size
+        self.cellsize = cellsize
+        self.background = background
+
+        shape = (-(-size[1] // cellsize), -(-size[0] // cellsize))  # (행, 열)
+        self._previous = np.ones(shape, dtype=bool)  # 첫 프레임은 화면 전체를 지움
+        self._current = np.zeros(shape, dtype=bool)
+        self._pending: List[np.ndarray] = []  # 이번 프레임에 그려진 (x0, y0, x1, y1) 배열
+
+    def reset(self) -> None:
+        """기록을 버린다. 다음 clear는 화면 전체를 지운다."""
+        self._previous[:] = True
+        self._current[:] = False
+        self._pending.clear()
+
+    def clear(self, surface: pg.surface.Surface) -> None:
+        """이전 프레임에 그려진 영역을 배경색으로 지운다."""
+        for rect in self._rects(self._previous):
+            surface.fill(self.background, rect)
+
+    def _mark(self, boxes: np.ndarray) -> None:
+        """(x0, y0, x1, y1) 영역들이 걸친 칸을 기록한다."""
+        rows, cols = self._current.shape
+        c = self.cellsize
+        x0, y0, x1, y1 = boxes.T
+        visible = (x1 > 0) & (y1 > 0) & (x0 < self.size[0]) & (y0 < self.size[1]) \
+            & (x1 > x0) & (y1 > y0)
+        boxes = boxes[visible]
+        boxes[:, 2:] -= 1
+        cells = boxes // c
+        np.maximum(cells, 0, out=cells)
+        np.minimum(cells, (cols - 1, rows - 1, cols - 1, rows - 1), out=cells)
+        cx0, cy0, cx1, cy1 = cells.T
+
+        small = (cx1 - cx0 <= 1) & (cy1 - cy0 <= 1)  # 칸보다 작은 영역은 네 귀퉁이만 기록
+        for cx, cy in ((cx0, cy0), (cx1, cy0), (cx0, cy1), (cx1, cy1)):
+            self._current[cy[small], cx[small]] = True
+
+        for a, b, d, e in cells[~small].tolist():
+            self._current[b:e + 1, a:d + 1] = True
+
+    def add(self, rect: Optional[pg.rect.Rect]) -> None:
+        """이번 프레임에 rect 영역이 그려졌음을 기록한다."""
+        if rect is not None:
+            self._pending.append(np.array([[rect.x, rect.y, rect.right, rect.bottom]],
+                                          dtype=np.int64))
+
+    def add_group(self, group: pg.sprite.Group, alpha: float = 1.0) -> None:
+        """이번 프레임에 group의 스프라이트와 총알이 alpha로 보간된 위치에 그려졌음을 기록한다."""
+        if group.sprites():
+            boxes = np.array([(*interpolate(s, alpha), *s.rect.size) for s in group],
+                             dtype=np.int64)
+            boxes[:, 2:] += boxes[:, :2]
+            self._pending.append(boxes)
+
+        pool: Optional[BulletPool] = getattr(group, 'pool', None)
+        if pool is not None and pool.n:
+            tl = pool.topleft(alpha)
+            self._pending.append(np.hstack((tl, tl + pool.size[:pool.n])))
+
+    def _rects(self, cells: np.ndarray) -> List[pg.rect.Rect]:
+        """칸의 bool 배열을 행마다 이어진 칸을 합친 rect list로 변환한다."""
+        c = self.cellsize
+        padded = np.zeros((cells.shape[0], cells.shape[1] + 2), dtype=np.int8)
+        padded[:, 1:-1] = cells
+        edges = np.diff(padded, axis=1)
+        starts = np.nonzero(edges == 1)
+        ends = np.nonzero(edges == -1)[1]
+        return [pg.Rect(x0 * c, row * c, (x1 - x0) * c, c)
+                for row, x0, x1 in zip(starts[0].tolist(), starts[1].tolist(), ends.tolist())]
+
+    def flush(self) -> List[pg.rect.Rect]:
+        """이번 프레임을 마치고, 화면에 반영해야 할 rect list를 반환한다."""
+        if self._pending:
+            self._mark(np.concatenate(self._pending))
+            self._pending.clear()
+
+        ret = self._rects(self._previous | self._current)
+        self._previous, self._current = self._current, self._previous
+        self._current[:] = False
+        return ret
+
+    @property
+    def coverage(self) -> float:
+        """이전 프레임에 그려진 칸의 비율"""
+        return float(self._previous.mean())
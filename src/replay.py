@@ -0,0 +1,169 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Tuple, Union
+import struct
+
+import pygame as pg
+
+from . import constant as ct
+from .headless import HeadlessReport, run_headless
+from .inputs import InputSource
+from .simulation import Simulation
+
+MAGIC: bytes = b'CS2R'
+VERSION: int = 1
+
+_HEADER = struct.Struct('<4sBqiI')  # magic, version, seed, 점수, 프레임 수
+_RECORD = struct.Struct('<IBI')  # 프레임 번호, 이벤트 코드, 키
+
+KEYDOWN: int = 0
+KEYUP: int = 1
+OTHER: int = 2  # 키 입력이 아닌 이벤트. 플레이어의 update를 호출하는 효과만 있다.
+
+Record = Tuple[int, int, int]
+
+
+class Replay(NamedTuple):
+    """한 판의 입력 기록이다.
+
+    파일 형식은 little-endian으로,
+        header: magic(4B), version(1B), seed(8B), 최종 점수(4B), 프레임 수(4B)
+        난이도: 길이(1B), ASCII 문자열
+        record: 프레임 번호(4B), 이벤트 코드(1B), 키(4B)의 반복
+    이다.
+
+    Attributes:
+        diff: 난이도
+        seed: Simulation의 시드
+        score: 기록된 최종 점수
+        frames: 기록된 프레임 수
+        records: (프레임 번호, 이벤트 코드, 키)의 list
+
+    """
+    diff: str
+    seed: int
+    score: int
+    frames: int
+    records: List[Record]
+
+    def save(self, path: Union[str, Path]) -> None:
+        """path에 입력 기록을 저장한다."""
+        name = self.diff.encode('ascii')
+        with Path(path).open('wb') as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, self.seed, self.score, self.frames))
+            f.write(bytes([len(name)]) + name)
+            f.write(b''.join(_RECORD.pack(*record) for record in self.records))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Replay:
+        """path에서 입력 기록을 불러온다.
+
+        Raises:
+            ValueError: 입력 기록 파일이 아니거나 버전이 다를 경우
+
+        """
+        data = Path(path).read_bytes()
+        magic, version, seed, score, frames = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError
+
+        offset = _HEADER.size
+        length = data[offset]
+        diff = data[offset + 1:offset + 1 + length].decode('ascii')
+        offset += 1 + length
+
+        records = [*_RECORD.iter_unpack(data[offset:])]
+        return cls(diff, seed, score, frames, records)
+
+
+def encode_event(event: pg.event.Event) -> Tuple[int, int]:
+    """이벤트를 (이벤트 코드, 키)로 변환한다."""
+    if event.type == pg.KEYDOWN:
+        return (KEYDOWN, event.key)
+    if event.type == pg.KEYUP:
+        return (KEYUP, event.key)
+    return (OTHER, 0)
+
+
+def decode_event(code: int, key: int) -> pg.event.Event:
+    """(이벤트 코드, 키)를 이벤트로 변환한다."""
+    if code == KEYDOWN:
+        return pg.event.Event(pg.KEYDOWN, key=key)
+    if code == KEYUP:
+        return pg.event.Event(pg.KEYUP, key=key)
+    return pg.event.Event(pg.USEREVENT)
+
+
+class InputRecorder:
+    """Simulation에 전달된 이벤트를 프레임 번호와 함께 기록한다.
+
+    Attributes:
+        simulation: 기록할 Simulation
+        records: (프레임 번호, 이벤트 코드, 키)의 list
+
+    """
+    def __init__(self, simulation: Simulation):
+        if simulation.seed is None:
+            raise ValueError  # 시드 없이는 재현할 수 없음
+
+        self.simulation = simulation
+        self.records: List[Record] = []
+
+    def record(self, events: Iterable[pg.event.Event]) -> None:
+        """다음 프레임에 전달될 events를 기록한다."""
+        frame = self.simulation.totalframe + 1
+        for event in events:
+            self.records.append((frame, *encode_event(event)))
+
+    def replay(self) -> Replay:
+        """지금까지의 기록을 Replay로 반환한다."""
+        sim = self.simulation
+        seed: int = sim.seed  # type: ignore[assignment]
+        return Replay(sim.diff, seed, sim.score, sim.totalframe, list(self.records))
+
+
+class ReplayInput(InputSource):
+    """입력 기록을 재생하는 InputSource이다."""
+    def __init__(self, replay: Replay):
+        self._events: Dict[int, List[pg.event.Event]] = dict()
+        for frame, code, key in replay.records:
+            self._events.setdefault(frame, []).append(decode_event(code, key))
+
+    def __call__(self, simulation: Simulation) -> List[pg.event.Event]:
+        return self._events.get(simulation.totalframe + 1, [])
+
+
+class ReplayResult(NamedTuple):
+    """입력 기록을 재생한 결과이다.
+
+    Attributes:
+        replay: 재생한 입력 기록
+        report: 헤드리스 실행 결과
+
+    """
+    replay: Replay
+    report: HeadlessReport
+
+    @property
+    def ok(self) -> bool:
+        """재생한 결과가 기록된 점수, 프레임 수와 같은지 여부"""
+        return (self.report.score == self.replay.score
+                and self.report.frames == self.replay.frames)
+
+
+def play(replay: Replay, collision: str = ct.COLLISION) -> ReplayResult:
+    """입력 기록을 화면 없이 최대 속도로 재생한다.
+
+    init_headless 등으로 pygame이 초기화되어 있어야 한다.
+
+    Args:
+        replay: 재생할 입력 기록
+        collision: 충돌 판정 방식
+
+    Returns:
+        재생 결과
+
+    """
+    report = run_headless(replay.diff, ReplayInput(replay), collision,
+                          maxframes=replay.frames, seed=replay.seed)
+    return ReplayResult(replay, report)
@@ -0,0 +1,204 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, List, NamedTuple, Optional, Union
+import io
+import pickle
+import sqlite3
+import time
+
+from . import constant as ct
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    diff TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_top ON scores (diff, score DESC, id);
+CREATE TABLE IF NOT EXISTS legacy (
+    file TEXT PRIMARY KEY,
+    imported REAL NOT NULL
+);
+"""
+
+
+class ScoreEntry(NamedTuple):
+    """기록된 점수 하나이다.
+
+    Attributes:
+        id: 기록된 순서
+        diff: 난이도
+        score: 점수
+        created: 기록된 시각(UNIX time)
+
+    """
+    id: int
+    diff: str
+    score: int
+    created: float
+
+
+class ScoreStats(NamedTuple):
+    """난이도 하나의 점수 통계이다.
+
+    Attributes:
+        games: 기록된 판 수
+        best: 최고 점수
+        worst: 최저 점수
+        mean: 평균 점수
+
+    """
+    games: int
+    best: Optional[int]
+    worst: Optional[int]
+    mean: Optional[float]
+
+
+class _ListUnpickler(pickle.Unpickler):
+    """class나 함수를 불러오지 않는 Unpickler이다. 예전 점수 파일은 int의 list만 담고 있다."""
+    def find_class(self, module: str, name: str) -> Any:
+        raise pickle.UnpicklingError(f"global {module}.{name} is not allowed")
+
+
+def read_legacy(path: Union[str, Path]) -> List[int]:
+    """예전 pickle 점수 파일을 안전하게 읽는다.
+
+    Raises:
+        ValueError: 파일이 int의 list가 아닐 경우
+
+    """
+    try:
+        data = _ListUnpickler(io.BytesIO(Path(path).read_bytes())).load()
+    except (pickle.UnpicklingError, EOFError) as e:
+        raise ValueError(str(e)) from e
+
+    if not isinstance(data, list) or [*filter(lambda x: not isinstance(x, int), data)]:
+        raise ValueError
+    return data
+
+
+class Scoreboard:
+    """모든 점수를 SQLite 데이터베이스에 기록한다.
+
+    WAL 모드로 열어 여러 프로세스가 동시에 점수를 추가해도 서로 기다릴 뿐 기록이 사라지지 않으며,
+    한 점수는 INSERT 한 번으로 원자적으로 기록된다. (난이도, 점수) 인덱스로 상위 점수를 바로 찾는다.
+    처음 열 때 점수 폴더의 예전 pickle 파일을 한 번만 가져온다.
+
+    Attributes:
+        path: 데이터베이스 파일 경로
+        connection: sqlite3 연결
+
+    """
+    def __init__(self, path: Union[str, Path, None] = None, timeout: float = ct.SCORETIMEOUT,
+                 migrate: bool = True):
+        self.path = Path(path) if path is not None else Path.cwd() / ct.SCOREDIR / ct.SCOREDB
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.connection = sqlite3.connect(str(self.path), timeout=timeout, isolation_level=None)
+        self.connection.execute(f"PRAGMA busy_timeout = {int(timeout * 1000)}")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.executescript(_SCHEMA)
+
+        if migrate:
+            self.migrate(self.path.parent)
+
+    def __enter__(self) -> Scoreboard:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def add(self, diff: str, score: int) -> int:
+        """점수를 기록하고 기록의 id를 반환한다."""
+        cursor = self.connection.execute(
+            "INSERT INTO scores (diff, score, created) VALUES (?, ?, ?)",
+            (diff, score, time.time()))
+        return cursor.lastrowid or 0
+
+    def top(self, diff: str, n: int = 5) -> List[int]:
+        """diff 난이도의 상위 n개 점수를 높은 순서로 반환한다. 같은 점수는 먼저 기록된 것이 앞선다."""
+        rows = self.connection.execute(
+            "SELECT score FROM scores WHERE diff = ? ORDER BY score DESC, id LIMIT ?",
+            (diff, n))
+        return [score for score, in rows]
+
+    def rank(self, diff: str, score: int) -> int:
+        """diff 난이도에서 score보다 높은 점수의 수 + 1을 반환한다."""
+        count, = self.connection.execute(
+            "SELECT COUNT(*) FROM scores WHERE diff = ? AND score > ?", (diff, score)).fetchone()
+        return int(count) + 1
+
+    def history(self, diff: Optional[str] = None, limit: Optional[int] = None) -> List[ScoreEntry]:
+        """기록을 최근 것부터 반환한다.
+
+        Args:
+            diff: 난이도 or None(모든 난이도)
+            limit: 최대 개수 or None(모두)
+
+        """
+        query = "SELECT id, diff, score, created FROM scores"
+        params: List[Any] = []
+        if diff is not None:
+            query += " WHERE diff = ?"
+            params.append(diff)
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(-1 if limit is None else limit)
+
+        return [ScoreEntry(*row) for row in self.connection.execute(query, params)]
+
+    def stats(self, diff: str) -> ScoreStats:
+        """diff 난이도의 점수 통계를 반환한다."""
+        row = self.connection.execute(
+            "SELECT COUNT(*), MAX(score), MIN(score), AVG(score) FROM scores WHERE diff = ?",
+            (diff,)).fetchone()
+        return ScoreStats(*row)
+
+    def diffs(self) -> List[str]:
+        """기록이 있는 난이도 list를 반환한다."""
+        return [diff for diff, in self.connection.execute(
+            "SELECT DISTINCT diff FROM scores ORDER BY diff")]
+
+    def clear(self, diff: Optional[str] = None) -> int:
+        """diff 난이도(None일 경우 모든 난이도)의 기록을 지우고, 지운 개수를 반환한다."""
+        if diff is None:
+            cursor = self.connection.execute("DELETE FROM scores")
+        else:
+            cursor = self.connection.execute("DELETE FROM scores WHERE diff = ?", (diff,))
+        return cursor.rowcount
+
+    def migrate(self, directory: Union[str, Path]) -> int:
+        """directory의 예전 '<난이도>.pkl' 점수 파일을 가져오고, 가져온 점수의 수를 반환한다.
+
+        파일마다 한 번만 가져오며, 여러 프로세스가 동시에 열어도 중복되지 않도록 트랜잭션 안에서 확인한다.
+        int의 list가 아닌 파일은 건너뛴다. 원본 파일은 지우지 않는다.
+
+        """
+        ret = 0
+        for path in sorted(Path(directory).glob('*.pkl')):
+            try:
+                scores = read_legacy(path)
+            except (OSError, ValueError):
+                continue
+
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                if self.connection.execute("SELECT 1 FROM legacy WHERE file = ?",
+                                           (path.name,)).fetchone() is None:
+                    created = path.stat().st_mtime
+                    self.connection.executemany(
+                        "INSERT INTO scores (diff, score, created) VALUES (?, ?, ?)",
+                        [(path.stem, score, created) for score in scores])
+                    self.connection.execute("INSERT INTO legacy (file, imported) VALUES (?, ?)",
+                                            (path.name, time.time()))
+                    ret += len(scores)
+                self.connection.execute("COMMIT")
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+
+        return ret
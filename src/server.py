@@ -0,0 +1,423 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union
+import asyncio
+import os
+import signal
+import stat
+import struct
+
+import numpy as np
+
+from . import constant as ct
+from .batch import patterndirs
+from .headless import init_headless
+from .inputs import mask_events
+from .simulation import Rules, Simulation
+
+# 클라이언트 -> 서버
+OPEN: int = 1  # 새 게임 시작: seed(8B, 음수면 무작위), 가까운 총알 수(2B), 난이도 길이(1B), 난이도
+INPUT: int = 2  # 키 상태: 게임 id(4B), 눌린 키 bitmask(1B, inputs.KEYBITS 순서)
+CLOSE: int = 3  # 게임 종료: 게임 id(4B)
+
+# 서버 -> 클라이언트
+OPENED: int = 129  # 게임 id(4B)
+STATE: int = 130  # 게임 id(4B), tick(4B), 바뀐 필드 bitmask(1B), 바뀐 필드의 값
+ERROR: int = 131  # 게임 id(4B), 오류 코드(1B)
+
+SCORE: int = 1 << 0  # 점수(4B)
+PLAYER: int = 1 << 1  # 플레이어 중심 좌표(2B, 2B)
+BULLETS: int = 1 << 2  # 살아있는 총알 수(2B)
+ENEMIES: int = 1 << 3  # 살아있는 적 수(2B)
+NEAREST: int = 1 << 4  # 개수(1B), 플레이어에 가까운 총알의 상대 좌표(2B, 2B)의 반복
+DONE: int = 1 << 7  # 게임이 끝남. 이 STATE 이후 게임 id는 무효이다.
+
+BADDIFF: int = 1
+UNKNOWN: int = 2
+FULL: int = 3
+BADOP: int = 4
+
+_OPEN = struct.Struct('<qHB')
+_INPUT = struct.Struct('<IB')
+_CLOSE = struct.Struct('<I')
+_OPENED = struct.Struct('<BI')
+_STATE = struct.Struct('<BIIB')
+_ERROR = struct.Struct('<BIB')
+_I32 = struct.Struct('<i')
+_XY = struct.Struct('<hh')
+_U16 = struct.Struct('<H')
+
+
+class State(NamedTuple):
+    """클라이언트가 STATE 메시지를 누적하여 얻은 게임 하나의 상태이다.
+
+    Attributes:
+        session: 게임 id
+        tick: 마지막으로 받은 tick
+        score: 점수
+        player: 플레이어 중심 좌표
+        bullets: 살아있는 총알 수
+        enemies: 살아있는 적 수
+        nearest: 플레이어에 가까운 순서의 총알 상대 좌표 list
+        done: 게임이 끝났는지 여부
+
+    """
+    session: int
+    tick: int = 0
+    score: int = 0
+    player: Tuple[int, int] = (0, 0)
+    bullets: int = 0
+    enemies: int = 0
+    nearest: Tuple[Tuple[int, int], ...] = ()
+    done: bool = False
+
+
+def _clamp16(value: int) -> int:
+    return max(-32768, min(32767, value))
+
+
+class Session:
+    """서버에서 진행 중인 게임 한 판이다.
+
+    매 tick 클라이언트가 마지막으로 보낸 키 상태를 이벤트로 바꾸어 Simulation을 1프레임 진행하고,
+    직전에 보낸 값과 달라진 필드만 STATE 메시지로 만든다.
+
+    Attributes:
+        id: 게임 id
+        simulation: 게임 상태
+        owner: 게임을 연 연결의 StreamWriter or None(소켓 없이 사용)
+        nearest: STATE에 포함할 가까운 총알 수
+        keys: 클라이언트가 보낸 눌린 키 bitmask
+
+    """
+    def __init__(self, id: int, simulation: Simulation,
+                 owner: Optional[asyncio.StreamWriter] = None, nearest: int = 0):
+        self.id = id
+        self.simulation = simulation
+        self.owner = owner
+        self.nearest = min(nearest, 255)
+        self.keys = 0
+
+        self._applied = 0
+        self._last: Dict[int, Any] = dict()
+
+    def step(self) -> bool:
+        """게임을 1프레임 진행한다. 게임이 끝나면 False를 반환한다."""
+        events = mask_events(self._applied, self.keys)
+        self._applied = self.keys
+        return self.simulation.step(events)
+
+    def _nearest(self, center: Tuple[int, int]) -> bytes:
+        pool = self.simulation.danmakugroup.pool
+        index = pool.nearest(center, self.nearest)
+        coords = np.clip(pool.pos[index] - center, -32768, 32767).astype('<i2')
+        return bytes([len(index)]) + coords.tobytes()
+
+    def encode(self, done: bool = False) -> bytes:
+        """지난 encode 이후 바뀐 필드만 담은 STATE 메시지를 반환한다."""
+        sim = self.simulation
+        center = sim.player.rect.center
+        values: Dict[int, Union[int, Tuple[int, int]]] = {
+            SCORE: sim.score,
+            PLAYER: (_clamp16(center[0]), _clamp16(center[1])),
+            BULLETS: min(len(sim.danmakugroup), 65535),
+            ENEMIES: min(len(sim.groupdict['enemy']), 65535)}
+
+        fields = DONE if done else 0
+        body: List[bytes] = []
+        for field, value in values.items():
+            if self._last.get(field) == value:
+                continue
+            self._last[field] = value
+            fields |= field
+            if isinstance(value, tuple):  # PLAYER
+                body.append(_XY.pack(*value))
+            elif field == SCORE:
+                body.append(_I32.pack(value))
+            else:
+                body.append(_U16.pack(value))
+
+        if self.nearest:
+            fields |= NEAREST
+            body.append(self._nearest(center))
+
+        return _STATE.pack(STATE, self.id, sim.totalframe, fields) + b''.join(body)
+
+
+class Server:
+    """여러 게임을 하나의 고정된 tick에 맞추어 함께 진행하는 asyncio 서버이다.
+
+    클라이언트는 Unix 소켓으로 연결하여 게임을 열고 키 상태를 보낸다. 서버는 매 tick 모든 게임을
+    1프레임씩 진행한 뒤, 연결마다 그 연결이 연 모든 게임의 STATE 메시지를 한 번에 쓴다.
+    게임끼리 공유하는 상태가 없으므로 여러 프로세스에서 각자 서버를 실행하여 확장한다.
+
+    Attributes:
+        path: Unix 소켓 경로
+        rate: 초당 tick 수. 0일 경우 쉬지 않고 진행한다.
+        maxsessions: 동시에 진행할 수 있는 최대 게임 수
+        maxbuffer: 클라이언트가 읽지 않아 쌓인 출력이 이 바이트 수를 넘으면 연결을 끊는다.
+        rules: 모든 게임에 적용할 규칙
+        sessions: 게임 id를 key로 하는 진행 중인 Session dict
+        ticks: 진행한 tick 수
+        steps: 모든 게임에서 진행한 프레임 수의 합
+        late: tick이 예정보다 늦어 따라잡지 않고 건너뛴 횟수
+
+    """
+    def __init__(self, path: Union[str, Path] = ct.SOCKETPATH, rate: float = ct.FPS,
+                 maxsessions: int = 4096, maxbuffer: int = 1 << 22, rules: Optional[Rules] = None):
+        if rate < 0 or maxsessions < 1:
+            raise ValueError
+
+        self.path = Path(path)
+        self.rate = rate
+        self.maxsessions = maxsessions
+        self.maxbuffer = maxbuffer
+        self.rules = rules or Rules()
+        self.sessions: Dict[int, Session] = dict()
+        self.ticks = 0
+        self.steps = 0
+        self.late = 0
+
+        self.diffs = set(patterndirs())
+        self._nextid = 1
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def open_session(self, diff: str, seed: Optional[int] = None, nearest: int = 0,
+                     owner: Optional[asyncio.StreamWriter] = None) -> Session:
+        """새 게임을 연다.
+
+        Raises:
+            ValueError: 난이도가 없거나 게임 수가 maxsessions에 도달한 경우
+
+        """
+        if not diff in self.diffs or len(self.sessions) >= self.maxsessions:
+            raise ValueError
+
+        session = Session(self._nextid, Simulation(diff, seed=seed, rules=self.rules),
+                          owner, nearest)
+        self.sessions[session.id] = session
+        self._nextid += 1
+        return session
+
+    def tick(self) -> None:
+        """모든 게임을 1프레임 진행하고, 연결마다 STATE 메시지를 모아 쓴다."""
+        out: Dict[asyncio.StreamWriter, List[bytes]] = dict()
+        finished: List[int] = []
+        for session in self.sessions.values():
+            running = session.step()
+            message = session.encode(done=not running)
+            if session.owner is not None:
+                out.setdefault(session.owner, []).append(message)
+            if not running:
+                finished.append(session.id)
+
+        self.steps += len(self.sessions)
+        self.ticks += 1
+        for id in finished:
+            del self.sessions[id]
+
+        for writer, messages in out.items():
+            if writer.is_closing():
+                continue
+            writer.write(b''.join(messages))
+            if writer.transport.get_write_buffer_size() > self.maxbuffer:  # 읽지 않는 클라이언트
+                self._drop(writer)
+                writer.close()
+
+    def _drop(self, writer: asyncio.StreamWriter) -> None:
+        for id in [id for id, s in self.sessions.items() if s.owner is writer]:
+            del self.sessions[id]
+
+    async def start(self) -> None:
+        """소켓을 열고 연결을 받기 시작한다. 남아 있는 소켓 파일은 지운다."""
+        if self.path.exists() and stat.S_ISSOCK(self.path.stat().st_mode):
+            self.path.unlink()
+        self._server = await asyncio.start_unix_server(self._handle, path=str(self.path))
+
+    async def close(self) -> None:
+        """연결을 받지 않고 소켓 파일을 지운다."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self.path.exists():
+            self.path.unlink()
+
+    async def run(self, ticks: Optional[int] = None) -> None:
+        """tick을 rate에 맞추어 진행한다. ticks가 주어지면 그만큼 진행한 뒤 반환한다."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        end = None if ticks is None else self.ticks + ticks
+        while end is None or self.ticks < end:
+            self.tick()
+            if not self.rate:
+                await asyncio.sleep(0)  # 연결 처리
+                continue
+
+            deadline += 1 / self.rate
+            delay = deadline - loop.time()
+            if delay < 0:  # 늦은 만큼 따라잡지 않음
+                self.late += 1
+                deadline = loop.time()
+            await asyncio.sleep(max(delay, 0))
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        session: Optional[Session]
+        try:
+            while True:
+                op = (await reader.readexactly(1))[0]
+                if op == OPEN:
+                    seed, nearest, length = _OPEN.unpack(await reader.readexactly(_OPEN.size))
+                    diff = (await reader.readexactly(length)).decode('ascii', 'replace')
+                    if not diff in self.diffs:
+                        writer.write(_ERROR.pack(ERROR, 0, BADDIFF))
+                    elif len(self.sessions) >= self.maxsessions:
+                        writer.write(_ERROR.pack(ERROR, 0, FULL))
+                    else:
+                        session = self.open_session(diff, None if seed < 0 else seed, nearest,
+                                                    writer)
+                        writer.write(_OPENED.pack(OPENED, session.id))
+
+                elif op == INPUT:
+                    id, keys = _INPUT.unpack(await reader.readexactly(_INPUT.size))
+                    session = self.sessions.get(id)
+                    if session is None or session.owner is not writer:
+                        writer.write(_ERROR.pack(ERROR, id, UNKNOWN))
+                    else:
+                        session.keys = keys
+
+                elif op == CLOSE:
+                    id, = _CLOSE.unpack(await reader.readexactly(_CLOSE.size))
+                    session = self.sessions.get(id)
+                    if session is None or session.owner is not writer:
+                        writer.write(_ERROR.pack(ERROR, id, UNKNOWN))
+                    else:
+                        del self.sessions[id]
+
+                else:  # 메시지 경계를 알 수 없으므로 연결을 끊음
+                    writer.write(_ERROR.pack(ERROR, 0, BADOP))
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._drop(writer)
+            writer.close()
+
+
+async def serve(path: Union[str, Path] = ct.SOCKETPATH, rate: float = ct.FPS,
+                ticks: Optional[int] = None) -> Server:
+    """path에서 서버를 실행한다. ticks가 None이면 취소될 때까지 실행한다."""
+    server = Server(path, rate)
+    await server.start()
+    try:
+        await server.run(ticks)
+    finally:
+        await server.close()
+    return server
+
+
+def run_shard(path: Union[str, Path], rate: float = ct.FPS) -> None:
+    """서버 프로세스 하나의 진입점이다. 헤드리스로 초기화한 뒤 SIGINT나 SIGTERM을 받을 때까지 서버를 실행한다."""
+    os.environ.setdefault('SDL_NO_SIGNAL_HANDLERS', '1')  # SDL이 SIGINT, SIGTERM을 가로채지 않도록
+    signal.signal(signal.SIGTERM, signal.default_int_handler)  # 소켓 파일을 지우고 종료
+    init_headless()
+    try:
+        asyncio.run(serve(path, rate))
+    except KeyboardInterrupt:
+        pass
+
+
+def shard_paths(path: Union[str, Path], processes: int) -> List[str]:
+    """processes개의 서버 프로세스가 사용할 소켓 경로 list를 반환한다."""
+    if processes == 1:
+        return [str(path)]
+    return [f"{path}.{i}" for i in range(processes)]
+
+
+class Client:
+    """Server에 연결하는 asyncio 클라이언트이다.
+
+    STATE 메시지를 누적하여 게임별 State를 states에 보관한다.
+
+    Attributes:
+        states: 게임 id를 key로 하는 최신 State dict
+        errors: 받은 (게임 id, 오류 코드) list
+
+    """
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.states: Dict[int, State] = dict()
+        self.errors: List[Tuple[int, int]] = []
+
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def connect(cls, path: Union[str, Path] = ct.SOCKETPATH) -> Client:
+        reader, writer = await asyncio.open_unix_connection(str(path))
+        return cls(reader, writer)
+
+    async def open(self, diff: str, seed: Optional[int] = None, nearest: int = 0) -> int:
+        """새 게임을 열고 게임 id를 반환한다.
+
+        Raises:
+            ValueError: 서버가 오류를 반환한 경우
+
+        """
+        name = diff.encode('ascii')
+        self._writer.write(bytes([OPEN]) + _OPEN.pack(-1 if seed is None else seed, nearest,
+                                                      len(name)) + name)
+        while True:
+            op, id = await self.recv()
+            if op == OPENED:
+                self.states[id] = State(id)
+                return id
+            if op == ERROR and id == 0:
+                raise ValueError
+
+    def send(self, session: int, keys: int) -> None:
+        """session의 눌린 키 bitmask를 보낸다. 다음 tick부터 적용된다."""
+        self._writer.write(bytes([INPUT]) + _INPUT.pack(session, keys))
+
+    def close_session(self, session: int) -> None:
+        self._writer.write(bytes([CLOSE]) + _CLOSE.pack(session))
+        self.states.pop(session, None)
+
+    async def recv(self) -> Tuple[int, int]:
+        """메시지 하나를 읽고 (메시지 종류, 게임 id)를 반환한다. STATE는 states에 반영된다."""
+        read = self._reader.readexactly
+        op = (await read(1))[0]
+        if op == OPENED:
+            id, = _CLOSE.unpack(await read(4))
+            return op, id
+        if op == ERROR:
+            id, code = _INPUT.unpack(await read(5))
+            self.errors.append((id, code))
+            return op, id
+        if op != STATE:
+            raise ValueError
+
+        id, tick, fields = struct.unpack('<IIB', await read(9))
+        state = self.states.get(id, State(id))
+        changes: Dict[str, Any] = {'tick': tick, 'done': bool(fields & DONE)}
+        if fields & SCORE:
+            changes['score'], = _I32.unpack(await read(4))
+        if fields & PLAYER:
+            changes['player'] = _XY.unpack(await read(4))
+        if fields & BULLETS:
+            changes['bullets'], = _U16.unpack(await read(2))
+        if fields & ENEMIES:
+            changes['enemies'], = _U16.unpack(await read(2))
+        if fields & NEAREST:
+            k = (await read(1))[0]
+            data = await read(4 * k)
+            changes['nearest'] = tuple(_XY.iter_unpack(data))
+
+        self.states[id] = state._replace(**changes)
+        return op, id
+
+    async def drain(self) -> None:
+        await self._writer.drain()
+
+    async def close(self) -> None:
+        self._writer.close()
+        await self._writer.wait_closed()
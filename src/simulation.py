@@ -0,0 +1,288 @@
+from __future__ import annotations
+from typing import Dict, Any, Iterable, NamedTuple, Optional, Set
+import random
+
+import pygame as pg
+
+from . import constant as ct
+from .element import Element
+from .bulletpool import DanmakuGroup
+from .recycler import PooledGroup
+from .collision import get_collider
+from .parser import Parser, Factory
+from . import pattern
+from .sound import SoundBank
+from .profiler import FrameProfiler
+from .render import interpolate
+
+
+def loadfiles(diff: str) -> Dict[str, Dict[str, Any]]:
+    """패턴 폴더에서 diff 난이도에 해당하는 패턴 파일을 불러온다.
+
+    검사를 마친 패턴을 미리 컴파일한 번들에서 읽으며, 원본 파일이 바뀌었을 때만 번들을 다시 만든다.
+
+    Raises:
+        PatternError: 패턴 파일이 스키마에 맞지 않을 경우
+
+    """
+    return pattern.load(diff)
+
+
+def compilefiles(parser: Parser, loadeddict: Dict[str, Dict[str, Any]]) -> Dict[str, Factory]:
+    """loadfiles 함수에 의해 로드된 패턴을 미리 파싱하여, 적을 생성하는 Callable의 dict를 반환한다.
+
+    Args:
+        parser: Parser 객체
+        loadeddict: loadfiles 함수에 의해 로드된 패턴 딕셔너리
+
+    Returns:
+        패턴 이름을 key로, Parser.compile에 의해 반환된 Callable을 value로 하는 dict
+
+    """
+    return {name: parser.compile(data) for name, data in loadeddict.items()}
+
+
+def enemychoose(enemygroup: pg.sprite.Group, templates: Dict[str, Factory],
+                rng: Optional[random.Random] = None) -> None:
+    """새로운 적을 랜덤으로 생성한다.
+
+    Args:
+        enemygroup: 적이 추가될 스프라이트 그룹
+        templates: compilefiles 함수에 의해 반환된 패턴 dict
+        rng: 난수 생성기. None일 경우 random 모듈을 사용한다.
+
+    """
+    def _add(*args: str) -> None:
+        for st in args:
+            enemy = templates[st]()
+            enemy.tag = st  # 패턴별 통계에 사용
+            enemygroup.add(enemy)
+
+    rn: int = (rng or random).randrange(21)
+
+    if rn == 0:
+        _add('mix')
+    if 1 <= rn <= 3:
+        _add('burst')
+    if 4 <= rn <= 6:
+        _add('plane')
+    if 7 <= rn <= 9:
+        _add('radial')
+    if 10 <= rn <= 11:
+        _add('burst_follow')
+    if 12 <= rn <= 13:
+        _add('plane_follow')
+    if 14 <= rn <= 15:
+        _add('radial_follow')
+    if rn == 16:
+        _add('burst', 'radial')
+    if rn == 17:
+        _add('burst', 'plane')
+    if rn == 18:
+        _add('plane', 'radial')
+    if rn == 19:
+        _add('burst', 'plane', 'radial')  # 적 고르기
+
+
+class Rules(NamedTuple):
+    """점수와 적 생성 주기에 관한 규칙이다. 기본값은 constant 모듈의 값이다.
+
+    Attributes:
+        initialscore: 초기 점수
+        penalty: 적이 자연적으로 죽을 때 깎이는 점수
+        limittime: 초기 적 생성 주기(프레임)
+        limitreduce: 적을 생성할 때마다 줄어드는 생성 주기
+        overlimit: 생성 주기가 이 값 이하가 되면 마지막 적을 생성한다.
+
+    """
+    initialscore: int = ct.INITIALSCORE
+    penalty: int = ct.PENALTY
+    limittime: float = ct.LIMITTIME
+    limitreduce: float = ct.LIMITREDUCE
+    overlimit: float = ct.OVERLIMIT
+
+
+class Simulation:
+    """화면 출력 없이 게임 한 판의 상태와 진행을 구현한다.
+
+    game 함수와 헤드리스 실행이 같은 적 생성 주기, 충돌 판정, 점수 규칙을 공유한다.
+
+    Attributes:
+        diff: 난이도
+        screenrect: 게임 영역
+        groupdict: 스프라이트 그룹을 포함하는 dict
+        spritedict: 스프라이트를 포함하는 dict
+        parser: Parser 객체
+        templates: compilefiles 함수에 의해 반환된 패턴 dict
+        soundbank: 효과음을 재생할 SoundBank or None(소리 없음)
+        seed: 난수 생성기의 시드 or None(무작위)
+        rules: 점수와 적 생성 주기에 관한 규칙
+        rng: 적 선택과 랜덤 위치에 사용하는 난수 생성기
+        profiler: 구간별 시간을 기록할 FrameProfiler
+        capacity: 탄막 총알 BulletPool의 초기 용량. 기본값은 난이도별로 예측한 값(ct.POOLCAPACITIES)이다.
+        score: 현재 점수
+        totalframe: 게임 시작 후 지난 프레임 수
+        done: 게임이 끝났는지 여부
+        damage: 플레이어가 맞은 프레임 수를 총알을 쏜 패턴 이름별로 센 dict
+        escapes: 자연적으로 죽은 적의 수를 패턴 이름별로 센 dict
+        interpolate: True일 경우 매 틱 스프라이트의 위치를 기록하여, 틱 사이를 보간하여 그릴 수 있게 한다.
+
+    """
+    def __init__(self, diff: str,
+                 screenrect: Optional[pg.rect.Rect] = None,
+                 collision: str = ct.COLLISION,
+                 soundbank: Optional[SoundBank] = None,
+                 seed: Optional[int] = None,
+                 profiler: Optional[FrameProfiler] = None,
+                 rules: Optional[Rules] = None,
+                 capacity: Optional[int] = None):
+        self.diff = diff
+        self.rules = rules or Rules()
+        self.profiler = profiler or FrameProfiler(enabled=False)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.screenrect = screenrect or pg.Rect(0, 0, ct.WIDTH, ct.HEIGHT)  # 게임 영역 설정
+        self.soundbank = soundbank
+
+        if capacity is None:  # 게임 중 BulletPool의 크기를 바꾸지 않도록 미리 할당
+            capacity = ct.POOLCAPACITIES.get(diff, ct.POOLCAPACITY)
+        self.capacity = capacity
+        self.danmakugroup = DanmakuGroup(capacity=capacity)  # 탄막 총알은 BulletPool에서 일괄 처리
+
+        self.bulletgroup = PooledGroup()  # 플레이어 총알은 ElementPool에서 재사용
+
+        self.groupdict: Dict[str, pg.sprite.Group] = {'bullet': self.bulletgroup,
+                                                      'player': pg.sprite.Group(),
+                                                      'enemy': pg.sprite.Group(),
+                                                      'danmaku': self.danmakugroup}  # 그룹 불러오기
+
+        self.spritedict: Dict[str, Element] = dict()
+        self.collider = get_collider(collision)
+
+        self.parser = Parser(self.screenrect, self.groupdict, self.spritedict,
+                             self.soundbank, self.rng)  # 패턴 구문분석
+
+        self.spritedict['player'] = self.parser.load('assets/player.json')
+        self.groupdict['player'].add(self.spritedict['player'])  # 플레이어 추가
+
+        self.templates = compilefiles(self.parser, loadfiles(diff))  # 패턴 파일 로드
+
+        self.totalframe: int = 0
+        self.frame: int = 0
+        self.score: int = self.rules.initialscore
+        self.limittime: float = self.rules.limittime
+        self.onon: int = 0
+        self.done: bool = False  # 변수 결정
+        self.interpolate: bool = False
+        self.damage: Dict[str, int] = dict()
+        self.escapes: Dict[str, int] = dict()
+
+    @property
+    def player(self) -> Element:
+        return self.spritedict['player']
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """총알 pool, 생성 스케줄러와 ElementPool의 통계를 반환한다."""
+        return {'bullets': self.danmakugroup.pool.stats(),
+                'emission': self.danmakugroup.scheduler.stats(),
+                'elements': self.bulletgroup.recycler.stats()}
+
+    def step(self, events: Iterable[pg.event.Event] = ()) -> bool:
+        """게임을 1프레임 진행한다.
+
+        Args:
+            events: 이번 프레임에 플레이어에게 전달할 이벤트
+
+        Returns:
+            게임이 계속되면 True, 이번 프레임에 게임이 끝났으면 False
+
+        """
+        if self.done:
+            return False
+
+        if self.interpolate:
+            for group in self.groupdict.values():
+                for sprite in group:
+                    sprite.previous = sprite.rect.topleft
+
+        self.totalframe += 1  # 시간 증가
+        self.frame += 1
+        if self.soundbank is not None:
+            self.soundbank.tick()
+
+        profiler = self.profiler
+        with profiler.phase('spawn'):
+            if self.frame == self.limittime // 1 and self.onon == 0:  # 게임 중 적 생성 시간일 때
+                enemychoose(self.groupdict['enemy'], self.templates, self.rng)  # 적 생성
+                self.frame = 0  # 적 생성 시간 초기화
+                if self.limittime > self.rules.overlimit:
+                    self.limittime -= self.rules.limitreduce  # 적 생성 주기 단축
+                else:
+                    self.onon = 1  # 게임 종료 시간
+
+        if self.onon == 1:  # 게임 끝
+            if self.frame == ct.OVERTIME:
+                self.done = True
+                return False
+
+        with profiler.phase('event'):
+            for event in events:
+                self.groupdict['player'].update(event=event)  # 객체 위치 이동
+
+        with profiler.phase('collision'):
+            if self.collider.collideany(self.groupdict['player'], self.danmakugroup):
+                self.score -= 1  # 부딫혔을 때 충돌 카운트 +1
+                self._tally_damage()
+                if self.soundbank is not None:
+                    self.soundbank.play('gothit')
+
+            # 쏜 총이 적 맞았을 때 적 kill
+            self.collider.groupcollide(self.groupdict['bullet'], self.groupdict['enemy'],
+                                       False, True)
+
+        with profiler.phase('update'):
+            enemies = self.groupdict['enemy'].sprites()
+            for key in self.groupdict:
+                self.groupdict[key].update()  # 모든 객체 위치 업데이트
+            # 적이 자연적으로 죽을 경우 페널티
+            escaped = len(enemies) - len(self.groupdict['enemy'])
+            self.score -= self.rules.penalty * escaped
+            if escaped:
+                for enemy in enemies:
+                    if not enemy.alive():
+                        tag = getattr(enemy, 'tag', None) or 'unknown'
+                        self.escapes[tag] = self.escapes.get(tag, 0) + 1
+
+        return True
+
+    def _tally_damage(self) -> None:
+        """이번 프레임에 플레이어와 겹친 총알을 쏜 패턴을 damage에 센다."""
+        pool = self.danmakugroup.pool
+        tags: Set[str] = set()
+        for sprite in self.groupdict['player']:
+            hit = pool.collide_rect(sprite.rect)
+            tags.update(pool.tags[i] if i >= 0 else 'unknown'
+                        for i in pool.tag[:pool.n][hit].tolist())
+            if pg.sprite.spritecollideany(sprite, self.danmakugroup):
+                tags.add('unknown')
+
+        for tag in tags:
+            self.damage[tag] = self.damage.get(tag, 0) + 1
+
+    def draw(self, surface: pg.surface.Surface, alpha: float = 1.0) -> None:
+        """모든 스프라이트 그룹을 surface에 그린다.
+
+        Args:
+            surface: 그릴 Surface
+            alpha: 1보다 작을 경우 직전 틱과 현재 틱의 위치를 alpha로 보간하여 그린다.
+
+        """
+        for key in self.groupdict:
+            group = self.groupdict[key]
+            if alpha >= 1:
+                group.draw(surface)
+                continue
+
+            surface.blits([(s.image, interpolate(s, alpha)) for s in group], False)
+            if isinstance(group, DanmakuGroup):
+                group.renderer.draw(surface, group.pool, alpha)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pygame as pg
+
+from . import constant as ct
+
+
+def loadsounds() -> Dict[str, pg.mixer.Sound]:
+    """오디오 파일 폴더에서 오디오 파일을 불러온다."""
+    audiodir: Path = Path.cwd() / ct.AUDIODIR
+
+    ret: Dict[str, pg.mixer.Sound] = dict()
+    for path in audiodir.iterdir():
+        ret[path.stem] = pg.mixer.Sound(path.open())  # 소리 불러오기
+
+    return ret
+
+
+class SoundBank:
+    """미리 불러온 소리를 고정된 채널 풀에서 재생한다.
+
+    같은 소리가 window 프레임 안에 여러 번 재생되면 첫 번째만 재생하고 나머지는 합친다.
+    모든 채널이 사용 중이면 가장 먼저 재생을 시작한 채널을 빼앗는다.
+    효과음 채널과 별도로 배경음 전용 채널 하나를 예약한다.
+
+    Attributes:
+        sounds: 소리 이름을 key로 하는 Sound dict
+        window: 같은 소리를 다시 재생하기까지의 최소 프레임 수
+        frame: tick이 호출된 횟수
+        played: 실제로 재생한 횟수
+        coalesced: window 안에서 합쳐져 재생하지 않은 횟수
+
+    """
+    def __init__(self, sounds: Dict[str, pg.mixer.Sound],
+                 channels: int = ct.SOUNDCHANNELS, window: int = ct.SOUNDWINDOW):
+        self.sounds = sounds
+        self.window = window
+        self.frame = 0
+        self.played = 0
+        self.coalesced = 0
+
+        self._last: Dict[str, int] = dict()
+
+        pg.mixer.set_num_channels(max(pg.mixer.get_num_channels(), channels + 1))
+        pg.mixer.set_reserved(channels + 1)  # Sound.play가 예약된 채널을 쓰지 않도록 함
+
+        self._channels: List[pg.mixer.Channel] = [pg.mixer.Channel(i) for i in range(channels)]
+        self._started: List[int] = [0] * channels
+        self._music = pg.mixer.Channel(channels)
+
+    @classmethod
+    def load(cls, channels: int = ct.SOUNDCHANNELS, window: int = ct.SOUNDWINDOW) -> SoundBank:
+        """mixer를 초기화하고 오디오 파일 폴더의 소리를 모두 불러와 SoundBank를 생성한다."""
+        if not pg.mixer.get_init():
+            pg.mixer.init()
+        return cls(loadsounds(), channels, window)
+
+    def tick(self) -> None:
+        """1프레임이 지났음을 알린다."""
+        self.frame += 1
+
+    def _channel(self) -> int:
+        """재생에 사용할 채널의 인덱스를 반환한다."""
+        for i, channel in enumerate(self._channels):
+            if not channel.get_busy():
+                return i
+        return min(range(len(self._channels)), key=self._started.__getitem__)
+
+    def play(self, name: str) -> None:
+        """name에 해당하는 효과음을 재생한다. 불러오지 않은 소리는 무시한다."""
+        sound: Optional[pg.mixer.Sound] = self.sounds.get(name)
+        if sound is None or not self._channels:
+            return
+
+        last = self._last.get(name)
+        if last is not None and self.frame - last < self.window:
+            self.coalesced += 1
+            return
+        self._last[name] = self.frame
+
+        i = self._channel()
+        self._channels[i].play(sound)
+        self._started[i] = self.frame
+        self.played += 1
+
+    def play_music(self, name: str, loops: int = 0) -> None:
+        """name에 해당하는 소리를 배경음 채널에서 재생한다. 불러오지 않은 소리는 무시한다."""
+        sound: Optional[pg.mixer.Sound] = self.sounds.get(name)
+        if sound is not None:
+            self._music.play(sound, loops)
+
+    def stats(self) -> Dict[str, int]:
+        """재생 통계를 dict로 반환한다."""
+        return {'played': self.played, 'coalesced': self.coalesced}
@@ -0,0 +1,141 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import json
+import threading
+import time
+
+import pygame as pg
+
+from . import pattern
+from .sound import SoundBank, loadsounds
+
+SUBSYSTEMS: Dict[str, Any] = {'display': pg.display,
+                              'font': pg.font,
+                              'mixer': pg.mixer}
+
+
+def require(*names: str) -> None:
+    """names의 pygame subsystem 중 초기화되지 않은 것만 초기화한다.
+
+    pg.init은 쓰지 않는 subsystem(joystick 등)까지 모두 초기화하므로,
+    각 실행 경로는 필요한 subsystem만 이 함수로 초기화한다.
+
+    Raises:
+        ValueError: SUBSYSTEMS에 없는 이름일 경우
+
+    """
+    for name in names:
+        if not name in SUBSYSTEMS:
+            raise ValueError
+        module = SUBSYSTEMS[name]
+        if not module.get_init():
+            module.init()
+
+
+class StartupTimer:
+    """프로그램 시작부터 첫 프레임까지의 단계별 시간을 기록한다.
+
+    Attributes:
+        origin: 기준 시각(time.perf_counter). 보통 start.py가 실행된 직후이다.
+        phases: (이름, 시작, 끝)의 list. 시각은 origin으로부터의 초이다.
+
+    """
+    def __init__(self, origin: Optional[float] = None):
+        self.origin = time.perf_counter() if origin is None else origin
+        self.phases: List[Tuple[str, float, float]] = []
+
+    def record(self, name: str, start: float, end: float) -> None:
+        """time.perf_counter 시각 start부터 end까지를 name 단계로 기록한다."""
+        self.phases.append((name, start - self.origin, end - self.origin))  # 다른 스레드에서도 호출됨
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """with 블록을 name 단계로 기록한다."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter())
+
+    def mark(self, name: str) -> None:
+        """지금 시각을 길이가 0인 name 단계로 기록한다."""
+        now = time.perf_counter()
+        self.record(name, now, now)
+
+    def report(self) -> Dict[str, Any]:
+        """단계별 시작, 끝, 길이(ms)를 시작 순서로 담은 dict를 반환한다."""
+        phases = sorted(self.phases, key=lambda p: p[1])
+        return {'created': time.time(),
+                'phases': [{'name': name,
+                            'start': start * 1000,
+                            'end': end * 1000,
+                            'duration': (end - start) * 1000} for name, start, end in phases]}
+
+    def format(self) -> str:
+        """사람이 읽을 수 있는 형태의 문자열을 반환한다."""
+        return '\n'.join(f"{p['start']:9.1f}ms {p['duration']:8.1f}ms  {p['name']}"
+                         for p in self.report()['phases'])
+
+    def dump(self, path: Union[str, Path]) -> None:
+        """path에 report를 JSON 한 줄로 덧붙인다. 실행마다 한 줄씩 쌓여 추이를 볼 수 있다."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open('a') as f:
+            f.write(json.dumps(self.report()) + '\n')
+
+
+class Preloader:
+    """난이도 선택 화면이 떠 있는 동안 다른 스레드에서 패턴과 소리를 미리 불러온다.
+
+    패턴은 pattern.load로 읽어 메모리 캐시를 채우므로, 이후 같은 난이도의 loadfiles는 파일을 다시 읽지 않는다.
+    소리는 mixer를 초기화하고 파일을 읽어 두며, SoundBank는 soundbank를 호출한 스레드에서 만든다.
+
+    Attributes:
+        diffs: 미리 불러올 난이도 list
+        startup: 단계별 시간을 기록할 StartupTimer or None
+
+    """
+    def __init__(self, diffs: Sequence[str], startup: Optional[StartupTimer] = None):
+        self.diffs = list(diffs)
+        self.startup = startup or StartupTimer()
+
+        self._thread = threading.Thread(target=self._run, name='preload', daemon=True)
+        self._sounds: Dict[str, pg.mixer.Sound] = dict()
+        self._error: Optional[BaseException] = None
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            for diff in self.diffs:
+                with self.startup.phase(f'preload.patterns.{diff}'):
+                    pattern.load(diff)
+            with self.startup.phase('preload.mixer'):
+                require('mixer')
+            with self.startup.phase('preload.sounds'):
+                self._sounds = loadsounds()
+        except BaseException as e:  # 기다리는 쪽에서 다시 발생시킴
+            self._error = e
+
+    def wait(self) -> None:
+        """미리 불러오기가 끝날 때까지 기다린다.
+
+        Raises:
+            다른 스레드에서 발생한 예외
+
+        """
+        if self._thread.ident is None:  # start하지 않았으면 이 스레드에서 불러옴
+            self._run()
+        elif self._thread.is_alive():
+            with self.startup.phase('preload.wait'):
+                self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def soundbank(self) -> SoundBank:
+        """미리 불러온 소리로 SoundBank를 만들어 반환한다."""
+        self.wait()
+        return SoundBank(self._sounds)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Final
+
+import pygame as pg
+
+from . import constant as ct
+
+Color = Tuple[int, int, int]
+
+GLYPHS: Final[str] = '0123456789-'  # 글자 단위로 조합하여 그리는 문자
+
+
+class TextRenderer:
+    """글꼴과 렌더링된 텍스트 Surface를 캐시하는 텍스트 렌더러이다.
+
+    글꼴은 크기별로 한 번만 불러오며, 렌더링된 Surface는 (크기, 텍스트, 색상)을 key로 하는 LRU 캐시에 보관한다.
+    GLYPHS로만 이루어진 텍스트(점수 등)는 글자별 Surface를 이어 붙여 그리므로,
+    값이 바뀌어도 텍스트 전체를 다시 렌더링하지 않는다.
+
+    Attributes:
+        maxsize: LRU 캐시에 보관할 Surface의 최대 개수
+        hits: 캐시 적중 횟수
+        misses: 캐시 실패(새로 렌더링한) 횟수
+
+    """
+    def __init__(self, maxsize: int = ct.TEXTCACHESIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+        self._fonts: Dict[int, pg.font.Font] = dict()
+        self._surfaces: OrderedDict[Tuple[int, str, Color], pg.surface.Surface] = OrderedDict()
+        self._glyphs: Dict[Tuple[int, str, Color], pg.surface.Surface] = dict()
+
+    def font(self, size: int) -> pg.font.Font:
+        """size 크기의 기본 글꼴을 반환한다."""
+        if not size in self._fonts:
+            self._fonts[size] = pg.font.SysFont(pg.font.get_default_font(), size)
+        return self._fonts[size]
+
+    def render(self, size: int, text: str, color: Color) -> pg.surface.Surface:
+        """text를 렌더링한 Surface를 반환한다."""
+        key = (size, text, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.font(size).render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def glyphs(self, size: int, text: str, color: Color) -> List[pg.surface.Surface]:
+        """text의 각 글자를 렌더링한 Surface의 list를 반환한다."""
+        ret: List[pg.surface.Surface] = []
+        for ch in text:
+            key = (size, ch, color)
+            glyph = self._glyphs.get(key)
+            if glyph is None:
+                self.misses += 1
+                glyph = self._glyphs[key] = self.font(size).render(ch, True, color)
+            else:
+                self.hits += 1
+            ret.append(glyph)
+        return ret
+
+    def size(self, size: int, text: str, color: Color) -> Tuple[int, int]:
+        """blit으로 그려질 text의 크기를 반환한다."""
+        if text and all(ch in GLYPHS for ch in text):
+            glyphs = self.glyphs(size, text, color)
+            return (sum(g.get_width() for g in glyphs), max(g.get_height() for g in glyphs))
+        return self.render(size, text, color).get_size()
+
+    def blit(self, screen: pg.surface.Surface, size: int, pos: Tuple[int, int],
+             text: str, color: Color) -> pg.rect.Rect:
+        """왼쪽 위 위치 pos에 text를 그리고, 그려진 영역을 반환한다."""
+        if text and all(ch in GLYPHS for ch in text):
+            x, y = pos
+            height = 0
+            for glyph in self.glyphs(size, text, color):
+                screen.blit(glyph, (x, y))
+                x += glyph.get_width()
+                height = max(height, glyph.get_height())
+            return pg.Rect(pos[0], y, x - pos[0], height)
+
+        return screen.blit(self.render(size, text, color), pos)
+
+    @property
+    def hitrate(self) -> float:
+        """캐시 적중률"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        """캐시 통계를 dict로 반환한다."""
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'hitrate': self.hitrate,
+                'fonts': len(self._fonts),
+                'surfaces': len(self._surfaces),
+                'glyphs': len(self._glyphs)}
+
+
+textrenderer = TextRenderer()  # write_text 계열 함수가 공유하는 렌더러
@@ -0,0 +1,61 @@
+from __future__ import annotations
+from typing import Callable, Optional
+import time
+
+from . import constant as ct
+
+
+class FixedTimestep:
+    """렌더링 속도와 관계없이 시뮬레이션을 고정된 간격으로 진행시키는 스케줄러이다.
+
+    렌더링한 프레임마다 advance를 호출하면 지난 실제 시간을 누적하여 그동안 진행해야 할 틱 수를 반환한다.
+    남은 누적 시간의 비율 alpha는 직전 틱과 현재 틱 사이의 위치를 보간하여 그리는 데 사용한다.
+    한 번에 maxsteps 틱보다 많이 밀린 경우 나머지 시간은 버리고 게임이 잠시 느려지게 한다.
+
+    Attributes:
+        rate: 초당 틱 수
+        dt: 한 틱의 시간(초)
+        maxsteps: 렌더링 한 프레임당 최대 틱 수
+        accumulator: 아직 진행하지 않은 시간(초)
+        ticks: 지금까지 진행한 틱 수
+        dropped: 밀려서 버린 틱 수
+
+    """
+    def __init__(self, rate: float = ct.FPS, maxsteps: int = ct.MAXFRAMESKIP,
+                 timer: Callable[[], float] = time.perf_counter):
+        if rate <= 0 or maxsteps < 1:
+            raise ValueError
+
+        self.rate = rate
+        self.dt = 1 / rate
+        self.maxsteps = maxsteps
+        self.accumulator = 0.0
+        self.ticks = 0
+        self.dropped = 0
+
+        self._timer = timer
+        self._last: Optional[float] = None
+
+    def advance(self) -> int:
+        """지난 호출 이후 흐른 시간만큼 진행해야 할 틱 수를 반환한다. 첫 호출은 1틱을 반환한다."""
+        now = self._timer()
+        if self._last is None:
+            self.accumulator += self.dt
+        else:
+            self.accumulator += now - self._last
+        self._last = now
+
+        steps = int(self.accumulator / self.dt)
+        if steps > self.maxsteps:  # 부하가 심할 때는 따라잡지 않음
+            self.dropped += steps - self.maxsteps
+            steps = self.maxsteps
+            self.accumulator = steps * self.dt
+
+        self.accumulator -= steps * self.dt
+        self.ticks += steps
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """직전 틱에서 다음 틱까지 진행된 비율 (0 이상 1 미만)"""
+        return min(self.accumulator / self.dt, 1.0)
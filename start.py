@@ -1,6 +1,15 @@
+import time
+started = time.perf_counter()
+
 from src import init, prompt_difficulty, game, result
+from src.startup import StartupTimer, Preloader
+
+startup = StartupTimer(started)
+startup.record('import', started, time.perf_counter())
 
-displaysurf, clock = init()
-diff, diff_color = prompt_difficulty(displaysurf, clock)
-score = game(displaysurf, clock, diff, diff_color)
+displaysurf, clock = init(startup)
+preloader = Preloader(['easy', 'normal', 'hard', 'insane', 'extra'], startup)
+preloader.start()  # 난이도를 고르는 동안 불러오기
+diff, diff_color = prompt_difficulty(displaysurf, clock, startup)
+score = game(displaysurf, clock, diff, diff_color, preloader=preloader, startup=startup)
 result(displaysurf, clock, diff, diff_color, score)
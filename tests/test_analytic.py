@@ -0,0 +1,54 @@
+"""경계 검사를 생략하는 analytic 모드가 게임 결과를 바꾸지 않는지 확인한다.
+
+시드를 정한 게임을 analytic 모드를 켜고 끈 채로 끝까지 진행하여 점수와 프레임별 탄막 총알 수를 비교한다.
+
+사용법: python -m pytest tests
+"""
+from __future__ import annotations
+from typing import Dict, List, Tuple
+
+import pygame as pg
+import pytest
+
+from src.batch import make_input
+from src.inputs import InputSource, ScriptedInput
+from src.bulletpool import BulletPool
+from src.headless import init_headless
+from src.mover import VelocityMover
+from src.simulation import Simulation
+
+
+def scripted() -> InputSource:
+    """방향키를 차례로 누르고 떼는 ScriptedInput을 반환한다."""
+    schedule: Dict[int, List[pg.event.Event]] = dict()
+    keys = (pg.K_RIGHT, pg.K_UP, pg.K_LEFT, pg.K_DOWN)
+    for i in range(40):
+        key = keys[i % len(keys)]
+        schedule.setdefault(1 + 90 * i, []).append(pg.event.Event(pg.KEYDOWN, key=key))
+        schedule.setdefault(61 + 90 * i, []).append(pg.event.Event(pg.KEYUP, key=key))
+    return ScriptedInput(schedule)
+
+
+def play(diff: str, seed: int, name: str) -> Tuple[int, List[int]]:
+    """게임을 끝까지 진행하여 (점수, 프레임별 탄막 총알 수)를 반환한다."""
+    init_headless()
+    simulation = Simulation(diff, seed=seed)
+    inputsource = scripted() if name == 'scripted' else make_input(name, seed)
+    counts: List[int] = []
+    while simulation.step(inputsource(simulation)):
+        counts.append(simulation.danmakugroup.pool.n)
+    return simulation.score, counts
+
+
+# 닫힌 식으로 위치를 계산하던 때 점수가 달라졌던 경우들
+@pytest.mark.parametrize('diff,seed,name', [('easy', 1, 'random'), ('easy', 2, 'random'),
+                                            ('extra', 1, 'idle'), ('insane', 3, 'dodge'),
+                                            ('insane', 3, 'scripted')])
+def test_scores_match_stepping(diff: str, seed: int, name: str,
+                               monkeypatch: pytest.MonkeyPatch) -> None:
+    results = []
+    for analytic in (True, False):
+        monkeypatch.setattr(VelocityMover, 'analytic', analytic)
+        monkeypatch.setattr(BulletPool, 'analytic', analytic)
+        results.append(play(diff, seed, name))
+    assert results[0] == results[1]
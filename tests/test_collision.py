@@ -0,0 +1,80 @@
+"""충돌 판정 방식들이 pg.sprite.groupcollide, BulletPool.collide_rect와 같은 결과를 내는지 확인한다.
+
+사용법: python -m pytest tests
+"""
+from __future__ import annotations
+from typing import Dict, List, Tuple
+import random
+
+import numpy as np
+import pygame as pg
+import pytest
+
+from src import constant as ct
+from src.bulletpool import DanmakuGroup
+from src.collision import PoolGrid, colliders, hashcollide
+from src.image import BlockImage
+
+
+def rects(rng: random.Random, n: int) -> List[pg.rect.Rect]:
+    """화면 밖에 걸치거나 크기가 0인 것을 포함한 무작위 rect list를 반환한다."""
+    return [pg.Rect(rng.randrange(-30, ct.WIDTH + 30), rng.randrange(-30, ct.HEIGHT + 30),
+                    rng.randrange(0, 70), rng.randrange(0, 70)) for _ in range(n)]
+
+
+def group(boxes: List[pg.rect.Rect]) -> Tuple[pg.sprite.Group, Dict[pg.sprite.Sprite, int]]:
+    """boxes를 rect로 가진 스프라이트 그룹과, 스프라이트를 key로 번호를 value로 하는 dict를 반환한다."""
+    ret = pg.sprite.Group()
+    index: Dict[pg.sprite.Sprite, int] = dict()
+    for i, box in enumerate(boxes):
+        sprite = pg.sprite.Sprite()
+        sprite.rect = box.copy()
+        ret.add(sprite)
+        index[sprite] = i
+    return ret, index
+
+
+def pool(seed: int, n: int) -> DanmakuGroup:
+    """여러 크기의 총알 n개씩을 가진 DanmakuGroup을 반환한다."""
+    nprng = np.random.default_rng(seed)
+    ret = DanmakuGroup()
+    for width, height in ((3, 8), (12, 12), (70, 5), (0, 4)):  # 칸보다 큰 총알, 크기가 0인 총알 포함
+        positions = np.column_stack((nprng.uniform(-40, ct.WIDTH + 40, n),
+                                     nprng.uniform(-40, ct.HEIGHT + 40, n)))
+        ret.pool.spawn(positions, np.zeros((n, 2)), BlockImage(width, height, ct.RED))
+    return ret
+
+
+@pytest.mark.parametrize('dokilla,dokillb', [(False, False), (True, False),
+                                             (False, True), (True, True)])
+def test_hashcollide(dokilla: bool, dokillb: bool) -> None:
+    rng = random.Random(0)
+    boxa, boxb = rects(rng, 80), rects(rng, 300)
+    results = []
+    for collide in (pg.sprite.groupcollide, hashcollide):
+        groupa, indexa = group(boxa)
+        groupb, indexb = group(boxb)
+        crashed = collide(groupa, groupb, dokilla, dokillb)
+        results.append(({indexa[a]: [indexb[b] for b in hits] for a, hits in crashed.items()},
+                        sorted(indexa[s] for s in groupa), sorted(indexb[s] for s in groupb)))
+    assert results[0] == results[1]
+
+
+def test_poolgrid() -> None:
+    danmaku = pool(1, 400)
+    grid = PoolGrid(danmaku.pool)
+    for rect in rects(random.Random(1), 500):
+        expected = np.flatnonzero(danmaku.pool.collide_rect(rect))
+        assert (np.sort(grid.collide_rect(rect)) == expected).all(), rect
+
+
+@pytest.mark.parametrize('size', [1, 40])  # HashCollider가 PoolGrid를 만들지 않는 경우와 만드는 경우
+def test_collideany(size: int) -> None:
+    rng = random.Random(2)
+    danmaku = pool(2, 200)
+    for _ in range(200):
+        players, _ = group([pg.Rect(rng.randrange(ct.WIDTH), rng.randrange(ct.HEIGHT), 4, 4)
+                            for _ in range(size)])
+        expected = any(danmaku.pool.collide_rect(p.rect).any() for p in players)
+        for name, cls in colliders.items():
+            assert cls().collideany(players, danmaku) == expected, name
@@ -0,0 +1,94 @@
+"""src/helpers/kinematics.py의 경계 이탈 프레임 예측을 프레임별로 진행한 결과와 비교한다.
+
+사용법: python -m pytest tests
+"""
+from __future__ import annotations
+from typing import List, Sequence, Tuple
+import random
+
+import numpy as np
+import pytest
+
+from src import constant as ct
+from src.helpers.kinematics import NEVER, exit_frame, exit_frames, position_at, positions_at
+from src.mover import AccelerationMover, VelocityMover
+
+W, H = ct.WIDTH, ct.HEIGHT
+LIMIT = 4000  # 프레임별로 진행할 최대 프레임 수
+
+Case = Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float]]
+
+
+def cases(seed: int, n: int, accelerate: bool) -> List[Case]:
+    """무작위 (위치, 속도, 가속도)와 경계 위에서 시작하는 경우들을 반환한다."""
+    rng = random.Random(seed)
+    ret: List[Case] = []
+    for _ in range(n):
+        pos = (rng.uniform(0, W), rng.uniform(0, H))
+        vel = (rng.uniform(-8, 8), rng.uniform(-8, 8))
+        acc = (rng.uniform(-0.2, 0.2), rng.uniform(-0.2, 0.2)) if accelerate else (0.0, 0.0)
+        ret.append((pos, vel, acc))
+
+    # 경계 위에서 시작, 정수 속도로 경계에 정확히 닿는 경우, 경계를 따라 움직이는 경우
+    for pos in ((0, 0), (W, H), (0, H / 2), (W / 2, H), (W, 0)):
+        for vel in ((0, 0), (1, 0), (-1, 0), (0, 1), (0, -1), (2, 3), (-3, -2)):
+            for acc in (((0, 0), (0.5, 0), (0, -0.5)) if accelerate else ((0, 0),)):
+                ret.append(((float(pos[0]), float(pos[1])), (float(vel[0]), float(vel[1])),
+                            (float(acc[0]), float(acc[1]))))
+    return ret
+
+
+def stepped_exit(pos: Sequence[float], vel: Sequence[float], acc: Sequence[float]) -> int:
+    """position_at을 프레임마다 계산하여 처음으로 경계를 벗어나는 프레임을 반환한다."""
+    for t in range(1, LIMIT + 1):
+        x, y = position_at(pos, vel, acc, t)
+        if not (0 <= x <= W and 0 <= y <= H):
+            return t
+    return NEVER
+
+
+@pytest.mark.parametrize('accelerate', [False, True])
+def test_exit_frame(accelerate: bool) -> None:
+    for pos, vel, acc in cases(1, 300, accelerate):
+        expected = stepped_exit(pos, vel, acc)
+        predicted = exit_frame(pos, vel, acc, W, H)
+        if expected == NEVER:
+            assert predicted > LIMIT, (pos, vel, acc)
+        else:
+            assert predicted == expected, (pos, vel, acc)
+
+
+def test_exit_frames() -> None:
+    pos, vel, _ = (np.array(a, dtype=np.float64) for a in zip(*cases(2, 500, False)))
+    predicted = exit_frames(pos, vel, W, H)
+
+    expected = np.full(len(pos), NEVER, dtype=np.int64)
+    for t in range(LIMIT, 0, -1):  # 뒤에서부터 덮어써 가장 이른 프레임을 남김
+        p = positions_at(pos, vel, np.full(len(pos), t))
+        outside = ~((0 <= p[:, 0]) & (p[:, 0] <= W) & (0 <= p[:, 1]) & (p[:, 1] <= H))
+        expected[outside] = t
+
+    never = expected == NEVER
+    assert (predicted[~never] == expected[~never]).all()
+    assert (predicted[never] > LIMIT).all()
+    for i in range(len(pos)):  # 배열 버전과 하나씩 구한 값이 같아야 함
+        assert predicted[i] == exit_frame(pos[i], vel[i], (0.0, 0.0), W, H)
+
+
+@pytest.mark.parametrize('accelerate', [False, True])
+def test_mover_expired(accelerate: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    """경계 검사를 생략한 Mover가 매 프레임 in_bound를 검사한 것과 같은 프레임에 만료되는지 확인한다."""
+    for pos, vel, acc in cases(3, 300, accelerate):
+        movers: List[VelocityMover] = []
+        for analytic in (True, False):
+            monkeypatch.setattr(VelocityMover, 'analytic', analytic)
+            movers.append(AccelerationMover(pos, vel, acc) if accelerate
+                          else VelocityMover(pos, vel))
+
+        for _ in range(LIMIT):
+            for mover in movers:
+                mover.advance()
+            fast, slow = (mover.expired() for mover in movers)
+            assert fast == slow == (not movers[1].in_bound()), (pos, vel, acc)
+            if slow:
+                break
@@ -0,0 +1,36 @@
+"""OccupancyGrid의 칸별 색인 질의가 BulletPool 전체 검사와 같은 결과를 내는지 확인한다.
+
+사용법: python -m pytest tests
+"""
+from __future__ import annotations
+import random
+
+import numpy as np
+import pygame as pg
+import pytest
+
+from src import constant as ct
+from src.bulletpool import DanmakuGroup
+from src.image import BlockImage
+from src.occupancy import OccupancyGrid
+
+
+@pytest.mark.parametrize('resolution', [1, 8, 32])
+def test_collide_rect(resolution: int) -> None:
+    rng = random.Random(resolution)
+    nprng = np.random.default_rng(resolution)
+    pool = DanmakuGroup().pool
+    for width, height in ((3, 8), (12, 12), (40, 6), (0, 5)):  # 칸보다 큰 총알, 크기가 0인 총알 포함
+        n = 300
+        positions = np.column_stack((nprng.uniform(-60, ct.WIDTH + 60, n),
+                                     nprng.uniform(-60, ct.HEIGHT + 60, n)))
+        pool.spawn(positions, np.zeros((n, 2)), BlockImage(width, height, ct.RED))
+
+    grid = OccupancyGrid(resolution)
+    grid.rebuild(pool)
+    for _ in range(500):
+        rect = pg.Rect(rng.randrange(-40, ct.WIDTH + 40), rng.randrange(-40, ct.HEIGHT + 40),
+                       rng.randrange(0, 50), rng.randrange(0, 50))
+        expected = pool.collide_rect(rect)
+        assert (grid.collide_rect(rect) == expected).all(), rect
+        assert grid.collideany(rect) == bool(expected.any()), rect
@@ -0,0 +1,44 @@
+"""입력 기록이 파일로 저장했다가 불러와도 같은 점수로 재생되는지 확인한다.
+
+사용법: python -m pytest tests
+"""
+from __future__ import annotations
+from pathlib import Path
+
+import pytest
+
+from src.headless import init_headless
+from src.inputs import RandomInput
+from src.replay import InputRecorder, Replay, play
+from src.simulation import Simulation
+
+
+@pytest.mark.parametrize('diff,seed', [('easy', 1), ('hard', 2)])
+def test_round_trip(diff: str, seed: int, tmp_path: Path) -> None:
+    init_headless()
+    simulation = Simulation(diff, seed=seed)
+    recorder = InputRecorder(simulation)
+    inputsource = RandomInput(seed)
+    while True:
+        events = inputsource(simulation)
+        recorder.record(events)
+        if not simulation.step(events):
+            break
+    replay = recorder.replay()
+    assert replay.records
+
+    path = tmp_path / 'game.rep'
+    replay.save(path)
+    loaded = Replay.load(path)
+    assert loaded == replay
+
+    result = play(loaded)
+    assert result.ok
+    assert result.report.score == simulation.score
+
+
+def test_load_rejects_other_files(tmp_path: Path) -> None:
+    path = tmp_path / 'game.rep'
+    path.write_bytes(b'\0' * 64)
+    with pytest.raises(ValueError):
+        Replay.load(path)
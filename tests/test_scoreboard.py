@@ -0,0 +1,63 @@
+"""Scoreboard의 점수 순서와 예전 pickle 점수 파일 가져오기를 확인한다.
+
+사용법: python -m pytest tests
+"""
+from __future__ import annotations
+from pathlib import Path
+import pickle
+
+import pytest
+
+from src.scoreboard import Scoreboard, ScoreStats, read_legacy
+
+
+def test_top_and_rank(tmp_path: Path) -> None:
+    with Scoreboard(tmp_path / 'scores.db') as board:
+        for score in (-30, -10, -20, -10, -40):
+            board.add('easy', score)
+        board.add('hard', 0)
+
+        assert board.top('easy') == [-10, -10, -20, -30, -40]
+        assert board.top('easy', 2) == [-10, -10]
+        assert board.top('normal') == []
+        assert board.rank('easy', -10) == 1
+        assert board.rank('easy', -15) == 3
+        assert board.rank('easy', -50) == 6
+        assert board.rank('hard', -1) == 2
+        assert [entry.score for entry in board.history('easy')] == [-40, -10, -20, -10, -30]
+        assert board.stats('easy') == ScoreStats(games=5, best=-10, worst=-40, mean=-22.0)
+        assert board.stats('normal').games == 0
+
+
+def test_migrate_once(tmp_path: Path) -> None:
+    (tmp_path / 'easy.pkl').write_bytes(pickle.dumps([-5, -7]))
+    (tmp_path / 'hard.pkl').write_bytes(pickle.dumps([-9]))
+    (tmp_path / 'broken.pkl').write_bytes(pickle.dumps({'score': -1}))
+
+    path = tmp_path / 'scores.db'
+    with Scoreboard(path) as board:
+        assert board.top('easy') == [-5, -7]
+        assert board.top('hard') == [-9]
+        assert board.diffs() == ['easy', 'hard']
+        assert board.migrate(tmp_path) == 0
+
+    with Scoreboard(path) as board:  # 다시 열어도 가져오지 않음
+        assert board.top('easy') == [-5, -7]
+        assert board.top('hard') == [-9]
+
+
+@pytest.mark.parametrize('data', [{'easy': [-1]}, (-1, -2), -3, [-1, 'a'], [-1.5]])
+def test_read_legacy_rejects(data: object, tmp_path: Path) -> None:
+    path = tmp_path / 'easy.pkl'
+    path.write_bytes(pickle.dumps(data))
+    with pytest.raises(ValueError):
+        read_legacy(path)
+
+
+def test_read_legacy_rejects_globals(tmp_path: Path) -> None:
+    path = tmp_path / 'easy.pkl'
+    path.write_bytes(pickle.dumps([Path('a')]))
+    with pytest.raises(ValueError):
+        read_legacy(path)
+    path.write_bytes(pickle.dumps([-1, -2]))
+    assert read_legacy(path) == [-1, -2]
@@ -0,0 +1,49 @@
+"""BulletPool이 유도 총알을 TrackingMover와 같은 궤적으로 움직이는지 확인한다.
+
+사용법: python -m pytest tests
+"""
+from __future__ import annotations
+from typing import List
+import math
+import random
+
+import numpy as np
+import pytest
+
+from src import constant as ct
+from src.bulletpool import BulletPool
+from src.image import BlockImage
+from src.mover import TrackingMover, VelocityMover
+
+FRAMES = 2000  # 진행할 최대 프레임 수
+
+
+@pytest.mark.parametrize('analytic', [False, True])
+def test_tracking(analytic: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(BulletPool, 'analytic', analytic)
+    rng = random.Random(0)
+    target = VelocityMover((ct.WIDTH / 2, ct.HEIGHT / 2), (0.5, -0.3))
+
+    positions, velocities = [], []
+    for _ in range(200):
+        speed, angle = rng.uniform(1, 6), rng.uniform(0, 2 * math.pi)
+        positions.append((rng.uniform(0, ct.WIDTH), rng.uniform(0, ct.HEIGHT)))
+        velocities.append((speed * math.cos(angle), speed * math.sin(angle)))
+    movers: List[TrackingMover] = [TrackingMover(pos, vel, target)
+                                   for pos, vel in zip(positions, velocities)]
+    pool = BulletPool()
+    pool.spawn(np.array(positions), np.array(velocities), BlockImage(4, 4, ct.RED), track=target)
+
+    for frame in range(FRAMES):
+        pool.update()
+        for mover in movers:
+            mover.advance()
+        target.advance()
+
+        movers = [mover for mover in movers if not mover.expired()]  # 남은 총알의 순서는 유지됨
+        assert pool.n == len(movers), frame
+        expected = np.array([mover.as_tuple() for mover in movers]).reshape(-1, 2)
+        assert np.allclose(pool.pos[:pool.n], expected, rtol=0, atol=1e-6), frame
+        if not movers:
+            break
+    assert not movers